@@ -4,9 +4,13 @@ from src.constants import ApplicationIcons
 from src.token_utils import TokenValidator
 from src.language import LanguageTranslator
 from src.session_config import SessionConfig
+from src.warmup import ServerWarmup
 
 
 def main():
+    # Primes the process-wide caches (once per server process)
+    ServerWarmup.start_once()
+
     token_str = SessionConfig.get_session_auth_token()
     # token_info = SessionConfig.get_session_auth_token_full_info()
     # if token_info is None:
@@ -0,0 +1,140 @@
+"""
+Import-time and memory report of the pages, based on ``python -X importtime``.
+
+Each page (or module) is imported in a fresh interpreter: for a page file
+only its top-level imports are executed (the page body itself is not run),
+so the report shows what the page pays for before rendering anything.
+For every target the total import time and the peak RSS of the interpreter
+are printed together with the slowest modules and the heavy packages
+(pandas, plotly, ...) it loads. The RSS of a bare interpreter is printed
+first, as the reference.
+
+Run from the ``streamlit_ui`` directory:
+
+    python -m dev.import_report                      # app.py and all pages
+    python -m dev.import_report pages/home.py src.ui_utils_public --top 20
+"""
+
+import os
+import re
+import ast
+import sys
+import glob
+import argparse
+import subprocess
+
+from typing import Tuple
+
+STREAMLIT_UI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_PACKAGES = ["pandas", "numpy", "plotly", "pyarrow", "openpyxl"]
+
+# Printed by the measured interpreter after the imports (Linux: KiB)
+RSS_CODE = (
+    "import resource, sys\n"
+    "sys.stdout.write(str(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))"
+)
+
+IMPORT_TIME_REGEX = re.compile(
+    r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$"
+)
+
+
+def default_targets() -> list:
+    pages = sorted(glob.glob(os.path.join(STREAMLIT_UI_DIR, "pages", "*.py")))
+    return ["app.py"] + [os.path.relpath(_p, STREAMLIT_UI_DIR) for _p in pages]
+
+
+def import_code_for_target(target: str) -> str:
+    """
+    Python code importing the ``target``: a module name is imported
+    directly, for a ``.py`` file its top-level imports are collected.
+    """
+    if not target.endswith(".py"):
+        return f"import {target}"
+
+    with open(os.path.join(STREAMLIT_UI_DIR, target), "rt") as f_in:
+        tree = ast.parse(f_in.read(), filename=target)
+
+    modules = []
+    for node in tree.body:
+        if type(node) in [ast.Import]:
+            modules.extend(_a.name for _a in node.names)
+        elif type(node) in [ast.ImportFrom] and node.level == 0 and node.module:
+            modules.append(node.module)
+    modules = list(dict.fromkeys(modules))
+    return "\n".join(f"import {_m}" for _m in modules) or "pass"
+
+
+def measure_imports(target: str | None) -> Tuple[list, int]:
+    """
+    Records ``(self_us, cumulative_us, depth, module)`` of all modules
+    imported by the ``target`` in a fresh interpreter, and the peak RSS
+    (KiB) of the interpreter. Without ``target`` a bare interpreter
+    is measured.
+    """
+    import_code = "pass" if target is None else import_code_for_target(target)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{import_code}\n{RSS_CODE}"],
+        cwd=STREAMLIT_UI_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Cannot import {target}:\n{result.stderr[-2000:]}")
+
+    records = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_REGEX.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append((int(self_us), int(cumulative_us), len(indent) // 2, module))
+    return records, int(result.stdout.strip() or 0)
+
+
+def print_report(target: str, records: list, rss_kib: int, top: int) -> None:
+    total_ms = sum(_r[0] for _r in records) / 1000
+    print(
+        f"\n{target}: {len(records)} modules, {total_ms:.1f} ms, "
+        f"RSS {rss_kib / 1024:.1f} MiB"
+    )
+
+    top_level = [_r for _r in records if _r[2] == 0]
+    for self_us, cumulative_us, _, module in sorted(
+        top_level, key=lambda _r: _r[1], reverse=True
+    )[:top]:
+        print(f"  {cumulative_us / 1000:9.1f} ms  {module}")
+
+    loaded = {_r[3]: _r[1] for _r in records}
+    heavy = [
+        f"{_p} ({loaded[_p] / 1000:.1f} ms)" for _p in HEAVY_PACKAGES if _p in loaded
+    ]
+    print(f"  heavy packages: {', '.join(heavy) if len(heavy) else '-'}")
+
+
+def prepare_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        help="Page files (pages/home.py) or module names (src.language), "
+        "by default app.py and all pages",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="Number of the slowest imports shown"
+    )
+    return parser
+
+
+def main(argv=None):
+    args = prepare_parser().parse_args(argv)
+    _, bare_rss_kib = measure_imports(None)
+    print(f"bare interpreter: RSS {bare_rss_kib / 1024:.1f} MiB")
+    for target in args.targets or default_targets():
+        records, rss_kib = measure_imports(target)
+        print_report(target=target, records=records, rss_kib=rss_kib, top=args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Micro-benchmark of the news record preparation: the per-news path
+(``prepare_news_record``, used by the news stream) against a columnar
+pandas batch (``prepare_news_records_batch`` below) for the stub payloads.
+
+The batch computes the dates, lengths, icons and admin message thresholds
+of all news at once, only the text shortening stays per news. It gives the
+same records, but building the frame has a fixed cost of about 10 ms:
+it wins only from about 500 news, while the stream renders at most one
+category (150 news, 100 in the admin view). The batch is therefore kept
+here, not in the app.
+
+Run from the ``streamlit_ui`` directory:
+
+    python -m dev.news_batch_benchmark                 # 100, 1k and 10k news
+    python -m dev.news_batch_benchmark --sizes 50 200 --repeat 5
+"""
+
+import time
+import random
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from streamlit.logger import set_log_level
+
+from dev.stub_backend import StubPayloads
+
+# Translations read the session state, which warns outside of streamlit run
+set_log_level("error")
+
+from src.language import LanguageTranslator  # noqa: E402
+from src.data_utils import prepare_news_to_user  # noqa: E402
+from src.news_view_model import NewsRecord  # noqa: E402
+from src.constants import (  # noqa: E402
+    MIN_ARTICLE_LEN,
+    ICON_NOT_SET_NEWS_INFO,
+    ICON_NEWS_POLARITY_3C_A,
+    ICON_NEWS_POLARITY_3C_N,
+    ICON_NEWS_POLARITY_3C_P,
+)
+from src.ui_utils_public_stream import (  # noqa: E402
+    ADMIN_MSG_MAX_SIMILARITY,
+    ADMIN_MSG_SIMILARITY_LEVELS,
+    ADMIN_MSG_SIMILARITY_THRESHOLDS,
+    convert_to_lang_icon,
+    prepare_news_record,
+)
+
+WHEN_GENERATED_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+DISPLAY_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+SENTENCE_ENDINGS = [".", "?", "!", ";"]
+
+
+def prepare_news_records_batch(news_list: list) -> list:
+    """
+    Records of all news of the ``news_list`` (in the same order), the same
+    as ``prepare_news_record`` of every news.
+    """
+    if not len(news_list):
+        return []
+
+    df = pd.DataFrame(
+        {
+            "text": [_n["generated_text"] for _n in news_list],
+            "when_generated": [_n["when_generated"] for _n in news_list],
+            "polarity_3c": [_n["polarity_3c"] for _n in news_list],
+            "language": [_n["language"] for _n in news_list],
+            "main_page_language": [_n["main_page_language"] for _n in news_list],
+            "similarity": pd.to_numeric(
+                pd.Series([_n["similarity_to_original"] for _n in news_list]),
+                errors="coerce",
+            ),
+            "num_generated": [
+                _n["news_sub_page"]["num_of_generated_news"] for _n in news_list
+            ],
+        }
+    )
+
+    when_generated = pd.to_datetime(
+        df["when_generated"], format=WHEN_GENERATED_FORMAT, errors="coerce"
+    )
+    # None (not NaN) where the date is missing, as in prepare_news_record
+    display_dates = np.where(
+        when_generated.notna(),
+        when_generated.dt.strftime(DISPLAY_DATE_FORMAT).astype(object),
+        None,
+    ).tolist()
+
+    user_texts = df["text"].map(prepare_news_to_user)
+    full_text_len = _len_without_new_lines(df["text"])
+    user_text_len = _len_without_new_lines(user_texts)
+    full_texts = df["text"] + np.where(
+        df["text"].str[-1].isin(SENTENCE_ENDINGS), "", "..."
+    )
+    full_texts = np.where(full_text_len > user_text_len, full_texts, None).tolist()
+
+    polarity_icons = (
+        df["polarity_3c"]
+        .map(
+            {
+                "negative": ICON_NEWS_POLARITY_3C_N,
+                "positive": ICON_NEWS_POLARITY_3C_P,
+            }
+        )
+        .fillna(ICON_NEWS_POLARITY_3C_A)
+        .where(df["polarity_3c"].notna(), ICON_NOT_SET_NEWS_INFO)
+        .tolist()
+    )
+
+    admin_messages = _admin_messages(df=df, user_texts=user_texts)
+    # Scalar access to the columns is slow, the loop reads python lists
+    user_texts = user_texts.tolist()
+
+    records = []
+    for idx, news in enumerate(news_list):
+        records.append(
+            NewsRecord(
+                news_id=news["id"],
+                revision=NewsRecord.revision_of(news),
+                when_generated=display_dates[idx],
+                user_news_text=user_texts[idx],
+                full_news_text=full_texts[idx],
+                polarity_icon=polarity_icons[idx],
+                news_language_icon=convert_to_lang_icon(news["language"]),
+                main_page_language_icon=convert_to_lang_icon(
+                    news["main_page_language"]
+                ),
+                news_url=news["news_sub_page"]["news_url"],
+                num_of_generated_news=news["news_sub_page"]["num_of_generated_news"],
+                model_name=news["model_used_to_generate_news"],
+                generation_time=news["generation_time"],
+                sim_to_original_article=news["similarity_to_original"],
+                admin_messages=(
+                    admin_messages[idx] if news["show_admin_message"] else ()
+                ),
+            )
+        )
+    return records
+
+
+def _len_without_new_lines(texts: pd.Series) -> pd.Series:
+    return texts.str.strip().str.replace("\n", "", regex=False).str.len()
+
+
+def _admin_messages(df: pd.DataFrame, user_texts: pd.Series) -> list:
+    """
+    Admin messages of every news as in ``prepare_admin_messages_to_article``,
+    the thresholds are evaluated on whole columns.
+    """
+    similarity = df["similarity"]
+    has_similarity = similarity.notna()
+    min_similarity = df["main_page_language"].map(
+        {_l: _t["min"] for _l, _t in ADMIN_MSG_SIMILARITY_THRESHOLDS.items()}
+    )
+    max_similarity = df["main_page_language"].map(
+        {_l: _t["max"] for _l, _t in ADMIN_MSG_SIMILARITY_THRESHOLDS.items()}
+    )
+    known_language = min_similarity.notna()
+
+    # Similarity message, each condition selects the first matching message
+    conditions = [
+        has_similarity & known_language & (similarity <= min_similarity),
+        has_similarity & known_language & (similarity >= max_similarity),
+    ]
+    choices = [
+        np.where(
+            min_similarity < 0.6,
+            "news_stream_admin_msg_501",
+            "news_stream_admin_msg_635",
+        ),
+        "news_stream_admin_msg_plag",
+    ]
+    types = ["error", "error"]
+    for below_value, msg_type, code_name in ADMIN_MSG_SIMILARITY_LEVELS:
+        conditions.append(
+            has_similarity & ~known_language & (similarity < below_value)
+        )
+        choices.append(code_name)
+        types.append(msg_type)
+    conditions.append(
+        has_similarity & ~known_language & (similarity > ADMIN_MSG_MAX_SIMILARITY)
+    )
+    choices.append("news_stream_admin_msg_plag")
+    types.append("error")
+
+    similarity_codes = np.select(conditions, choices, default="").tolist()
+    similarity_types = np.select(conditions, types, default="").tolist()
+
+    too_short = (user_texts.str.len() < MIN_ARTICLE_LEN).tolist()
+    num_generated = df["num_generated"].tolist()
+    languages = df["language"].tolist()
+    foreign_language = (df["language"].notna() & (df["language"] != "pl")).tolist()
+    not_full_article = (
+        ~user_texts.str.strip().str[-1].isin(SENTENCE_ENDINGS)
+    ).tolist()
+
+    # Texts are translated once per batch (and per distinct value)
+    translated = {}
+    short_msg = (
+        "warning",
+        LanguageTranslator.format(
+            code_name="news_stream_admin_msg_short", min_article_len=MIN_ARTICLE_LEN
+        ),
+    )
+    not_full_msg = (
+        "info",
+        LanguageTranslator.translate(
+            code_name="news_stream_admin_msg_not_full_article"
+        ),
+    )
+
+    messages = []
+    for idx in range(len(df)):
+        news_messages = []
+        if similarity_codes[idx]:
+            code_name = similarity_codes[idx]
+            if code_name not in translated:
+                translated[code_name] = LanguageTranslator.translate(
+                    code_name=code_name
+                )
+            news_messages.append((similarity_types[idx], translated[code_name]))
+        if too_short[idx]:
+            news_messages.append(short_msg)
+        if num_generated[idx] > 1:
+            key = ("num_gen", num_generated[idx])
+            if key not in translated:
+                translated[key] = LanguageTranslator.format(
+                    code_name="news_stream_admin_msg_num_gen",
+                    num_of_generated_news=num_generated[idx],
+                )
+            news_messages.append(
+                ("error" if num_generated[idx] > 2 else "warning", translated[key])
+            )
+        if foreign_language[idx]:
+            language = languages[idx]
+            key = ("lang", language)
+            if key not in translated:
+                translated[key] = LanguageTranslator.format(
+                    code_name="news_stream_admin_msg_lang", language=language
+                )
+            news_messages.append(("error", translated[key]))
+        if not_full_article[idx]:
+            news_messages.append(not_full_msg)
+        messages.append(tuple(news_messages))
+    return messages
+
+
+def sample_news(news_count: int, seed: int = 0) -> list:
+    """
+    Stub news with all admin messages enabled and mixed thresholds
+    (the admin "check correctness" view).
+    """
+    rnd = random.Random(seed)
+    news_list = StubPayloads(
+        news_in_category=news_count, change_every=60
+    ).sample_news("kraj", news_count)
+    for news in news_list:
+        news["show_admin_message"] = True
+        news["main_page_language"] = rnd.choice(["pl", "en", "de"])
+        news["news_sub_page"]["num_of_generated_news"] = rnd.randint(1, 4)
+    return news_list
+
+
+def best_time(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started_at)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3, help="Best of runs")
+    args = parser.parse_args(argv)
+
+    # pandas import and first calls are not measured
+    prepare_news_records_batch(sample_news(10))
+
+    print(f"{'news':>8} {'per news':>12} {'batch':>12} {'speedup':>9} {'same':>5}")
+    for size in args.sizes:
+        news_list = sample_news(size)
+        per_news = best_time(
+            lambda: [prepare_news_record(_n) for _n in news_list], args.repeat
+        )
+        batch = best_time(lambda: prepare_news_records_batch(news_list), args.repeat)
+        same = prepare_news_records_batch(news_list) == [
+            prepare_news_record(_n) for _n in news_list
+        ]
+        print(
+            f"{size:>8} {per_news * 1000:>9.1f} ms {batch * 1000:>9.1f} ms "
+            f"{per_news / batch:>8.2f}x {str(same):>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
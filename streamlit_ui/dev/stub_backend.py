@@ -0,0 +1,431 @@
+"""
+Local stand-in for the playground backend, used to test the API layer
+without the real services.
+
+It serves every endpoint defined in ``ui-configuration.json`` with generated
+sample payloads (``{"status": true, "body": ...}``), emits ``ETag`` and
+``Last-Modified`` validators and answers ``304 Not Modified`` to conditional
+requests. The payloads change every ``--change-every`` seconds, so both
+revalidation paths (304 and a fresh 200) can be observed.
+
+Endpoints whose name ends with ``_stream`` (e.g. ``add_chat_message_stream``)
+answer with chunked ``text/event-stream``: the generated text is sent word by
+word (``delta`` events, every ``--token-delay`` seconds) and the remaining
+fields of the blocking endpoint payload follow as the final ``done`` event.
+
+Run from the ``streamlit_ui`` directory:
+
+    python -m dev.stub_backend --port 8567
+
+and point the module hosts in a copy of ``ui-configuration.json``
+to ``http://127.0.0.1:8567``.
+"""
+
+import sys
+import zlib
+import json
+import time
+import random
+import hashlib
+import argparse
+import datetime
+
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import urlsplit, parse_qsl
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from src.constants import DEFAULT_UI_CONFIG_PATH
+
+CATEGORIES = {
+    "kraj": ["https://kraj-1.example.pl", "https://kraj-2.example.pl"],
+    "swiat": ["https://swiat-1.example.pl", "https://swiat-2.example.pl"],
+    "sport": ["https://sport-1.example.pl"],
+    "technologia": ["https://tech-1.example.pl", "https://tech-2.example.pl"],
+}
+
+POLARITIES = ["positive", "negative", "ambivalent", None]
+STREAM_SUFFIX = "_stream"
+STREAM_TEXT_FIELDS = {
+    "add_chat_message": "generated_assistant_message",
+    "generate_article_from_search": "article_str",
+}
+LANGUAGES = ["pl", "pl", "pl", "en", "de"]
+
+
+class StubPayloads:
+    def __init__(self, news_in_category: int, change_every: float):
+        self.news_in_category = news_in_category
+        self.change_every = change_every
+
+    def revision(self) -> int:
+        if self.change_every <= 0:
+            return 0
+        return int(time.time() // self.change_every)
+
+    def revision_time(self) -> float:
+        if self.change_every <= 0:
+            return 0.0
+        return self.revision() * self.change_every
+
+    def build(self, ep_name: str, request_data: dict):
+        builder = getattr(self, f"_{ep_name}", None)
+        if builder is None:
+            return {}
+        return builder(request_data)
+
+    def _get_categories(self, request_data: dict):
+        return list(CATEGORIES.keys())
+
+    def _get_categories_with_pages(self, request_data: dict):
+        return {
+            c_name: {
+                "category_info": {
+                    "display_name": c_name.capitalize(),
+                    "description": f"News from category {c_name}",
+                },
+                "category_pages": [{"main_url": url} for url in pages],
+            }
+            for c_name, pages in CATEGORIES.items()
+        }
+
+    def _get_last_news(self, request_data: dict):
+        news_count = int(request_data.get("news_in_category", 0) or 0)
+        news_count = news_count or self.news_in_category
+        return {
+            c_name: self.sample_news(c_name, news_count)
+            for c_name in self._filtered_categories(request_data)
+        }
+
+    def _last_news_to_check(self, request_data: dict):
+        news_count = int(request_data.get("number_of_news", 0) or 0)
+        news_count = news_count or self.news_in_category
+        return {
+            c_name: self.sample_news(c_name, news_count)
+            for c_name in self._filtered_categories(request_data)
+        }
+
+    @staticmethod
+    def _filtered_categories(request_data: dict) -> list:
+        # Only the categories given in filter_pages (all when not given)
+        filter_pages = request_data.get("filter_pages")
+        if type(filter_pages) in [str] and len(filter_pages):
+            filter_pages = json.loads(filter_pages)
+        if not filter_pages:
+            return list(CATEGORIES.keys())
+        return [_c for _c in CATEGORIES.keys() if _c in filter_pages]
+
+    def _search_news_in_categories(self, request_data: dict):
+        # Categories with any of the searched sites (all when not given)
+        sites = set(json.loads(request_data.get("sites", "[]") or "[]"))
+        num_of_results = int(request_data.get("num_of_results", 0) or 0) or 5
+        rnd = random.Random(request_data.get("text_to_search", ""))
+        return {
+            "search_result": {
+                c_name: self.sample_news(c_name, num_of_results)
+                for c_name, pages in CATEGORIES.items()
+                if not len(sites) or sites.intersection(pages)
+            },
+            "query_response_id": rnd.randint(1, 10**6),
+        }
+
+    def _news_statistics_public(self, request_data: dict):
+        return self.sample_statistics()
+
+    def _news_statistics(self, request_data: dict):
+        return self.sample_statistics()
+
+    def _conversation_models(self, request_data: dict):
+        return ["stub-model-small", "stub-model-large"]
+
+    def _system_status(self, request_data: dict):
+        status = {
+            "doing": False,
+            "begin_date": "2025-01-01T10:00:00.000000Z",
+            "end_date": "2025-01-01T10:05:00.000000Z",
+        }
+        return {
+            "settings": 1,
+            "status": [{"crawler": status, "generator": status}],
+        }
+
+    def _new_chat(self, request_data: dict):
+        return {"chat": {"id": random.randint(1, 10**6)}}
+
+    def _add_chat_message(self, request_data: dict):
+        user_message = request_data.get("last_user_message", "")
+        rnd = random.Random(user_message)
+        answer = " ".join(
+            f"Odpowiedź {idx} na pytanie o długości {len(user_message)} znaków."
+            for idx in range(rnd.randint(5, 15))
+        )
+        return {
+            "generated_assistant_message": answer,
+            "generation_time": round(rnd.uniform(0.5, 9.0), 2),
+            "last_state": None,
+        }
+
+    def _generate_article_from_search(self, request_data: dict):
+        news_ids = json.loads(request_data.get("news_ids", "[]") or "[]")
+        rnd = random.Random(request_data.get("user_query", ""))
+        paragraphs = [
+            " ".join(
+                f"Akapit {p}, zdanie {w} artykułu z {len(news_ids)} newsów."
+                for w in range(rnd.randint(3, 8))
+            )
+            for p in range(rnd.randint(3, 6))
+        ]
+        return {
+            "article_str": "\n\n".join(paragraphs),
+            "generation_time": round(rnd.uniform(5.0, 40.0), 2),
+            "model_used_to_generate": "stub-model-large",
+            "when_generated": datetime.datetime.now().isoformat(),
+        }
+
+    def stream(self, ep_name: str, request_data: dict):
+        """
+        Frames ``(event, data)`` of the streamed variant of ``ep_name``.
+        """
+        payload = self.build(ep_name, request_data)
+        text = payload.pop(STREAM_TEXT_FIELDS.get(ep_name), "")
+        for idx, word in enumerate(text.split(" ")):
+            yield "delta", {"text": word if not idx else " " + word}
+        yield "done", payload
+
+    def _get_login_url(self, request_data: dict):
+        return {"login_url": "http://127.0.0.1/login"}
+
+    def sample_news(self, c_name: str, news_count: int) -> list:
+        rnd = random.Random(f"{c_name}-{self.revision()}")
+        base_date = datetime.datetime(2025, 1, 1) + datetime.timedelta(
+            seconds=self.revision_time()
+        )
+        news_list = []
+        for idx in range(news_count):
+            paragraphs = [
+                " ".join(f"Zdanie {p}.{w} z kategorii {c_name}" for w in range(6))
+                + "."
+                for p in range(rnd.randint(1, 5))
+            ]
+            when = base_date - datetime.timedelta(minutes=rnd.randint(0, 60 * 48))
+            news_list.append(
+                {
+                    "id": zlib.crc32(f"{c_name}-{idx}".encode("utf-8")),
+                    "generated_text": "\n\n".join(paragraphs),
+                    "model_used_to_generate_news": "stub-model-small",
+                    "polarity_3c": rnd.choice(POLARITIES),
+                    "pli_value": round(rnd.random(), 3),
+                    "show_admin_message": rnd.random() < 0.3,
+                    "generation_time": f"{rnd.uniform(0.5, 9.0):.2f}",
+                    "similarity_to_original": round(rnd.uniform(0.3, 0.95), 3),
+                    "when_generated": when.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+                    "language": rnd.choice(LANGUAGES),
+                    "main_page_language": "pl",
+                    "news_sub_page": {
+                        "news_url": f"{CATEGORIES[c_name][0]}/news/{idx}",
+                        "num_of_generated_news": rnd.randint(1, 3),
+                        "when_crawled": when.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+                    },
+                }
+            )
+        return news_list
+
+    def sample_statistics(self) -> dict:
+        rnd = random.Random(f"stats-{self.revision()}")
+        news_stats, polarity_stats = {}, {}
+        for c_name, pages in CATEGORIES.items():
+            news_stats[c_name] = {}
+            polarity_stats[c_name] = {}
+            for url in pages:
+                visible = rnd.randint(10, 500)
+                hidden = rnd.randint(0, 20)
+                news_stats[c_name][url] = {
+                    "news_per_day": rnd.randint(1, 60),
+                    "number_of_visible_news": visible,
+                    "number_of_hidden_news": hidden,
+                    "news_count": visible + hidden,
+                    "subpages_count": visible + hidden,
+                    "perc_of_hidden_news": hidden / (visible + hidden),
+                    "perc_of_visible_news": visible / (visible + hidden),
+                    "last_crawling_date": "2025-01-02",
+                    "first_crawling_date": "2024-06-01",
+                }
+                polarity_stats[c_name][url] = {
+                    "3c": {
+                        "positive": rnd.randint(1, 100),
+                        "negative": rnd.randint(1, 100),
+                        "ambivalent": rnd.randint(1, 100),
+                    }
+                }
+        return {
+            "stats_datetime": formatdate(self.revision_time(), usegmt=True),
+            "news_stats": news_stats,
+            "polarity_stats": polarity_stats,
+        }
+
+
+def prepare_routes(config_path: str) -> dict:
+    with open(config_path, "rt") as json_in:
+        modules = json.load(json_in)["modules"]
+
+    routes = {}
+    for module in modules.values():
+        for ep_name, ep_path in module["ep"].items():
+            routes["/" + ep_path.strip("/")] = ep_name
+    return routes
+
+
+def prepare_handler(
+    routes: dict, payloads: StubPayloads, latency: float, token_delay: float
+):
+    class StubBackendHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self._handle()
+
+        def do_POST(self):
+            self._handle()
+
+        def log_message(self, msg_format, *args):
+            sys.stderr.write(
+                f"{self.command} {self.path} -> {args[1] if len(args) > 1 else ''}\n"
+            )
+
+        def _request_data(self) -> dict:
+            request_data = {}
+            content_length = int(self.headers.get("Content-Length", 0) or 0)
+            if content_length:
+                # GET requests of the UI may carry a form body
+                raw_body = self.rfile.read(content_length).decode("utf-8")
+                if "json" in self.headers.get("Content-Type", ""):
+                    request_data.update(json.loads(raw_body))
+                else:
+                    request_data.update(self._parse_qs(raw_body))
+            request_data.update(self._parse_qs(urlsplit(self.path).query))
+            return request_data
+
+        @staticmethod
+        def _parse_qs(query: str) -> dict:
+            return dict(parse_qsl(query))
+
+        def _handle(self):
+            request_data = self._request_data()
+            if latency > 0:
+                time.sleep(latency)
+
+            ep_name = routes.get(urlsplit(self.path).path.rstrip("/"))
+            if ep_name is None:
+                self._send(404, b'{"status": false, "body": "unknown endpoint"}')
+                return
+
+            if ep_name.endswith(STREAM_SUFFIX):
+                self._send_stream(ep_name[: -len(STREAM_SUFFIX)], request_data)
+                return
+
+            body = json.dumps(
+                {"status": True, "body": payloads.build(ep_name, request_data)},
+                ensure_ascii=False,
+            ).encode("utf-8")
+            etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+            last_modified = formatdate(payloads.revision_time(), usegmt=True)
+
+            if self.command == "GET" and self._not_modified(etag, last_modified):
+                self._send(304, b"", etag=etag, last_modified=last_modified)
+                return
+            self._send(200, body, etag=etag, last_modified=last_modified)
+
+        def _send_stream(self, ep_name: str, request_data: dict):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for event, data in payloads.stream(ep_name, request_data):
+                frame = "event: {}\ndata: {}\n\n".format(
+                    event, json.dumps(data, ensure_ascii=False)
+                ).encode("utf-8")
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(frame), frame))
+                self.wfile.flush()
+                if token_delay > 0:
+                    time.sleep(token_delay)
+            self.wfile.write(b"0\r\n\r\n")
+
+        def _not_modified(self, etag: str, last_modified: str) -> bool:
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match is not None:
+                return etag in [t.strip() for t in if_none_match.split(",")]
+
+            if_modified_since = self.headers.get("If-Modified-Since")
+            if if_modified_since is not None:
+                try:
+                    return parsedate_to_datetime(
+                        last_modified
+                    ) <= parsedate_to_datetime(if_modified_since)
+                except (TypeError, ValueError):
+                    return False
+            return False
+
+        def _send(self, status, body: bytes, etag=None, last_modified=None):
+            self.send_response(status)
+            if etag is not None:
+                self.send_header("ETag", etag)
+            if last_modified is not None:
+                self.send_header("Last-Modified", last_modified)
+            if status != 304:
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if status != 304:
+                self.wfile.write(body)
+
+    return StubBackendHandler
+
+
+def prepare_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8567)
+    parser.add_argument("--config", default=DEFAULT_UI_CONFIG_PATH)
+    parser.add_argument("--news-in-category", type=int, default=25)
+    parser.add_argument(
+        "--change-every",
+        type=float,
+        default=60.0,
+        help="Seconds after which the payloads (and validators) change",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Delay of each response [s]"
+    )
+    parser.add_argument(
+        "--token-delay",
+        type=float,
+        default=0.05,
+        help="Delay between the events of streamed responses [s]",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = prepare_parser().parse_args(argv)
+    routes = prepare_routes(config_path=args.config)
+    payloads = StubPayloads(
+        news_in_category=args.news_in_category, change_every=args.change_every
+    )
+    server = ThreadingHTTPServer(
+        (args.host, args.port),
+        prepare_handler(
+            routes=routes,
+            payloads=payloads,
+            latency=args.latency,
+            token_delay=args.token_delay,
+        ),
+    )
+    print(f"Stub backend listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,14 @@ from src.constants import (
     DEFAULT_UI_CONFIG_PATH,
     DEFAULT_ADMIN_UI_STATUSES_IN_ROW,
 )
-from src.api_public import (
-    PlaygroundAuthenticationAPI,
-    PlaygroundAdministrationAPI,
-)
+from src.api_public import PlaygroundAuthenticationAPI
+from src.api_public_async import AsyncApiRunner, AsyncPlaygroundAdministrationAPI
 from src.token_utils import TokenValidator
-from src.ui_utils_public import show_admin_window, initialize_page
+from src.ui_utils_public import (
+    show_admin_window,
+    initialize_page,
+    ADMIN_GEN_STATS_BTN_KEY,
+)
 
 AUTH_QUERY_PARAMS = ["state", "session_state", "iss", "code"]
 
@@ -55,9 +57,7 @@ def main():
                 if q_p not in login_query_params:
 
                     st.error(
-                        LanguageTranslator.translate(
-                            code_name="admin_no_q_p"
-                        ).replace("{q_p}", q_p)
+                        LanguageTranslator.format(code_name="admin_no_q_p", q_p=q_p)
                     )
 
                     return
@@ -76,20 +76,45 @@ def main():
             st.error("Token is not valid")
             return
 
-        admin_api = PlaygroundAdministrationAPI(config_path=DEFAULT_UI_CONFIG_PATH)
-        system_status = admin_api.get_system_status(
-            token_str=token_str,
-            token_info=token,
-            auth_api=auth_api,
+        admin_api = AsyncPlaygroundAdministrationAPI(
+            config_path=DEFAULT_UI_CONFIG_PATH
         )
+        api_calls = [
+            admin_api.get_system_status(
+                token_str=token_str,
+                token_info=token,
+                auth_api=auth_api,
+            )
+        ]
+
+        # The rerun was triggered by the "generate statistics" button, and
+        # settings are known from the previous run, so statistics are fetched
+        # together with the system status instead of after it.
+        settings_id = SessionConfig.get_session_admin_settings_id()
+        if st.session_state.get(ADMIN_GEN_STATS_BTN_KEY) and settings_id is not None:
+            api_calls.append(
+                admin_api.get_news_statistics(
+                    token_str=token_str,
+                    token_info=token,
+                    auth_api=auth_api,
+                    settings_id=settings_id,
+                )
+            )
+
+        system_status, *news_statistics = AsyncApiRunner.gather(*api_calls)
+        news_statistics = news_statistics[0] if len(news_statistics) else None
+        if system_status.get("settings") != settings_id:
+            news_statistics = None
+        SessionConfig.set_session_admin_settings_id(system_status.get("settings"))
 
         show_admin_window(
             token_info=token,
             token_str=token_str,
             system_status=system_status,
-            admin_api=admin_api,
+            admin_api=admin_api.sync_api,
             auth_api=auth_api,
             max_statuses_in_row=DEFAULT_ADMIN_UI_STATUSES_IN_ROW,
+            news_statistics=news_statistics,
         )
 
 
@@ -21,9 +21,10 @@ def show_info(elem):
     yesterday_str = "23.09.2025"
 
     tab_general.info(
-        LanguageTranslator.translate(
-            code_name="info_explorer_main_description_pt2"
-        ).replace("{yesterday_str}", yesterday_str)
+        LanguageTranslator.format(
+            code_name="info_explorer_main_description_pt2",
+            yesterday_str=yesterday_str,
+        )
     )
     tab_general.markdown(
         LanguageTranslator.translate(code_name="info_explorer_main_description_pt3")
@@ -54,38 +54,41 @@ def main():
         "show_only_with_message", False
     )
 
-    if token_str is not None and len(token_str) and only_with_messages:
-        admin_api = PlaygroundAdministrationAPI(config_path=DEFAULT_UI_CONFIG_PATH)
-        all_news_in_categories = admin_api.show_news_to_check_correctness(
-            number_of_news=news_options["news_in_category"],
-            filter_pages=news_options["filter_pages"],
-            token_str=token_str,
-            token_info=token_info,
-            auth_api=auth_api,
-        )
-    else:
-        all_news_in_categories = p_ns_api.all_news_from_all_categories(
+    def fetch_news(filter_pages: dict):
+        if token_str is not None and len(token_str) and only_with_messages:
+            admin_api = PlaygroundAdministrationAPI(
+                config_path=DEFAULT_UI_CONFIG_PATH
+            )
+            return admin_api.show_news_to_check_correctness(
+                number_of_news=news_options["news_in_category"],
+                filter_pages=filter_pages,
+                token_str=token_str,
+                token_info=token_info,
+                auth_api=auth_api,
+            )
+        return p_ns_api.all_news_from_all_categories(
             news_in_category=news_options["news_in_category"],
-            filter_pages=news_options["filter_pages"],
+            filter_pages=filter_pages,
             polarity_3c=news_options["polarity_3c"],
             pli_from=news_options["pli_from"],
             pli_to=news_options["pli_to"],
         )
 
-    if len(all_news_in_categories):
-        # Filter pages for SSE
-        prepare_news_stream_public_news_tab(
-            categories=categories_with_pages,
-            news_in_categories=all_news_in_categories,
-            sort_date_by=news_options["sort_news_by"],
-            number_of_news=news_options["news_in_category"],
-            user_token=token_str,
-            token_info=token_info,
-            publ_news_api=p_ns_api,
-            auth_api=auth_api,
-            admin_opts=news_options["admin"],
-            filter_pages=news_options["filter_pages"],
-        )
+    # Only the news of the active category are fetched and rendered
+    prepare_news_stream_public_news_tab(
+        categories=categories_with_pages,
+        news_in_categories=None,
+        sort_date_by=news_options["sort_news_by"],
+        number_of_news=news_options["news_in_category"],
+        user_token=token_str,
+        token_info=token_info,
+        publ_news_api=p_ns_api,
+        auth_api=auth_api,
+        admin_opts=news_options["admin"],
+        filter_pages=news_options["filter_pages"],
+        page_size=news_options["news_per_page"],
+        fetch_news=fetch_news,
+    )
 
 
 if __name__ == "__main__":
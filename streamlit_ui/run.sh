@@ -8,5 +8,8 @@ export STREAMLIT_RUN_SERVER_LOCALHOST=0
 export SHOW_LOGIN_WINDOW=1
 
 
+# Compile translation catalogs and check the backend hosts
+python3 -m src.warmup
+
 # Run application
 ~/.local/bin/streamlit run app.py --server.port 8502
@@ -14,11 +14,15 @@ add_technical_info_for_gen_full_article(new_article_response, answer_container,
     Renders technical metadata (generation time, model, source count, etc.) for
     a generated article.
 
+article_deltas_with_progress(article_stream, progress_bar, progress_text):
+    Passes through the deltas of a streamed article, moving the progress bar.
+
 call_generate_article_api_and_show_response(user_query_str, type_of_new_article,
                                             answer_column, search_in_category,
-                                            publ_creator_api, query_response_id):
+                                            publ_creator_api, query_response_id,
+                                            progress_bar):
     Calls the PublicNewsCreatorAPI to generate an article based on selected news
-    IDs and displays the result together with technical info.
+    IDs, renders the article while it is generated and then the technical info.
 
 show_creator_search_window(news_options, publ_news_api, publ_creator_api,
                            categories_sorted):
@@ -29,12 +33,17 @@ show_creator_search_window(news_options, publ_news_api, publ_creator_api,
 import time
 import streamlit as st
 
-from typing import List
+from typing import List, Iterator
 
 from src.language import LanguageTranslator
 from src.api_public import PublicNewsStreamAPI, PublicNewsCreatorAPI
 from src.ui_utils_public_search import call_search_api_and_show_result
 
+PROGRESS_GEN_BEGIN = 0.3
+PROGRESS_GEN_END = 0.95
+PROGRESS_GEN_HALF_DELTAS = 100
+PROGRESS_UPDATE_EVERY = 5
+
 
 def add_about_creator_to_sidebar():
     """
@@ -85,35 +94,69 @@ def add_technical_info_for_gen_full_article(
     # when
     when_generated = new_article_response.get("when_generated", "?")
     answer_container.write(
-        LanguageTranslator.translate(code_name="act_creator_when_generated").replace(
-            "{when_generated}", str(when_generated)
+        LanguageTranslator.format(
+            code_name="act_creator_when_generated", when_generated=when_generated
         )
     )
     # time
     generation_time = new_article_response.get("generation_time", "?")
     answer_container.write(
-        LanguageTranslator.translate(code_name="act_creator_gen_time").replace(
-            "{generation_time}", str(generation_time)
+        LanguageTranslator.format(
+            code_name="act_creator_gen_time", generation_time=generation_time
         )
     )
     # model
     model_used_to_generate = new_article_response.get("model_used_to_generate", "")
     answer_container.write(
-        LanguageTranslator.translate(code_name="act_creator_gen_model").replace(
-            "{model_used_to_generate}", model_used_to_generate
+        LanguageTranslator.format(
+            code_name="act_creator_gen_model",
+            model_used_to_generate=model_used_to_generate,
         )
     )
 
     # num of news
     answer_container.write(
-        LanguageTranslator.translate(
-            code_name="act_creator_news_to_generate"
-        ).replace(
-            "{number_of_news_used_to_generate}", str(number_of_news_used_to_generate)
+        LanguageTranslator.format(
+            code_name="act_creator_news_to_generate",
+            number_of_news_used_to_generate=number_of_news_used_to_generate,
         )
     )
 
 
+def article_deltas_with_progress(
+    article_stream, progress_bar, progress_text: str
+) -> Iterator[str]:
+    """
+    Pass through the deltas of a streamed article and move the progress bar.
+
+        The final length of the article is unknown, so the bar approaches
+        ``PROGRESS_GEN_END`` asymptotically: after ``PROGRESS_GEN_HALF_DELTAS``
+        deltas it is half way between ``PROGRESS_GEN_BEGIN`` and the end.
+
+        Parameters
+        ----------
+        article_stream : src.api_streaming.ApiStream
+            Stream returned by
+            :meth:`PublicNewsCreatorAPI.generate_article_from_search_result_stream`.
+        progress_bar : streamlit.progress or None
+            Progress bar of the whole creation process.
+        progress_text : str
+            Text shown next to the progress bar.
+
+        Yields
+        ------
+        str
+            Consecutive parts of the article.
+    """
+    for delta_idx, delta in enumerate(article_stream, start=1):
+        if progress_bar is not None and delta_idx % PROGRESS_UPDATE_EVERY == 0:
+            progress = PROGRESS_GEN_BEGIN + (
+                PROGRESS_GEN_END - PROGRESS_GEN_BEGIN
+            ) * (delta_idx / (delta_idx + PROGRESS_GEN_HALF_DELTAS))
+            progress_bar.progress(progress, text=progress_text)
+        yield delta
+
+
 def call_generate_article_api_and_show_response(
     user_query_str: str,
     type_of_new_article: str,
@@ -121,14 +164,16 @@ def call_generate_article_api_and_show_response(
     search_in_category: dict,
     publ_creator_api: PublicNewsCreatorAPI,
     query_response_id: int,
+    progress_bar=None,
 ):
     """
     Call the article‑generation API and display the result.
 
         This helper aggregates all news IDs from the ``search_in_category`` mapping,
-        invokes :meth:`PublicNewsCreatorAPI.generate_article_from_search_result`,
-        writes the generated article text to the UI, and finally calls
-        :func:`add_technical_info_for_gen_full_article` to show generation metadata.
+        invokes :meth:`PublicNewsCreatorAPI.generate_article_from_search_result_stream`,
+        writes the article text to the UI as it is generated, and finally calls
+        :func:`add_technical_info_for_gen_full_article` with the final metadata
+        frame of the stream (``generation_time``, ``model_used_to_generate``).
 
         Parameters
         ----------
@@ -146,6 +191,8 @@ def call_generate_article_api_and_show_response(
             API client responsible for article generation.
         query_response_id : int
             Identifier of the search query, forwarded to the generation endpoint.
+        progress_bar : streamlit.progress, optional
+            Progress bar moved forward while the article is streamed.
 
         Returns
         -------
@@ -156,20 +203,28 @@ def call_generate_article_api_and_show_response(
     for category_news in search_in_category.values():
         all_news_ids.extend(n["id"] for n in category_news)
 
-    new_article_response = publ_creator_api.generate_article_from_search_result(
+    article_stream = publ_creator_api.generate_article_from_search_result_stream(
         news_ids=all_news_ids,
         user_query_str=user_query_str,
         type_of_new_article=type_of_new_article,
         query_response_id=query_response_id,
-        api_call_url=None,
     )
+    answer_container.write_stream(
+        article_deltas_with_progress(
+            article_stream=article_stream,
+            progress_bar=progress_bar,
+            progress_text=LanguageTranslator.translate(
+                code_name="act_creator_in_progress_gen"
+            ),
+        )
+    )
+    if article_stream.error is not None:
+        answer_container.error(article_stream.error)
+        return
 
-    new_article = new_article_response["article_str"]
-    answer_container.write(new_article)
-
-    # Add technical info
+    # Add technical info (final metadata frame of the stream)
     add_technical_info_for_gen_full_article(
-        new_article_response=new_article_response,
+        new_article_response=article_stream.final or {},
         answer_container=answer_container,
         number_of_news_used_to_generate=len(all_news_ids),
     )
@@ -288,7 +343,7 @@ def show_creator_search_window(
         progress_text_gen = LanguageTranslator.translate(
             code_name="act_creator_in_progress_gen"
         )
-        whole_process_bar.progress(0.3, text=progress_text_gen)
+        whole_process_bar.progress(PROGRESS_GEN_BEGIN, text=progress_text_gen)
         call_generate_article_api_and_show_response(
             user_query_str=user_query_str,
             type_of_new_article=type_of_new_article,
@@ -296,6 +351,7 @@ def show_creator_search_window(
             answer_column=answer_column,
             publ_creator_api=publ_creator_api,
             query_response_id=query_response_id,
+            progress_bar=whole_process_bar,
         )
 
         whole_process_bar.progress(
@@ -0,0 +1,204 @@
+import json
+import time
+import threading
+
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    Process-wide TTL cache for decoded JSON responses of slow-changing
+    endpoints. It is shared by all API clients and all user sessions, so the
+    backend is asked once per distinct query and TTL, not once per rerun.
+
+    The cache is bounded both by the number of entries and by the total size
+    (bytes of the raw response body); the least recently used entries are
+    evicted first. Cached objects are shared between sessions and have to be
+    treated as read-only by the callers.
+
+    Entries are tagged with the module and endpoint names from
+    ``ui-configuration.json``, :meth:`invalidate` drops them explicitly.
+
+    Responses with validators (``ETag`` / ``Last-Modified``) are kept after
+    their TTL expires (also with TTL 0). Such stale entries are not served
+    directly, but :meth:`validators` gives the conditional headers for the
+    next request and :meth:`revalidated` returns the already decoded object
+    when the backend answers ``304 Not Modified``.
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    MISSING = object()
+
+    _lock = threading.Lock()
+    _entries = OrderedDict()
+    _bytes = 0
+    _max_entries = DEFAULT_MAX_ENTRIES
+    _max_bytes = DEFAULT_MAX_BYTES
+    _counters = {
+        "hits": 0,
+        "misses": 0,
+        "revalidated": 0,
+        "evictions": 0,
+        "invalidations": 0,
+    }
+
+    @staticmethod
+    def request_key(
+        url: str,
+        params: dict | None = None,
+        data: dict | None = None,
+        headers: dict | None = None,
+    ) -> str:
+        """
+        Canonical key of a request: the same url, params, data and
+        headers always give the same key, whatever the order of keys.
+        """
+        return json.dumps(
+            [url, params or {}, data or {}, headers or {}],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+
+    @classmethod
+    def configure(
+        cls, max_entries: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        with cls._lock:
+            if max_entries is not None:
+                cls._max_entries = max_entries
+            if max_bytes is not None:
+                cls._max_bytes = max_bytes
+            cls._evict_if_needed()
+
+    @classmethod
+    def get(cls, key: str):
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                cls._counters["misses"] += 1
+                return cls.MISSING
+
+            if entry["expires_at"] <= time.monotonic():
+                if not entry["etag"] and not entry["last_modified"]:
+                    cls._remove(key)
+                cls._counters["misses"] += 1
+                return cls.MISSING
+
+            cls._entries.move_to_end(key)
+            cls._counters["hits"] += 1
+            return entry["value"]
+
+    @classmethod
+    def set(
+        cls,
+        key: str,
+        value,
+        ttl: float,
+        size: int,
+        module: str | None = None,
+        endpoint: str | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        ttl = ttl or 0
+        if ttl <= 0 and not etag and not last_modified:
+            return
+        if size > cls._max_bytes:
+            return
+
+        with cls._lock:
+            if key in cls._entries:
+                cls._remove(key)
+            cls._entries[key] = {
+                "value": value,
+                "size": size,
+                "expires_at": time.monotonic() + ttl,
+                "module": module,
+                "endpoint": endpoint,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+            cls._bytes += size
+            cls._evict_if_needed()
+
+    @classmethod
+    def validators(cls, key: str) -> dict:
+        """
+        Conditional request headers for the (possibly stale) entry,
+        an empty dict when the entry has no validators.
+        """
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return {}
+            headers = {}
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+            return headers
+
+    @classmethod
+    def revalidated(cls, key: str, ttl: float | None):
+        """
+        The backend confirmed (``304``) that the entry is still valid:
+        extend its lifetime by ``ttl`` and return the cached object.
+        """
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return cls.MISSING
+            entry["expires_at"] = time.monotonic() + (ttl or 0)
+            cls._entries.move_to_end(key)
+            cls._counters["revalidated"] += 1
+            return entry["value"]
+
+    @classmethod
+    def invalidate(cls, module: str | None = None, endpoint: str | None = None):
+        """
+        Drop the entries of the given ``module`` (and ``endpoint``,
+        if given). Without arguments the whole cache is cleared.
+        Returns the number of removed entries.
+        """
+        with cls._lock:
+            to_remove = [
+                key
+                for key, entry in cls._entries.items()
+                if (module is None or entry["module"] == module)
+                and (endpoint is None or entry["endpoint"] == endpoint)
+            ]
+            for key in to_remove:
+                cls._remove(key)
+            cls._counters["invalidations"] += len(to_remove)
+        return len(to_remove)
+
+    @classmethod
+    def clear(cls) -> int:
+        return cls.invalidate()
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            stats = dict(cls._counters)
+            stats["entries"] = len(cls._entries)
+            stats["bytes"] = cls._bytes
+            stats["max_entries"] = cls._max_entries
+            stats["max_bytes"] = cls._max_bytes
+        return stats
+
+    @classmethod
+    def _remove(cls, key: str) -> None:
+        entry = cls._entries.pop(key)
+        cls._bytes -= entry["size"]
+
+    @classmethod
+    def _evict_if_needed(cls) -> None:
+        while len(cls._entries) and (
+            len(cls._entries) > cls._max_entries or cls._bytes > cls._max_bytes
+        ):
+            key = next(iter(cls._entries))
+            cls._remove(key)
+            cls._counters["evictions"] += 1
@@ -1,11 +1,33 @@
+import os
 import json
+import threading
 
 
 class ApiJsonConfiguration:
+    """
+    Configuration of the backend modules (``ui-configuration.json``).
+
+    :meth:`shared` gives the process-wide instance of a configuration file.
+    It is parsed and validated once and replaced by a new instance only when
+    the modification time of the file changes; the shared instances are never
+    modified, so the API clients of all sessions can use them concurrently.
+    The absolute URL and the call options of every ``(module, endpoint)`` are
+    prepared at load time.
+    """
+
     API_EP_FIELD = "ep"
     API_HOST_FIELD = "host"
+    API_CACHE_TTL_FIELD = "cache_ttl"
+    API_REVALIDATE_FIELD = "revalidate"
+    API_QUERY_STRING_FIELD = "query_string"
+    API_TIMEOUTS_FIELD = "timeouts"
+    API_TIMEOUTS_DEFAULT = "default"
+    API_MAX_CONCURRENT_FIELD = "max_concurrent"
 
     JSON_MODULES_FIELD = "modules"
+    JSON_HTTP_FIELD = "http"
+    JSON_CACHE_FIELD = "cache"
+    JSON_RESILIENCE_FIELD = "resilience"
     API_PUBLIC_CHAT_CONVERSATION = "public_chat_conversation"
     API_PUBLIC_NEWS_STREAM = "public_news_stream"
     API_PUBLIC_NEWS_CREATOR = "public_news_creator"
@@ -13,9 +35,29 @@ class ApiJsonConfiguration:
     API_AUTHORIZATION = "authorization"
     API_ADMINISTRATION = "administration"
 
+    REQUIRED_MODULES = [
+        API_PUBLIC_CHAT_CONVERSATION,
+        API_PUBLIC_NEWS_STREAM,
+        API_PUBLIC_NEWS_CREATOR,
+        API_PUBLIC_NEWS_BROWSER,
+        API_AUTHORIZATION,
+        API_ADMINISTRATION,
+    ]
+    URL_SCHEMES = ["http://", "https://"]
+
+    _shared_lock = threading.Lock()
+    _shared = {}
+    _shared_failed_mtimes = {}
+
     def __init__(self, config_path: str | None = None) -> None:
         self._api_config_dict = {}
+        self._http_config = {}
+        self._cache_config = {}
+        self._resilience_config = {}
+        self._endpoint_urls = {}
+        self._call_options = {}
         self.config_path = config_path
+        self.mtime_ns = None
 
         self._auth_config = None
         self._admin_config = None
@@ -99,11 +141,134 @@ class ApiJsonConfiguration:
             return {}
         return self._admin_config[self.API_EP_FIELD]
 
+    @property
+    def http_pool_config(self) -> dict:
+        return self._http_config
+
+    @property
+    def response_cache_config(self) -> dict:
+        return self._cache_config
+
+    @property
+    def resilience_config(self) -> dict:
+        return self._resilience_config
+
+    @classmethod
+    def shared(cls, config_path: str):
+        """
+        Process-wide configuration of ``config_path``, reloaded when the
+        file changes. An invalid first load raises ``ValueError``, an
+        invalid reload keeps the previous configuration.
+        """
+        abs_path = os.path.abspath(config_path)
+        mtime_ns = os.stat(abs_path).st_mtime_ns
+        config = cls._shared.get(abs_path)
+        if config is not None and mtime_ns in [
+            config.mtime_ns,
+            cls._shared_failed_mtimes.get(abs_path),
+        ]:
+            return config
+
+        with cls._shared_lock:
+            config = cls._shared.get(abs_path)
+            if config is not None and config.mtime_ns == mtime_ns:
+                return config
+            try:
+                new_config = cls(config_path=abs_path)
+            except (OSError, ValueError):
+                if config is None:
+                    raise
+                # Half-saved or broken file, tried again after the next change
+                cls._shared_failed_mtimes[abs_path] = mtime_ns
+                return config
+            cls._shared[abs_path] = new_config
+        return new_config
+
+    def module_host(self, module_name: str) -> str:
+        return self._api_config_dict[module_name][self.API_HOST_FIELD]
+
+    def endpoint_url(
+        self, module_name: str, ep_name: str, host_module: str | None = None
+    ) -> str | None:
+        """
+        Absolute URL of the endpoint, ``None`` when the endpoint is not
+        configured. With ``host_module`` the endpoint path of ``module_name``
+        is joined with the host of ``host_module`` (on every call).
+        """
+        if host_module is None:
+            return self._endpoint_urls.get((module_name, ep_name))
+        ep = self._api_config_dict.get(module_name, {}).get(self.API_EP_FIELD, {})
+        if ep_name not in ep:
+            return None
+        return self.join_url(self.module_host(host_module), ep[ep_name])
+
+    def call_options(
+        self, module_name: str, ep_name: str, host_module: str | None = None
+    ) -> dict:
+        """
+        Options of a single endpoint call, passed to the
+        ``general_call_*`` methods of the API clients. The returned dict
+        is a copy, the caller may change it.
+
+        With ``host_module`` (the endpoint is served by the host of another
+        module, see :meth:`endpoint_url`) the call is booked against the
+        serving module: its circuit breaker, concurrency limit and default
+        timeout. Without it a cross-host call keeps all options of the
+        defining module. The creator endpoints rely on that: they are
+        served by the news stream host, but keep the generation timeouts
+        and the concurrency limit of the creator module.
+        """
+        if host_module == module_name:
+            host_module = None
+        call_options = None
+        if host_module is None:
+            call_options = self._call_options.get((module_name, ep_name))
+        if call_options is None:
+            call_options = self._prepare_call_options(
+                module_name, ep_name, host_module=host_module
+            )
+        return dict(call_options)
+
+    def _prepare_call_options(
+        self, module_name: str, ep_name: str, host_module: str | None = None
+    ) -> dict:
+        host_module = host_module or module_name
+        module_config = self._api_config_dict.get(module_name, {})
+        host_config = self._api_config_dict.get(host_module, {})
+        cache_ttl = module_config.get(self.API_CACHE_TTL_FIELD, {})
+        revalidate = module_config.get(self.API_REVALIDATE_FIELD, [])
+        query_string = module_config.get(self.API_QUERY_STRING_FIELD, [])
+        timeouts = module_config.get(self.API_TIMEOUTS_FIELD, {})
+        timeout = timeouts.get(
+            ep_name,
+            host_config.get(self.API_TIMEOUTS_FIELD, {}).get(
+                self.API_TIMEOUTS_DEFAULT
+            ),
+        )
+        if type(timeout) in [list]:
+            # [connect, read]
+            timeout = tuple(timeout)
+        return {
+            "module": host_module,
+            "endpoint": ep_name,
+            "cache_ttl": cache_ttl.get(ep_name),
+            "revalidate": ep_name in revalidate,
+            "query_string": ep_name in query_string,
+            "timeout": timeout,
+            "max_concurrent": host_config.get(self.API_MAX_CONCURRENT_FIELD),
+        }
+
     def load(self, config_path: str | None = None) -> None:
         if config_path is not None:
             self.config_path = config_path
+        self.mtime_ns = os.stat(self.config_path).st_mtime_ns
         with open(self.config_path, "rt") as json_in:
-            self._api_config_dict = json.load(json_in)[self.JSON_MODULES_FIELD]
+            config_dict = json.load(json_in)
+        self.validate(config_dict)
+        self._api_config_dict = config_dict[self.JSON_MODULES_FIELD]
+        self._http_config = config_dict.get(self.JSON_HTTP_FIELD, {})
+        self._cache_config = config_dict.get(self.JSON_CACHE_FIELD, {})
+        self._resilience_config = config_dict.get(self.JSON_RESILIENCE_FIELD, {})
         self._process_config_file()
 
     def _process_config_file(self) -> None:
@@ -116,6 +281,117 @@ class ApiJsonConfiguration:
         self._auth_config = self._api_config_dict[self.API_AUTHORIZATION]
         self._admin_config = self._api_config_dict[self.API_ADMINISTRATION]
 
+        self._endpoint_urls = {}
+        self._call_options = {}
+        for module_name, module_config in self._api_config_dict.items():
+            for ep_name, ep in module_config[self.API_EP_FIELD].items():
+                self._endpoint_urls[(module_name, ep_name)] = self.join_url(
+                    module_config[self.API_HOST_FIELD], ep
+                )
+                self._call_options[(module_name, ep_name)] = (
+                    self._prepare_call_options(module_name, ep_name)
+                )
+
+    @classmethod
+    def validate(cls, config_dict: dict) -> None:
+        """
+        Check the structure of the configuration, all problems are
+        reported at once in a ``ValueError``.
+        """
+        errors = []
+        modules = (
+            config_dict.get(cls.JSON_MODULES_FIELD)
+            if type(config_dict) in [dict]
+            else None
+        )
+        if type(modules) not in [dict]:
+            raise ValueError(
+                f"Configuration has no '{cls.JSON_MODULES_FIELD}' section"
+            )
+
+        for module_name in cls.REQUIRED_MODULES:
+            if module_name not in modules:
+                errors.append(f"missing module '{module_name}'")
+        for module_name, module_config in modules.items():
+            errors.extend(
+                f"{module_name}: {_e}" for _e in cls._module_errors(module_config)
+            )
+        for section in [
+            cls.JSON_HTTP_FIELD,
+            cls.JSON_CACHE_FIELD,
+            cls.JSON_RESILIENCE_FIELD,
+        ]:
+            if type(config_dict.get(section, {})) not in [dict]:
+                errors.append(f"'{section}' has to be an object")
+
+        if len(errors):
+            raise ValueError("Invalid API configuration: " + "; ".join(errors))
+
+    @classmethod
+    def _module_errors(cls, module_config) -> list:
+        if type(module_config) not in [dict]:
+            return ["has to be an object"]
+
+        errors = []
+        host = module_config.get(cls.API_HOST_FIELD)
+        if type(host) not in [str] or not any(
+            host.startswith(_s) for _s in cls.URL_SCHEMES
+        ):
+            errors.append(f"'{cls.API_HOST_FIELD}' has to be an http(s) URL")
+
+        endpoints = module_config.get(cls.API_EP_FIELD)
+        if type(endpoints) not in [dict] or not all(
+            type(_ep) in [str] for _ep in endpoints.values()
+        ):
+            errors.append(f"'{cls.API_EP_FIELD}' has to map names to paths")
+            endpoints = {}
+
+        cache_ttl = module_config.get(cls.API_CACHE_TTL_FIELD, {})
+        if type(cache_ttl) not in [dict] or not all(
+            type(_t) in [int, float] and _t >= 0 for _t in cache_ttl.values()
+        ):
+            errors.append(f"'{cls.API_CACHE_TTL_FIELD}' has to map names to seconds")
+            cache_ttl = {}
+
+        for field in [cls.API_REVALIDATE_FIELD, cls.API_QUERY_STRING_FIELD]:
+            if type(module_config.get(field, [])) not in [list]:
+                errors.append(f"'{field}' has to be a list of endpoint names")
+
+        timeouts = module_config.get(cls.API_TIMEOUTS_FIELD, {})
+        if type(timeouts) not in [dict] or not all(
+            type(_t) in [list]
+            and len(_t) == 2
+            and all(type(_v) in [int, float] and _v > 0 for _v in _t)
+            for _t in timeouts.values()
+        ):
+            errors.append(
+                f"'{cls.API_TIMEOUTS_FIELD}' has to map names to [connect, read]"
+            )
+            timeouts = {}
+
+        max_concurrent = module_config.get(cls.API_MAX_CONCURRENT_FIELD)
+        if max_concurrent is not None and (
+            type(max_concurrent) not in [int] or max_concurrent < 1
+        ):
+            errors.append(f"'{cls.API_MAX_CONCURRENT_FIELD}' has to be positive")
+
+        referenced = list(cache_ttl.keys()) + [
+            _n for _n in timeouts.keys() if _n != cls.API_TIMEOUTS_DEFAULT
+        ]
+        for field in [cls.API_REVALIDATE_FIELD, cls.API_QUERY_STRING_FIELD]:
+            if type(module_config.get(field, [])) in [list]:
+                referenced.extend(module_config.get(field, []))
+        unknown = sorted({_n for _n in referenced if _n not in endpoints})
+        if len(endpoints) and len(unknown):
+            errors.append(f"unknown endpoints {', '.join(unknown)}")
+        return errors
+
+    @classmethod
+    def join_url(cls, host: str, ep: str) -> str:
+        return "{}/{}".format(
+            cls._prepare_proper_host(host), cls._prepare_proper_ep(ep)
+        )
+
     @staticmethod
     def _prepare_proper_host(host: str) -> str:
         return host.strip("/")
@@ -0,0 +1,188 @@
+import threading
+import http.cookiejar
+
+import requests
+
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """
+    ``HTTPAdapter`` which counts the connects (TCP and, for https, TLS
+    handshakes) made by its urllib3 pools. Every request above that number
+    was served over an already opened keep-alive connection.
+    """
+
+    def __init__(self, **kwargs):
+        self.connects = 0
+        self._connects_lock = threading.Lock()
+        super(_CountingHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(_CountingHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        adapter = self
+        pool_classes = {}
+        for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items():
+
+            class _CountingConnection(pool_cls.ConnectionCls):
+                def connect(self):
+                    adapter.count_connect()
+                    return super().connect()
+
+            pool_classes[scheme] = type(
+                pool_cls.__name__,
+                (pool_cls,),
+                {"ConnectionCls": _CountingConnection},
+            )
+        self.poolmanager.pool_classes_by_scheme = pool_classes
+
+    def count_connect(self) -> None:
+        with self._connects_lock:
+            self.connects += 1
+
+
+class HttpSessionPool:
+    """
+    Process-wide registry of keep-alive ``requests.Session`` objects.
+
+    One session (with its own urllib3 connection pool) is created per backend
+    host (``scheme://netloc``) and shared by every API object and every
+    Streamlit user session living in the process. Thanks to that the TCP/TLS
+    handshake is paid once per pooled connection instead of once per call.
+
+    Sessions never persist cookies: the same session serves many users, so
+    a cookie set in a response for one user must not leak into requests
+    made on behalf of another one.
+    """
+
+    DEFAULT_POOL_CONNECTIONS = 4
+    DEFAULT_POOL_MAXSIZE = 32
+    DEFAULT_POOL_BLOCK = False
+
+    _lock = threading.Lock()
+    _sessions = {}
+    _requests_count = {}
+    _pool_connections = DEFAULT_POOL_CONNECTIONS
+    _pool_maxsize = DEFAULT_POOL_MAXSIZE
+    _pool_block = DEFAULT_POOL_BLOCK
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    @classmethod
+    def configure(
+        cls,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+    ) -> None:
+        """
+        Set the pool parameters. Already opened sessions are rebuilt
+        only when the parameters really change.
+        """
+        pool_connections = (
+            cls._pool_connections if pool_connections is None else pool_connections
+        )
+        pool_maxsize = cls._pool_maxsize if pool_maxsize is None else pool_maxsize
+        pool_block = cls._pool_block if pool_block is None else pool_block
+        if (pool_connections, pool_maxsize, pool_block) == (
+            cls._pool_connections,
+            cls._pool_maxsize,
+            cls._pool_block,
+        ):
+            return
+
+        with cls._lock:
+            cls._pool_connections = pool_connections
+            cls._pool_maxsize = pool_maxsize
+            cls._pool_block = pool_block
+            old_sessions = list(cls._sessions.values())
+            cls._sessions = {}
+        for session in old_sessions:
+            session.close()
+
+    @classmethod
+    def session_for(cls, url: str) -> requests.Session:
+        host = cls.host_key(url)
+        session = cls._sessions.get(host)
+        if session is not None:
+            return session
+
+        with cls._lock:
+            session = cls._sessions.get(host)
+            if session is None:
+                session = cls._new_session()
+                cls._sessions[host] = session
+        return session
+
+    @classmethod
+    def request(cls, method: str, url: str, **kwargs) -> requests.Response:
+        host = cls.host_key(url)
+        session = cls.session_for(url)
+        with cls._lock:
+            cls._requests_count[host] = cls._requests_count.get(host, 0) + 1
+        return session.request(method, url, **kwargs)
+
+    @classmethod
+    def get(cls, url: str, **kwargs) -> requests.Response:
+        return cls.request("GET", url, **kwargs)
+
+    @classmethod
+    def post(cls, url: str, **kwargs) -> requests.Response:
+        return cls.request("POST", url, **kwargs)
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+        Pool usage counters per host:
+          {
+            "http://host:port": {
+                "requests": int,
+                "new_connections": int,
+                "reused_connections": int,
+            },
+            ...
+          }
+        """
+        with cls._lock:
+            sessions = dict(cls._sessions)
+            requests_count = dict(cls._requests_count)
+
+        stats = {}
+        for host, session in sessions.items():
+            adapters = {id(a): a for a in session.adapters.values()}.values()
+            new_connections = sum(getattr(a, "connects", 0) for a in adapters)
+            host_requests = requests_count.get(host, 0)
+            stats[host] = {
+                "requests": host_requests,
+                "new_connections": new_connections,
+                "reused_connections": max(host_requests - new_connections, 0),
+            }
+        return stats
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._lock:
+            old_sessions = list(cls._sessions.values())
+            cls._sessions = {}
+            cls._requests_count = {}
+        for session in old_sessions:
+            session.close()
+
+    @classmethod
+    def _new_session(cls) -> requests.Session:
+        session = requests.Session()
+        session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+        adapter = _CountingHTTPAdapter(
+            pool_connections=cls._pool_connections,
+            pool_maxsize=cls._pool_maxsize,
+            pool_block=cls._pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
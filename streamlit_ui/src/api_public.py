@@ -1,19 +1,35 @@
 import abc
 import json
 import datetime
-import requests
 
 from typing import List, Dict
+from urllib.parse import urlencode
 
 from src.session_config import SessionConfig
+from src.token_utils import TokenManager
 from src.api_config import ApiJsonConfiguration
+from src.api_cache import ResponseCache
+from src.api_connection import HttpSessionPool
+from src.api_resilience import ApiResilience
+from src.api_streaming import ApiStream
+from src.api_singleflight import SingleFlight
 
 
 class BasePublicApiInterface(abc.ABC):
+    API_MODULE = None
     API_CALL_JSON_LIST_CHAT_MODELS = None
 
-    def __init__(self):
+    # Configuration applied to the process-wide HTTP layer
+    _applied_config = None
+
+    def __init__(self, config_path: str | None = None):
         self._last_response = None
+        self.api_config = ApiJsonConfiguration.shared(config_path=config_path)
+        if BasePublicApiInterface._applied_config is not self.api_config:
+            HttpSessionPool.configure(**self.api_config.http_pool_config)
+            ResponseCache.configure(**self.api_config.response_cache_config)
+            ApiResilience.configure(**self.api_config.resilience_config)
+            BasePublicApiInterface._applied_config = self.api_config
 
     @staticmethod
     def auth_header(token_str: str):
@@ -23,57 +39,225 @@ class BasePublicApiInterface(abc.ABC):
     def last_response(self):
         return self._last_response
 
+    @staticmethod
+    def stable_json(value) -> str:
+        """
+        JSON encoding which is the same for equal values
+        (sorted keys, no optional whitespaces).
+        """
+        return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+    @staticmethod
+    def canonical_query_url(url: str, params: dict | None, data: dict | None) -> str:
+        """
+        Move ``params`` and ``data`` of a GET request into the query string:
+        keys are sorted, ``None`` values are skipped (as ``requests`` does for
+        form bodies) and nested values are encoded with :meth:`stable_json`.
+        Equal requests give byte-identical urls, which HTTP caches can key on.
+        """
+        query = {}
+        for values in [params, data]:
+            for key, value in (values or {}).items():
+                if value is None:
+                    continue
+                if type(value) in [dict, list, tuple]:
+                    value = BasePublicApiInterface.stable_json(value)
+                query[key] = value
+        if not len(query):
+            return url
+        return "{}{}{}".format(
+            url, "&" if "?" in url else "?", urlencode(sorted(query.items()))
+        )
+
+    def _endpoint_url(
+        self,
+        ep_name: str,
+        api_call_url: str | None = None,
+        host_module: str | None = None,
+    ) -> str:
+        """
+        Absolute URL of the ``ep_name`` endpoint of the client module
+        (``api_call_url`` overrides the configured endpoint path).
+        """
+        host_module = host_module or self.API_MODULE
+        if api_call_url is not None:
+            return self.api_config.join_url(
+                self.api_config.module_host(host_module), api_call_url
+            )
+        url = self.api_config.endpoint_url(
+            self.API_MODULE,
+            ep_name,
+            host_module=None if host_module == self.API_MODULE else host_module,
+        )
+        if url is None:
+            raise KeyError(f"Endpoint {ep_name} of {self.API_MODULE} not configured")
+        return url
+
+    def _call_options(self, ep_name: str, host_module: str | None = None) -> dict:
+        return self.api_config.call_options(
+            module_name=self.API_MODULE, ep_name=ep_name, host_module=host_module
+        )
+
     @staticmethod
     def general_call_get(
-        host_url: str,
-        endpoint: str,
+        url: str,
         params: dict | None = None,
         data: dict | None = None,
         headers: dict | None = None,
         token_info: dict | None = None,
         auth_api=None,
+        call_options: dict | None = None,
     ):
-        user_api_call_url = "{}/{}".format(host_url.strip("/"), endpoint.strip("/"))
-        response = requests.get(
-            user_api_call_url, params=params, data=data, headers=headers
+        call_options = call_options or {}
+        if headers is not None and auth_api is not None:
+            headers, token_info = BasePublicApiInterface._authorize(
+                headers=headers, token_info=token_info, auth_api=auth_api
+            )
+
+        request_url, request_params, request_data = url, params, data
+        if call_options.get("query_string"):
+            request_url = BasePublicApiInterface.canonical_query_url(
+                url, params=params, data=data
+            )
+            request_params, request_data = None, None
+
+        request_key = ResponseCache.request_key(
+            request_url,
+            params=request_params,
+            data=request_data,
+            headers=headers,
         )
+        if call_options.get("cache_ttl"):
+            cached_response = ResponseCache.get(request_key)
+            if cached_response is not ResponseCache.MISSING:
+                return cached_response
+
+        request_headers = headers
+        if call_options.get("revalidate"):
+            validators = ResponseCache.validators(request_key)
+            if len(validators):
+                request_headers = dict(headers or {}, **validators)
+
+        # Identical GETs in flight (from any session) share one upstream call
+        response, response_json = SingleFlight.do(
+            key=request_key,
+            func=lambda: BasePublicApiInterface._get_and_decode(
+                url=request_url,
+                params=request_params,
+                data=request_data,
+                headers=request_headers,
+                call_options=call_options,
+            ),
+        )
+
+        if response.status_code == 304:
+            # Not modified, reuse the already decoded object
+            cached_response = ResponseCache.revalidated(
+                request_key, ttl=call_options.get("cache_ttl")
+            )
+            if cached_response is not ResponseCache.MISSING:
+                return cached_response
+            response, response_json = BasePublicApiInterface._get_and_decode(
+                url=request_url,
+                params=request_params,
+                data=request_data,
+                headers=headers,
+                call_options=call_options,
+            )
 
         if (
             response.status_code == 401
             and headers is not None
             and auth_api is not None
         ):
-            if token_info is None or "refresh_token" not in token_info:
-                return response
-            new_token_info = auth_api.refresh_token(
-                refresh_token=token_info["refresh_token"]
+            # Expiring tokens are refreshed ahead, 401 means a revoked token
+            # (or clocks out of sync), the token is refreshed and used once
+            new_headers, new_token_info = BasePublicApiInterface._authorize(
+                headers=headers, token_info=token_info, auth_api=auth_api, force=True
             )
-            if new_token_info is None:
+            if new_token_info is token_info:
                 return response
-            new_token_str = new_token_info["token"]
-            SessionConfig.set_session_auth_token(auth_token=new_token_str)
-            SessionConfig.set_session_auth_token_full_response(
-                full_info=new_token_info
-            )
-            new_headers = BasePublicApiInterface.auth_header(new_token_str)
             return BasePublicApiInterface.general_call_get(
-                host_url=host_url,
-                endpoint=endpoint,
+                url=url,
                 params=params,
                 data=data,
                 headers=new_headers,
                 token_info=new_token_info,
                 auth_api=None,
+                call_options=call_options,
             )
 
         if response.status_code != 200:
             return response
-        return response.json()
+
+        store_in_cache = call_options.get("cache_ttl") or call_options.get(
+            "revalidate"
+        )
+        if store_in_cache and BasePublicApiInterface._is_cacheable(response_json):
+            ResponseCache.set(
+                request_key,
+                response_json,
+                ttl=call_options.get("cache_ttl"),
+                size=len(response.content),
+                module=call_options.get("module"),
+                endpoint=call_options.get("endpoint"),
+                etag=(
+                    response.headers.get("ETag")
+                    if call_options.get("revalidate")
+                    else None
+                ),
+                last_modified=(
+                    response.headers.get("Last-Modified")
+                    if call_options.get("revalidate")
+                    else None
+                ),
+            )
+        return response_json
+
+    @staticmethod
+    def _authorize(headers: dict, token_info: dict | None, auth_api, force=False):
+        """
+        Headers and token info with a token which does not expire soon
+        (see :class:`TokenManager`). A refreshed token is stored
+        in the session.
+        """
+        new_token_info = TokenManager.fresh_token_info(
+            token_info=token_info, auth_api=auth_api, force=force
+        )
+        if new_token_info is token_info:
+            return headers, token_info
+
+        new_token_str = new_token_info["token"]
+        SessionConfig.set_session_auth_token(auth_token=new_token_str)
+        SessionConfig.set_session_auth_token_full_response(full_info=new_token_info)
+        new_headers = dict(
+            headers, **BasePublicApiInterface.auth_header(new_token_str)
+        )
+        return new_headers, new_token_info
+
+    @staticmethod
+    def _get_and_decode(url: str, params, data, headers, call_options: dict):
+        response = ApiResilience.request(
+            "GET",
+            url,
+            call_options=call_options,
+            params=params,
+            data=data,
+            headers=headers,
+        )
+        if response.status_code != 200:
+            return response, None
+        return response, response.json()
+
+    @staticmethod
+    def _is_cacheable(response_json) -> bool:
+        if type(response_json) in [dict] and "status" in response_json:
+            return bool(response_json["status"])
+        return True
 
     @staticmethod
     def general_call_post(
-        host_url: str,
-        endpoint: str,
+        url: str,
         params: dict | None = None,
         data: dict | None = None,
         files=None,
@@ -81,14 +265,17 @@ class BasePublicApiInterface(abc.ABC):
         headers: dict | None = None,
         token_info: dict | None = None,
         auth_api=None,
+        call_options: dict | None = None,
     ):
-        if not len(host_url):
-            user_api_call_url = endpoint
-        else:
-            user_api_call_url = "{}/{}".format(host_url, endpoint)
+        if headers is not None and auth_api is not None:
+            headers, token_info = BasePublicApiInterface._authorize(
+                headers=headers, token_info=token_info, auth_api=auth_api
+            )
 
-        response = requests.post(
-            user_api_call_url,
+        response = ApiResilience.request(
+            "POST",
+            url,
+            call_options=call_options,
             params=params,
             files=files,
             data=data,
@@ -101,22 +288,14 @@ class BasePublicApiInterface(abc.ABC):
             and headers is not None
             and auth_api is not None
         ):
-            if token_info is None or "refresh_token" not in token_info:
-                return response
-            new_token_info = auth_api.refresh_token(
-                refresh_token=token_info["refresh_token"]
+            # See general_call_get
+            new_headers, new_token_info = BasePublicApiInterface._authorize(
+                headers=headers, token_info=token_info, auth_api=auth_api, force=True
             )
-            if new_token_info is None:
+            if new_token_info is token_info:
                 return response
-            new_token_str = new_token_info["token"]
-            SessionConfig.set_session_auth_token(auth_token=new_token_str)
-            SessionConfig.set_session_auth_token_full_response(
-                full_info=new_token_info
-            )
-            new_headers = BasePublicApiInterface.auth_header(new_token_str)
             return BasePublicApiInterface.general_call_post(
-                host_url=host_url,
-                endpoint=endpoint,
+                url=url,
                 params=params,
                 data=data,
                 files=files,
@@ -124,6 +303,7 @@ class BasePublicApiInterface(abc.ABC):
                 headers=new_headers,
                 token_info=new_token_info,
                 auth_api=None,
+                call_options=call_options,
             )
 
         if response.status_code != 200:
@@ -147,25 +327,23 @@ class BasePublicApiInterface(abc.ABC):
 
 
 class PublicConversationWithModelAPI(BasePublicApiInterface):
+    API_MODULE = ApiJsonConfiguration.API_PUBLIC_CHAT_CONVERSATION
     API_CALL_JSON_NEW_CHAT = "new_chat"
     API_CALL_JSON_SAVE_CHAT = "save_chat"
     API_CALL_JSON_ADD_CHAT_MSG = "add_chat_message"
+    API_CALL_JSON_ADD_CHAT_MSG_STREAM = "add_chat_message_stream"
     API_CALL_JSON_GET_CHAT_BY_HASH = "get_chat_by_hash"
     API_CALL_JSON_LIST_CHAT_MODELS = "conversation_models"
 
     def __init__(self, config_path: str):
-        super(PublicConversationWithModelAPI, self).__init__()
-        self.api_config = ApiJsonConfiguration(config_path=config_path)
+        super(PublicConversationWithModelAPI, self).__init__(config_path=config_path)
 
     def list_available_models(self, api_call_url: str | None = None):
-        if api_call_url is None:
-            api_call_url = self.api_config.free_chat_conversation_endpoints[
-                self.API_CALL_JSON_LIST_CHAT_MODELS
-            ]
-
         response = self.general_call_get(
-            host_url=self.api_config.free_chat_conversation_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(
+                self.API_CALL_JSON_LIST_CHAT_MODELS, api_call_url
+            ),
+            call_options=self._call_options(self.API_CALL_JSON_LIST_CHAT_MODELS),
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -177,20 +355,15 @@ class PublicConversationWithModelAPI(BasePublicApiInterface):
         public_state_options: Dict,
         api_call_url: str | None = None,
     ):
-        if api_call_url is None:
-            api_call_url = self.api_config.free_chat_conversation_endpoints[
-                self.API_CALL_JSON_NEW_CHAT
-            ]
-
         options = generation_options
         for k, v in public_state_options.items():
             options[k] = v
         options["model_name"] = model_name
         data = {"model_name": model_name, "options": json.dumps(options)}
         response = self.general_call_post(
-            host_url=self.api_config.free_chat_conversation_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_NEW_CHAT, api_call_url),
             data=data,
+            call_options=self._call_options(self.API_CALL_JSON_NEW_CHAT),
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -202,20 +375,15 @@ class PublicConversationWithModelAPI(BasePublicApiInterface):
         save_as_read_only: bool = True,
         api_call_url: str | None = None,
     ):
-        if api_call_url is None:
-            api_call_url = self.api_config.free_chat_conversation_endpoints[
-                self.API_CALL_JSON_SAVE_CHAT
-            ]
-
         data = {
             "chat_id": chat_id,
             "model_name": model_name,
             "read_only": save_as_read_only,
         }
         response = self.general_call_post(
-            host_url=self.api_config.free_chat_conversation_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_SAVE_CHAT, api_call_url),
             data=data,
+            call_options=self._call_options(self.API_CALL_JSON_SAVE_CHAT),
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -227,16 +395,13 @@ class PublicConversationWithModelAPI(BasePublicApiInterface):
         convert_history_to_session: bool = True,
         api_call_url: str | None = None,
     ):
-        if api_call_url is None:
-            api_call_url = self.api_config.free_chat_conversation_endpoints[
-                self.API_CALL_JSON_GET_CHAT_BY_HASH
-            ]
-
         data = {"chat_hash": chat_hash, "model_name": model_name}
         response = self.general_call_get(
-            host_url=self.api_config.free_chat_conversation_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(
+                self.API_CALL_JSON_GET_CHAT_BY_HASH, api_call_url
+            ),
             data=data,
+            call_options=self._call_options(self.API_CALL_JSON_GET_CHAT_BY_HASH),
         )
         self._last_response = response
 
@@ -268,6 +433,82 @@ class PublicConversationWithModelAPI(BasePublicApiInterface):
         rag_search_options: Dict | None,
         api_call_url: str | None = None,
     ):
+        data = self._prepare_chat_message_data(
+            chat_id=chat_id,
+            last_user_msg=last_user_msg,
+            generation_options=generation_options,
+            public_state_options=public_state_options,
+            model_name=model_name,
+            rag_search_options=rag_search_options,
+        )
+        response = self.general_call_post(
+            url=self._endpoint_url(self.API_CALL_JSON_ADD_CHAT_MSG, api_call_url),
+            data=data,
+            call_options=self._call_options(self.API_CALL_JSON_ADD_CHAT_MSG),
+        )
+        self._last_response = response
+        return self.return_response(response=response)
+
+    def add_chat_message_stream(
+        self,
+        chat_id,
+        last_user_msg: str,
+        generation_options: Dict,
+        public_state_options: Dict,
+        model_name: str,
+        rag_search_options: Dict | None,
+    ) -> ApiStream:
+        """
+        Streaming variant of :meth:`add_chat_message`, iterating over the
+        returned :class:`ApiStream` gives the deltas of the assistant message
+        and ``final`` holds the same fields as the blocking response. Without
+        a streaming endpoint (not configured or not supported by the backend)
+        the blocking call is made and its message is a single delta.
+        """
+        api_call_url = self.api_config.endpoint_url(
+            self.API_MODULE, self.API_CALL_JSON_ADD_CHAT_MSG_STREAM
+        )
+        stream = None
+        if api_call_url is not None:
+            data = self._prepare_chat_message_data(
+                chat_id=chat_id,
+                last_user_msg=last_user_msg,
+                generation_options=generation_options,
+                public_state_options=public_state_options,
+                model_name=model_name,
+                rag_search_options=rag_search_options,
+            )
+            stream = ApiStream.open(
+                url=api_call_url,
+                data=data,
+                call_options=self._call_options(
+                    self.API_CALL_JSON_ADD_CHAT_MSG_STREAM
+                ),
+            )
+
+        if stream is None:
+            stream = ApiStream.from_fallback(
+                self.add_chat_message(
+                    chat_id=chat_id,
+                    last_user_msg=last_user_msg,
+                    generation_options=generation_options,
+                    public_state_options=public_state_options,
+                    model_name=model_name,
+                    rag_search_options=rag_search_options,
+                ),
+                text_field="generated_assistant_message",
+            )
+        return stream
+
+    @staticmethod
+    def _prepare_chat_message_data(
+        chat_id,
+        last_user_msg: str,
+        generation_options: Dict,
+        public_state_options: Dict,
+        model_name: str,
+        rag_search_options: Dict | None,
+    ) -> dict:
         generation_options["use_content_supervisor"] = public_state_options.get(
             "use_content_supervisor", False
         )
@@ -281,11 +522,6 @@ class PublicConversationWithModelAPI(BasePublicApiInterface):
                 "percentage_rank_mass", 80
             )
 
-        if api_call_url is None:
-            api_call_url = self.api_config.free_chat_conversation_endpoints[
-                self.API_CALL_JSON_ADD_CHAT_MSG
-            ]
-
         data = {
             "last_user_message": last_user_msg,
             "generation_options": json.dumps(generation_options),
@@ -294,43 +530,32 @@ class PublicConversationWithModelAPI(BasePublicApiInterface):
         }
         if rag_search_options is not None and len(rag_search_options):
             data["search_options"] = json.dumps(rag_search_options)
-
-        response = self.general_call_post(
-            host_url=self.api_config.free_chat_conversation_host,
-            endpoint=api_call_url,
-            data=data,
-        )
-        self._last_response = response
-        return self.return_response(response=response)
+        return data
 
 
 class PlaygroundAuthenticationAPI(BasePublicApiInterface):
+    API_MODULE = ApiJsonConfiguration.API_AUTHORIZATION
     API_CALL_JSON_GET_LOGIN_URL = "get_login_url"
     API_CALL_JSON_GET_LOGIN = "login"
     API_CALL_JSON_GET_LOGOUT = "logout"
     API_CALL_JSON_REFRESH_TOKEN = "refresh_token"
 
     def __init__(self, config_path: str):
-        self.api_config = ApiJsonConfiguration(config_path=config_path)
-        super(PlaygroundAuthenticationAPI, self).__init__()
+        super(PlaygroundAuthenticationAPI, self).__init__(config_path=config_path)
 
     def get_proper_login_url(self):
-        api_call_url = self.api_config.auth_endpoints[
-            self.API_CALL_JSON_GET_LOGIN_URL
-        ]
         response = self.general_call_post(
-            host_url=self.api_config.auth_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_GET_LOGIN_URL),
+            call_options=self._call_options(self.API_CALL_JSON_GET_LOGIN_URL),
         )
         self._last_response = response
         return self.return_response(response=response)
 
     def login(self, session_state: dict) -> dict | None:
-        login_url = self.api_config.auth_endpoints[self.API_CALL_JSON_GET_LOGIN]
         response = self.general_call_post(
-            host_url=self.api_config.auth_host,
-            endpoint=login_url,
+            url=self._endpoint_url(self.API_CALL_JSON_GET_LOGIN),
             data=session_state,
+            call_options=self._call_options(self.API_CALL_JSON_GET_LOGIN),
         )
         response = self.return_response(response=response)
         if response is not None and "token" in response:
@@ -338,11 +563,10 @@ class PlaygroundAuthenticationAPI(BasePublicApiInterface):
         return None
 
     def refresh_token(self, refresh_token: str) -> dict | None:
-        login_url = self.api_config.auth_endpoints[self.API_CALL_JSON_REFRESH_TOKEN]
         response = self.general_call_post(
-            host_url=self.api_config.auth_host,
-            endpoint=login_url,
+            url=self._endpoint_url(self.API_CALL_JSON_REFRESH_TOKEN),
             data={"refresh_token": refresh_token},
+            call_options=self._call_options(self.API_CALL_JSON_REFRESH_TOKEN),
         )
         response = self.return_response(response=response)
         if response is not None and "token" in response:
@@ -351,26 +575,23 @@ class PlaygroundAuthenticationAPI(BasePublicApiInterface):
 
 
 class PlaygroundAdministrationAPI(BasePublicApiInterface):
+    API_MODULE = ApiJsonConfiguration.API_ADMINISTRATION
     API_CALL_JSON_GET_SYSTEM_STATUS = "system_status"
     API_CALL_JSON_GET_NEWS_STATISTICS = "news_statistics"
     API_CALL_JSON_DO_ADM_ACT_ON_MODULE = "do_admin_action_on_module"
     API_CALL_JSON_LAST_NEWS_TO_CHECK_CORRECT = "last_news_to_check"
 
     def __init__(self, config_path: str):
-        self.api_config = ApiJsonConfiguration(config_path=config_path)
-        super(PlaygroundAdministrationAPI, self).__init__()
+        super(PlaygroundAdministrationAPI, self).__init__(config_path=config_path)
 
     def get_system_status(self, token_str: str, token_info, auth_api):
-        api_call_url = self.api_config.admin_endpoints[
-            self.API_CALL_JSON_GET_SYSTEM_STATUS
-        ]
         headers = self.auth_header(token_str=token_str)
         response = self.general_call_get(
-            host_url=self.api_config.admin_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_GET_SYSTEM_STATUS),
             headers=headers,
             token_info=token_info,
             auth_api=auth_api,
+            call_options=self._call_options(self.API_CALL_JSON_GET_SYSTEM_STATUS),
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -378,11 +599,7 @@ class PlaygroundAdministrationAPI(BasePublicApiInterface):
     def get_news_statistics(
         self, token_str: str | None, token_info, auth_api, settings_id
     ):
-        if token_str is not None and len(token_str):
-            api_call_url = self.api_config.admin_endpoints[
-                self.API_CALL_JSON_GET_NEWS_STATISTICS
-            ]
-        else:
+        if token_str is None or not len(token_str):
             raise Exception("Problem during getting news statistics")
         headers = (
             self.auth_header(token_str=token_str)
@@ -390,12 +607,12 @@ class PlaygroundAdministrationAPI(BasePublicApiInterface):
             else None
         )
         response = self.general_call_get(
-            host_url=self.api_config.admin_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_GET_NEWS_STATISTICS),
             headers=headers,
             data={"settings_id": settings_id},
             token_info=token_info,
             auth_api=auth_api,
+            call_options=self._call_options(self.API_CALL_JSON_GET_NEWS_STATISTICS),
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -403,9 +620,6 @@ class PlaygroundAdministrationAPI(BasePublicApiInterface):
     def do_admin_action_on_module(
         self, settings_id, module, action, token_str, token_info, auth_api
     ):
-        api_call_url = self.api_config.admin_endpoints[
-            self.API_CALL_JSON_DO_ADM_ACT_ON_MODULE
-        ]
         headers = self.auth_header(token_str=token_str)
         data = {
             "settings_id": settings_id,
@@ -413,12 +627,18 @@ class PlaygroundAdministrationAPI(BasePublicApiInterface):
             "action": action,
         }
         response = self.general_call_post(
-            host_url=self.api_config.admin_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_DO_ADM_ACT_ON_MODULE),
             data=data,
             headers=headers,
             token_info=token_info,
             auth_api=auth_api,
+            call_options=self._call_options(self.API_CALL_JSON_DO_ADM_ACT_ON_MODULE),
+        )
+        ResponseCache.invalidate(module=ApiJsonConfiguration.API_PUBLIC_NEWS_STREAM)
+        # The public statistics are served (and cached) by this module
+        ResponseCache.invalidate(
+            module=self.API_MODULE,
+            endpoint=PublicNewsStreamAPI.API_CALL_JSON_GET_NEWS_STATISTICS_PUBLIC,
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -431,28 +651,28 @@ class PlaygroundAdministrationAPI(BasePublicApiInterface):
         token_info,
         auth_api,
     ):
-        api_call_url = self.api_config.admin_endpoints[
-            self.API_CALL_JSON_LAST_NEWS_TO_CHECK_CORRECT
-        ]
         data = {"number_of_news": number_of_news}
 
         headers = self.auth_header(token_str=token_str)
         if filter_pages is not None and len(filter_pages):
-            data["filter_pages"] = json.dumps(filter_pages)
+            data["filter_pages"] = self.stable_json(filter_pages)
 
         response = self.general_call_get(
-            host_url=self.api_config.admin_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_LAST_NEWS_TO_CHECK_CORRECT),
             data=data,
             headers=headers,
             token_info=token_info,
             auth_api=auth_api,
+            call_options=self._call_options(
+                self.API_CALL_JSON_LAST_NEWS_TO_CHECK_CORRECT
+            ),
         )
         self._last_response = response
         return self.return_response(response=response)
 
 
 class PublicNewsStreamAPI(BasePublicApiInterface):
+    API_MODULE = ApiJsonConfiguration.API_PUBLIC_NEWS_STREAM
     API_CALL_JSON_LIST_CATEGORIES = "get_categories"
     API_CALL_JSON_LIST_CATEGORIES_WITH_PAGES = "get_categories_with_pages"
     API_CALL_JSON_LIST_LAST_CATEGORIES = "get_last_news"
@@ -462,31 +682,24 @@ class PublicNewsStreamAPI(BasePublicApiInterface):
     API_CALL_JSON_SEARCH_PHRASE_IN_NEWS = "search_news_in_categories"
 
     def __init__(self, config_path: str):
-        self.api_config = ApiJsonConfiguration(config_path=config_path)
-        super(PublicNewsStreamAPI, self).__init__()
+        super(PublicNewsStreamAPI, self).__init__(config_path=config_path)
 
     def list_available_categories(self, api_call_url: str | None = None):
-        if api_call_url is None:
-            api_call_url = self.api_config.free_news_stream_endpoints[
-                self.API_CALL_JSON_LIST_CATEGORIES
-            ]
-
         response = self.general_call_get(
-            host_url=self.api_config.free_news_stream_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_LIST_CATEGORIES, api_call_url),
+            call_options=self._call_options(self.API_CALL_JSON_LIST_CATEGORIES),
         )
         self._last_response = response
         return self.return_response(response=response)
 
     def list_available_categories_with_pages(self, api_call_url: str | None = None):
-        if api_call_url is None:
-            api_call_url = self.api_config.free_news_stream_endpoints[
-                self.API_CALL_JSON_LIST_CATEGORIES_WITH_PAGES
-            ]
-
         response = self.general_call_get(
-            host_url=self.api_config.free_news_stream_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(
+                self.API_CALL_JSON_LIST_CATEGORIES_WITH_PAGES, api_call_url
+            ),
+            call_options=self._call_options(
+                self.API_CALL_JSON_LIST_CATEGORIES_WITH_PAGES
+            ),
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -500,23 +713,20 @@ class PublicNewsStreamAPI(BasePublicApiInterface):
         pli_to: int | None,
         api_call_url: str | None = None,
     ):
-        if api_call_url is None:
-            api_call_url = self.api_config.free_news_stream_endpoints[
-                self.API_CALL_JSON_LIST_LAST_CATEGORIES
-            ]
-
         data = {
             "news_in_category": news_in_category,
-            "filter_pages": json.dumps(filter_pages),
+            "filter_pages": self.stable_json(filter_pages),
             "polarity_3c": polarity_3c,
             "pli_from": pli_from,
             "pli_to": pli_to,
         }
 
         response = self.general_call_get(
-            host_url=self.api_config.free_news_stream_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(
+                self.API_CALL_JSON_LIST_LAST_CATEGORIES, api_call_url
+            ),
             data=data,
+            call_options=self._call_options(self.API_CALL_JSON_LIST_LAST_CATEGORIES),
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -524,38 +734,43 @@ class PublicNewsStreamAPI(BasePublicApiInterface):
     def do_news_option(
         self, news_id, action: str, token_str: str, token_info: dict, auth_api
     ):
-        api_call_url = self.api_config.free_news_stream_endpoints[
-            self.API_CALL_JSON_DO_NEWS_ACTION
-        ]
         headers = self.auth_header(token_str=token_str)
 
         data = {"news_id": news_id, "action": action}
         response = self.general_call_post(
-            host_url=self.api_config.free_news_stream_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_DO_NEWS_ACTION),
             json_data=data,
             data=None,
             headers=headers,
             token_info=token_info,
             auth_api=auth_api,
+            call_options=self._call_options(self.API_CALL_JSON_DO_NEWS_ACTION),
         )
+        ResponseCache.invalidate(module=self.API_MODULE)
 
         self._last_response = response
         return self.return_response(response=response)
 
     def get_news_statistics(self, settings_id, get_last_stats: bool):
-        api_call_url = self.api_config.free_news_stream_endpoints[
-            self.API_CALL_JSON_GET_NEWS_STATISTICS_PUBLIC
-        ]
-
         data = {"settings_id": settings_id, "get_last_stats": get_last_stats}
+        # Served by the administration host, also its breaker and timeouts
+        call_options = self._call_options(
+            self.API_CALL_JSON_GET_NEWS_STATISTICS_PUBLIC,
+            host_module=ApiJsonConfiguration.API_ADMINISTRATION,
+        )
+        # Only the last (already computed) statistics are the same for everyone
+        if not get_last_stats:
+            call_options["cache_ttl"] = None
         response = self.general_call_get(
-            host_url=self.api_config.admin_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(
+                self.API_CALL_JSON_GET_NEWS_STATISTICS_PUBLIC,
+                host_module=ApiJsonConfiguration.API_ADMINISTRATION,
+            ),
             headers=None,
             data=data,
             token_info=None,
             auth_api=None,
+            call_options=call_options,
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -568,11 +783,6 @@ class PublicNewsStreamAPI(BasePublicApiInterface):
         last_days: int,
         api_call_url: str | None = None,
     ):
-        if api_call_url is None:
-            api_call_url = self.api_config.free_news_stream_endpoints[
-                self.API_CALL_JSON_SEARCH_PHRASE_IN_NEWS
-            ]
-
         sites_urls = []
         for category, cat_urls in filter_pages.items():
             for cat_urls_items in cat_urls:
@@ -588,20 +798,25 @@ class PublicNewsStreamAPI(BasePublicApiInterface):
         }
 
         response = self.general_call_post(
-            host_url=self.api_config.free_news_stream_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(
+                self.API_CALL_JSON_SEARCH_PHRASE_IN_NEWS, api_call_url
+            ),
             data=data,
+            call_options=self._call_options(
+                self.API_CALL_JSON_SEARCH_PHRASE_IN_NEWS
+            ),
         )
         self._last_response = response
         return self.return_response(response=response)
 
 
 class PublicNewsCreatorAPI(BasePublicApiInterface):
+    API_MODULE = ApiJsonConfiguration.API_PUBLIC_NEWS_CREATOR
     API_CALL_JSON_GEN_NEWS_FROM_SEARCH = "generate_article_from_search"
+    API_CALL_JSON_GEN_NEWS_FROM_SEARCH_STREAM = "generate_article_from_search_stream"
 
     def __init__(self, config_path: str):
-        self.api_config = ApiJsonConfiguration(config_path=config_path)
-        super(PublicNewsCreatorAPI, self).__init__()
+        super(PublicNewsCreatorAPI, self).__init__(config_path=config_path)
 
     def generate_article_from_search_result(
         self,
@@ -611,43 +826,102 @@ class PublicNewsCreatorAPI(BasePublicApiInterface):
         query_response_id: int,
         api_call_url: str | None = None,
     ) -> dict:
-        if api_call_url is None:
-            api_call_url = self.api_config.free_news_creator_endpoints[
-                self.API_CALL_JSON_GEN_NEWS_FROM_SEARCH
-            ]
+        data = self._prepare_generation_data(
+            news_ids=news_ids,
+            user_query_str=user_query_str,
+            type_of_new_article=type_of_new_article,
+            query_response_id=query_response_id,
+        )
+        response = self.general_call_post(
+            url=self._endpoint_url(
+                self.API_CALL_JSON_GEN_NEWS_FROM_SEARCH,
+                api_call_url,
+                host_module=ApiJsonConfiguration.API_PUBLIC_NEWS_STREAM,
+            ),
+            data=data,
+            # Options of the creator module (generation limits), see
+            # ApiJsonConfiguration.call_options
+            call_options=self._call_options(self.API_CALL_JSON_GEN_NEWS_FROM_SEARCH),
+        )
+        self._last_response = response
+        return self.return_response(response=response)
 
-        data = {
+    def generate_article_from_search_result_stream(
+        self,
+        news_ids: List[int],
+        user_query_str: str,
+        type_of_new_article: str,
+        query_response_id: int,
+    ) -> ApiStream:
+        """
+        Streaming variant of :meth:`generate_article_from_search_result`:
+        the deltas of ``article_str`` and the final metadata frame
+        (``generation_time``, ``model_used_to_generate``, ...). Falls back
+        to the blocking call when the backend does not stream.
+        """
+        # The same backend as the blocking call (and its fallback)
+        api_call_url = self.api_config.endpoint_url(
+            self.API_MODULE,
+            self.API_CALL_JSON_GEN_NEWS_FROM_SEARCH_STREAM,
+            host_module=ApiJsonConfiguration.API_PUBLIC_NEWS_STREAM,
+        )
+        stream = None
+        if api_call_url is not None:
+            stream = ApiStream.open(
+                url=api_call_url,
+                data=self._prepare_generation_data(
+                    news_ids=news_ids,
+                    user_query_str=user_query_str,
+                    type_of_new_article=type_of_new_article,
+                    query_response_id=query_response_id,
+                ),
+                # Options of the creator module, as the blocking call
+                call_options=self._call_options(
+                    self.API_CALL_JSON_GEN_NEWS_FROM_SEARCH_STREAM
+                ),
+            )
+
+        if stream is None:
+            stream = ApiStream.from_fallback(
+                self.generate_article_from_search_result(
+                    news_ids=news_ids,
+                    user_query_str=user_query_str,
+                    type_of_new_article=type_of_new_article,
+                    query_response_id=query_response_id,
+                ),
+                text_field="article_str",
+            )
+        return stream
+
+    @staticmethod
+    def _prepare_generation_data(
+        news_ids: List[int],
+        user_query_str: str,
+        type_of_new_article: str,
+        query_response_id: int,
+    ) -> dict:
+        return {
             "user_query": user_query_str,
             "news_ids": json.dumps(news_ids),
             "article_type": type_of_new_article,
             "sse_query_response_id": query_response_id,
         }
 
-        response = self.general_call_post(
-            host_url=self.api_config.free_news_stream_host,
-            endpoint=api_call_url,
-            data=data,
-        )
-        self._last_response = response
-        return self.return_response(response=response)
-
 
 class PublicNewsBrowserAPI(BasePublicApiInterface):
+    API_MODULE = ApiJsonConfiguration.API_PUBLIC_NEWS_BROWSER
     API_CALL_JSON_ARTICLE_SUMMARY_OF_DAY = "articles_summary_of_day"
 
     def __init__(self, config_path: str):
-        self.api_config = ApiJsonConfiguration(config_path=config_path)
-        super(PublicNewsBrowserAPI, self).__init__()
+        super(PublicNewsBrowserAPI, self).__init__(config_path=config_path)
 
     def get_summary_of_day(self, date: datetime.date):
-        api_call_url = self.api_config.free_news_browser_endpoints[
-            self.API_CALL_JSON_ARTICLE_SUMMARY_OF_DAY
-        ]
-
         response = self.general_call_get(
-            host_url=self.api_config.free_news_browser_host,
-            endpoint=api_call_url,
+            url=self._endpoint_url(self.API_CALL_JSON_ARTICLE_SUMMARY_OF_DAY),
             data={"date": date},
+            call_options=self._call_options(
+                self.API_CALL_JSON_ARTICLE_SUMMARY_OF_DAY
+            ),
         )
         self._last_response = response
         return self.return_response(response=response)
@@ -0,0 +1,179 @@
+"""
+Awaitable variants of the public API clients from :mod:`src.api_public`.
+
+Every ``Async*API`` class exposes the same methods as its synchronous
+counterpart, but each method returns a coroutine. The blocking HTTP call is
+executed on a process-wide thread pool (which shares the pooled keep-alive
+sessions of :class:`src.api_connection.HttpSessionPool`), so independent
+calls awaited with :func:`asyncio.gather` run concurrently and a page costs
+the slowest call instead of the sum of all of them.
+
+Streamlit scripts are synchronous, :class:`AsyncApiRunner` is the bridge:
+
+    stats, status = AsyncApiRunner.gather(
+        admin_api.get_news_statistics(...),
+        admin_api.get_system_status(...),
+    )
+"""
+
+import asyncio
+import functools
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    SCRIPT_RUN_CONTEXT_ATTR_NAME,
+)
+
+from src.api_public import (
+    BasePublicApiInterface,
+    PublicConversationWithModelAPI,
+    PlaygroundAuthenticationAPI,
+    PlaygroundAdministrationAPI,
+    PublicNewsStreamAPI,
+    PublicNewsCreatorAPI,
+    PublicNewsBrowserAPI,
+)
+
+
+class AsyncApiRunner:
+    """
+    Process-wide executor used by the async API clients together with
+    the sync-bridge helpers used by the Streamlit pages.
+    """
+
+    MAX_WORKERS = 32
+    THREAD_NAME_PREFIX = "api-call"
+
+    _lock = threading.Lock()
+    _executor = None
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=cls.MAX_WORKERS,
+                        thread_name_prefix=cls.THREAD_NAME_PREFIX,
+                    )
+        return cls._executor
+
+    @classmethod
+    async def call(cls, func, *args, **kwargs):
+        """
+        Run a blocking ``func`` on the executor. The Streamlit script
+        context of the caller is attached to the worker thread, so the
+        API layer can still update ``st.session_state`` (e.g. after
+        a token refresh).
+        """
+        script_ctx = get_script_run_ctx(suppress_warning=True)
+
+        def _call_with_ctx():
+            # The worker is pooled, the context of this caller must not be
+            # left for the next job (which may come without a context)
+            thread = threading.current_thread()
+            previous_ctx = get_script_run_ctx(suppress_warning=True)
+            cls._set_thread_ctx(thread, script_ctx)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                cls._set_thread_ctx(thread, previous_ctx)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls.executor(), _call_with_ctx)
+
+    @staticmethod
+    def _set_thread_ctx(thread: threading.Thread, script_ctx) -> None:
+        if script_ctx is not None:
+            add_script_run_ctx(thread, script_ctx)
+        elif hasattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME):
+            delattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME)
+
+    @staticmethod
+    def run(coroutine):
+        """
+        Run ``coroutine`` to completion from synchronous code (a Streamlit
+        script) and return its result.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        # Called from a thread which already runs an event loop,
+        # the coroutine has to be driven by another thread.
+        return AsyncApiRunner.executor().submit(asyncio.run, coroutine).result()
+
+    @staticmethod
+    def gather(*coroutines) -> list:
+        """
+        Run all ``coroutines`` concurrently and return their results
+        in the same order.
+        """
+
+        async def _gather():
+            return await asyncio.gather(*coroutines)
+
+        return AsyncApiRunner.run(_gather())
+
+
+class AsyncBasePublicApiInterface:
+    """
+    Wraps an instance of ``SYNC_API_CLASS``. Each public method of the
+    wrapped client is available here as a coroutine function with exactly
+    the same signature.
+    """
+
+    SYNC_API_CLASS = BasePublicApiInterface
+
+    def __init__(self, config_path: str):
+        self.sync_api = self.SYNC_API_CLASS(config_path=config_path)
+
+    @property
+    def api_config(self):
+        return self.sync_api.api_config
+
+    @property
+    def last_response(self):
+        return self.sync_api.last_response
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        sync_method = getattr(self.sync_api, name)
+        if not callable(sync_method):
+            return sync_method
+
+        @functools.wraps(sync_method)
+        async def _async_method(*args, **kwargs):
+            return await AsyncApiRunner.call(sync_method, *args, **kwargs)
+
+        return _async_method
+
+
+class AsyncPublicConversationWithModelAPI(AsyncBasePublicApiInterface):
+    SYNC_API_CLASS = PublicConversationWithModelAPI
+
+
+class AsyncPlaygroundAuthenticationAPI(AsyncBasePublicApiInterface):
+    SYNC_API_CLASS = PlaygroundAuthenticationAPI
+
+
+class AsyncPlaygroundAdministrationAPI(AsyncBasePublicApiInterface):
+    SYNC_API_CLASS = PlaygroundAdministrationAPI
+
+
+class AsyncPublicNewsStreamAPI(AsyncBasePublicApiInterface):
+    SYNC_API_CLASS = PublicNewsStreamAPI
+
+
+class AsyncPublicNewsCreatorAPI(AsyncBasePublicApiInterface):
+    SYNC_API_CLASS = PublicNewsCreatorAPI
+
+
+class AsyncPublicNewsBrowserAPI(AsyncBasePublicApiInterface):
+    SYNC_API_CLASS = PublicNewsBrowserAPI
@@ -0,0 +1,323 @@
+import time
+import random
+import threading
+
+import requests
+
+from src.api_connection import HttpSessionPool
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a single backend module.
+
+    After ``failure_threshold`` consecutive failures (transport errors,
+    timeouts or ``5xx`` responses) the breaker opens and the calls to the
+    module fail fast. After ``reset_timeout`` seconds a single probe call
+    is let through (half-open state): its success closes the breaker,
+    its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._counters = {"opened": 0, "rejected": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._counters["rejected"] += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                if self._state != self.OPEN:
+                    self._counters["opened"] += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["state"] = self._current_state()
+            stats["consecutive_failures"] = self._failures
+        return stats
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+        return self._state
+
+
+class ApiResilience:
+    """
+    Process-wide resilience layer of the API clients:
+
+      - every call has a ``(connect, read)`` timeout, so a hung backend
+        module cannot pin a Streamlit script thread forever,
+      - idempotent calls (GET) are retried with a jittered exponential
+        backoff after transport errors and ``502/503/504`` responses,
+      - each backend module has its own :class:`CircuitBreaker`, an open
+        breaker fails fast without touching the network,
+      - each module may limit the number of its concurrent calls
+        (``max_concurrent``), so slow generation endpoints cannot take all
+        the threads and connections needed by the fast listing endpoints.
+
+    Calls which are rejected or fail on the transport level return
+    a synthetic ``requests.Response`` (``503``/``504``), which the API
+    clients handle as any other unsuccessful response.
+    """
+
+    DEFAULT_CONNECT_TIMEOUT = 3.05
+    DEFAULT_READ_TIMEOUT = 30.0
+    DEFAULT_RETRIES = 2
+    DEFAULT_BACKOFF_BASE = 0.25
+    DEFAULT_BACKOFF_MAX = 2.0
+    DEFAULT_FAILURE_THRESHOLD = 5
+    DEFAULT_RESET_TIMEOUT = 30.0
+    DEFAULT_BULKHEAD_WAIT = 0.5
+
+    RETRY_STATUS_CODES = [502, 503, 504]
+
+    _lock = threading.Lock()
+    _breakers = {}
+    _bulkheads = {}
+    _options = {
+        "connect_timeout": DEFAULT_CONNECT_TIMEOUT,
+        "read_timeout": DEFAULT_READ_TIMEOUT,
+        "retries": DEFAULT_RETRIES,
+        "backoff_base": DEFAULT_BACKOFF_BASE,
+        "backoff_max": DEFAULT_BACKOFF_MAX,
+        "failure_threshold": DEFAULT_FAILURE_THRESHOLD,
+        "reset_timeout": DEFAULT_RESET_TIMEOUT,
+        "bulkhead_wait": DEFAULT_BULKHEAD_WAIT,
+    }
+    _counters = {"retries": 0, "timeouts": 0, "transport_errors": 0, "rejected": 0}
+
+    @classmethod
+    def configure(cls, **options) -> None:
+        """
+        Set the options from the ``resilience`` section of
+        ``ui-configuration.json``, unknown options raise ``KeyError``.
+        """
+        with cls._lock:
+            for name, value in options.items():
+                if name not in cls._options:
+                    raise KeyError(f"Unknown resilience option {name}")
+                cls._options[name] = value
+            for breaker in cls._breakers.values():
+                breaker.failure_threshold = cls._options["failure_threshold"]
+                breaker.reset_timeout = cls._options["reset_timeout"]
+
+    @classmethod
+    def breaker(cls, module: str | None) -> CircuitBreaker:
+        with cls._lock:
+            breaker = cls._breakers.get(module)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    name=str(module),
+                    failure_threshold=cls._options["failure_threshold"],
+                    reset_timeout=cls._options["reset_timeout"],
+                )
+                cls._breakers[module] = breaker
+        return breaker
+
+    @classmethod
+    def request(
+        cls, method: str, url: str, call_options: dict | None = None, **kwargs
+    ) -> requests.Response:
+        """
+        Make the call through :class:`HttpSessionPool` with the timeout,
+        retries, circuit breaker and concurrency limit of the endpoint
+        described by ``call_options``.
+        """
+        call_options = call_options or {}
+        module = call_options.get("module")
+        breaker = cls.breaker(module)
+        kwargs["timeout"] = call_options.get("timeout") or (
+            cls._options["connect_timeout"],
+            cls._options["read_timeout"],
+        )
+        retries = 0
+        if method.upper() in ["GET", "HEAD", "OPTIONS"]:
+            retries = call_options.get("retries")
+            retries = cls._options["retries"] if retries is None else retries
+
+        release_slot = cls.acquire_slot(call_options)
+        if release_slot is None:
+            return cls.unavailable_response(
+                url, 503, f"Too many concurrent calls to module {module}"
+            )
+
+        try:
+            attempt = 0
+            while True:
+                if not breaker.allow_request():
+                    cls._count("rejected")
+                    return cls.unavailable_response(
+                        url, 503, f"Circuit breaker of module {module} is open"
+                    )
+
+                try:
+                    response = HttpSessionPool.request(method, url, **kwargs)
+                except requests.exceptions.Timeout:
+                    cls._count("timeouts")
+                    breaker.record_failure()
+                    response = cls.unavailable_response(
+                        url, 504, f"Timeout of module {module}"
+                    )
+                except requests.exceptions.ConnectionError:
+                    cls._count("transport_errors")
+                    breaker.record_failure()
+                    response = cls.unavailable_response(
+                        url, 503, f"Cannot connect to module {module}"
+                    )
+                except requests.exceptions.RequestException as e:
+                    cls._count("transport_errors")
+                    breaker.record_failure()
+                    response = cls.unavailable_response(
+                        url, 503, f"Transport error of module {module}: {e}"
+                    )
+                except BaseException:
+                    # The half-open probe has to end with a result,
+                    # otherwise the breaker would reject all next calls
+                    breaker.record_failure()
+                    raise
+                else:
+                    if response.status_code >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+
+                if attempt >= retries or (
+                    response.status_code not in cls.RETRY_STATUS_CODES
+                ):
+                    return response
+
+                attempt += 1
+                cls._count("retries")
+                time.sleep(cls.backoff_delay(attempt))
+        finally:
+            release_slot()
+
+    @classmethod
+    def acquire_slot(cls, call_options: dict | None):
+        """
+        Take a slot of the concurrency limit (``max_concurrent``) of the
+        module. Returns the function which frees the slot (calling it again
+        does nothing), ``None`` when no slot was freed in time.
+
+        :meth:`request` frees its slot when it returns. A streamed body
+        outlives the call, so the stream takes the slot itself and calls
+        :meth:`request` with ``max_concurrent`` set to ``None``.
+        """
+        call_options = call_options or {}
+        bulkhead = cls._bulkhead(
+            call_options.get("module"), call_options.get("max_concurrent")
+        )
+        if bulkhead is None:
+            return lambda: None
+        if not bulkhead.acquire(timeout=cls._options["bulkhead_wait"]):
+            cls._count("rejected")
+            return None
+
+        released = threading.Lock()
+
+        def _release():
+            if released.acquire(blocking=False):
+                bulkhead.release()
+
+        return _release
+
+    @classmethod
+    def backoff_delay(cls, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter: a random delay between 0 and
+        ``backoff_base * 2^(attempt - 1)``, capped by ``backoff_max``.
+        """
+        max_delay = min(
+            cls._options["backoff_max"],
+            cls._options["backoff_base"] * (2 ** (attempt - 1)),
+        )
+        return random.uniform(0, max_delay)
+
+    @staticmethod
+    def unavailable_response(
+        url: str, status_code: int, reason: str
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = reason
+        response.url = url
+        response._content = reason.encode("utf-8")
+        return response
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            stats = dict(cls._counters)
+            breakers = dict(cls._breakers)
+            bulkheads = dict(cls._bulkheads)
+        stats["modules"] = {
+            str(module): breaker.stats() for module, breaker in breakers.items()
+        }
+        for module, (max_concurrent, _) in bulkheads.items():
+            stats["modules"].setdefault(str(module), {})[
+                "max_concurrent"
+            ] = max_concurrent
+        return stats
+
+    @classmethod
+    def _bulkhead(cls, module: str | None, max_concurrent: int | None):
+        if not max_concurrent:
+            return None
+        with cls._lock:
+            bulkhead = cls._bulkheads.get(module)
+            if bulkhead is None or bulkhead[0] != max_concurrent:
+                bulkhead = (
+                    max_concurrent,
+                    threading.BoundedSemaphore(max_concurrent),
+                )
+                cls._bulkheads[module] = bulkhead
+        return bulkhead[1]
+
+    @classmethod
+    def _count(cls, counter: str) -> None:
+        with cls._lock:
+            cls._counters[counter] += 1
@@ -0,0 +1,61 @@
+import threading
+
+
+class _InFlightCall:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Process-wide request coalescing. While a call identified by ``key`` is
+    in flight, every other caller asking for the same ``key`` waits for it
+    and gets its result (or its exception) instead of calling the backend
+    once again. Callers from all user sessions share the in-flight calls,
+    which removes the thundering herd after a new crawl or a traffic spike.
+    """
+
+    _lock = threading.Lock()
+    _in_flight = {}
+    _counters = {"calls": 0, "upstream_calls": 0, "coalesced_calls": 0}
+
+    @classmethod
+    def do(cls, key: str, func):
+        with cls._lock:
+            cls._counters["calls"] += 1
+            call = cls._in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                cls._in_flight[key] = call
+                cls._counters["upstream_calls"] += 1
+            else:
+                cls._counters["coalesced_calls"] += 1
+
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with cls._lock:
+                del cls._in_flight[key]
+            call.event.set()
+        return call.result
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            stats = dict(cls._counters)
+            stats["in_flight"] = len(cls._in_flight)
+        return stats
@@ -0,0 +1,364 @@
+"""
+Streamed (incremental) responses of the generation endpoints.
+
+A streaming endpoint answers with ``text/event-stream`` (SSE) or with
+chunked ``application/x-ndjson``. Both carry the same frames:
+
+    event: delta
+    data: {"text": "next part of the generated text"}
+
+    event: done
+    data: {"generation_time": 3.2, ...}        <- final metadata frame
+
+    event: error
+    data: {"status": false, "response": "..."}
+
+(in NDJSON each line is ``{"event": "delta", "data": {...}}``).
+
+:class:`ApiStream` is an iterator over the text deltas, ready for
+``st.write_stream``. When the iteration is done, ``final`` holds the
+metadata frame and ``error`` the error frame (if any). A blocking response
+can be wrapped with :meth:`ApiStream.from_result` (:meth:`~ApiStream.from_fallback`
+when the endpoint does not stream), so the pages render both the streamed
+and the fallback path in the same way.
+"""
+
+import json
+import time
+import weakref
+import threading
+
+import requests
+
+from src.api_resilience import ApiResilience
+
+
+class ApiStream:
+    EVENT_DELTA = "delta"
+    EVENT_DONE = "done"
+    EVENT_ERROR = "error"
+    EVENT_DEFAULT = "message"
+
+    DELTA_TEXT_FIELD = "text"
+
+    STREAM_CONTENT_TYPES = ["text/event-stream", "application/x-ndjson"]
+    UNSUPPORTED_STATUS_CODES = [404, 405, 406, 501]
+    UNSUPPORTED_RECHECK_SECONDS = 300
+
+    _lock = threading.Lock()
+    _unsupported = {}
+    _counters = {
+        "streams": 0,
+        "fallbacks": 0,
+        "errors": 0,
+        "first_token_count": 0,
+        "first_token_seconds_sum": 0.0,
+    }
+
+    def __init__(self, frames, started_at: float | None = None, streamed=True):
+        self._frames = frames
+        self._started_at = started_at or time.monotonic()
+        self._text_parts = []
+        self.streamed = streamed
+        self.final = None
+        self.error = None
+        self.time_to_first_token = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self._text_parts)
+
+    def __iter__(self):
+        try:
+            for event, data in self._frames:
+                if event in [self.EVENT_DELTA, self.EVENT_DEFAULT]:
+                    text = self._delta_text(data)
+                    if not len(text):
+                        continue
+                    if self.time_to_first_token is None:
+                        self.time_to_first_token = (
+                            time.monotonic() - self._started_at
+                        )
+                        if self.streamed:
+                            self._count_first_token(self.time_to_first_token)
+                    self._text_parts.append(text)
+                    yield text
+                elif event == self.EVENT_DONE:
+                    self.final = data
+                elif event == self.EVENT_ERROR:
+                    self.error = data
+                    self._count("errors")
+                    break
+        finally:
+            # The response and the concurrency slot are freed at once,
+            # also when the reader stops early
+            if hasattr(self._frames, "close"):
+                self._frames.close()
+
+    @classmethod
+    def open(
+        cls,
+        url: str,
+        data: dict | None = None,
+        headers: dict | None = None,
+        call_options: dict | None = None,
+    ):
+        """
+        POST ``data`` to the streaming endpoint ``url``. Returns ``None``
+        when the endpoint does not stream (the caller falls back to the
+        blocking call), otherwise an :class:`ApiStream`.
+        """
+        if cls.is_unsupported(url):
+            return None
+
+        call_options = call_options or {}
+        module = call_options.get("module")
+        # The slot is held until the whole body is read, not only the headers
+        release_slot = ApiResilience.acquire_slot(call_options)
+        if release_slot is None:
+            return cls.from_result(
+                {
+                    "status": False,
+                    "response": f"Too many concurrent calls to module {module}",
+                }
+            )
+
+        try:
+            stream = cls._open_stream(
+                url=url,
+                data=data,
+                headers=headers,
+                call_options=dict(call_options, max_concurrent=None),
+                release_slot=release_slot,
+            )
+        except BaseException:
+            release_slot()
+            raise
+        if stream is None or not stream.streamed:
+            release_slot()
+        else:
+            # A stream which is never read frees the slot when it is dropped
+            weakref.finalize(stream, release_slot)
+        return stream
+
+    @classmethod
+    def _open_stream(
+        cls,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+        call_options: dict,
+        release_slot,
+    ):
+        started_at = time.monotonic()
+        response = ApiResilience.request(
+            "POST",
+            url,
+            call_options=call_options,
+            data=data,
+            headers=dict(headers or {}, Accept=", ".join(cls.STREAM_CONTENT_TYPES)),
+            stream=True,
+        )
+        if response.status_code in cls.UNSUPPORTED_STATUS_CODES:
+            response.close()
+            cls.mark_unsupported(url)
+            return None
+
+        if response.status_code != 200:
+            response.close()
+            return cls.from_result({"status": False, "response": response.text})
+
+        content_type = response.headers.get("Content-Type", "")
+        # text/* without charset would be decoded as ISO-8859-1
+        response.encoding = (
+            response.encoding if "charset" in content_type else "utf-8"
+        )
+        if "text/event-stream" in content_type:
+            frames = cls._sse_frames(response)
+        elif "ndjson" in content_type:
+            frames = cls._ndjson_frames(response)
+        else:
+            # The endpoint answered at once, with the whole response
+            try:
+                result = response.json()
+            except ValueError:
+                result = {"status": False, "response": response.text}
+            finally:
+                response.close()
+            return cls.from_result(result)
+
+        cls._count("streams")
+        return cls(
+            frames=cls._guarded_frames(
+                frames,
+                response=response,
+                module=call_options.get("module"),
+                release_slot=release_slot,
+            ),
+            started_at=started_at,
+        )
+
+    @classmethod
+    def from_fallback(cls, result, text_field: str | None = None):
+        """
+        :meth:`from_result` of the blocking call made because the endpoint
+        does not stream (counted as a fallback).
+        """
+        cls._count("fallbacks")
+        return cls.from_result(result, text_field=text_field)
+
+    @classmethod
+    def from_result(cls, result, text_field: str | None = None):
+        """
+        Wrap a blocking response: the whole text (``result[text_field]``)
+        is a single delta and ``result`` is the final frame.
+        """
+        if type(result) in [dict] and "status" in result:
+            if result["status"]:
+                result = result.get("body")
+            else:
+                return cls(frames=[(cls.EVENT_ERROR, result)], streamed=False)
+
+        if result is None or (type(result) in [dict, list] and not len(result)):
+            # Empty response, there is nothing to show
+            return cls(
+                frames=[(cls.EVENT_ERROR, {"response": result})], streamed=False
+            )
+
+        frames = []
+        if text_field is not None and type(result) in [dict]:
+            frames.append(
+                (cls.EVENT_DELTA, {cls.DELTA_TEXT_FIELD: result.get(text_field)})
+            )
+        frames.append((cls.EVENT_DONE, result))
+        return cls(frames=frames, streamed=False)
+
+    @classmethod
+    def is_unsupported(cls, url: str) -> bool:
+        with cls._lock:
+            recheck_at = cls._unsupported.get(url)
+            if recheck_at is None:
+                return False
+            if recheck_at <= time.monotonic():
+                del cls._unsupported[url]
+                return False
+            return True
+
+    @classmethod
+    def mark_unsupported(cls, url: str) -> None:
+        with cls._lock:
+            cls._unsupported[url] = (
+                time.monotonic() + cls.UNSUPPORTED_RECHECK_SECONDS
+            )
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            stats = dict(cls._counters)
+            stats["unsupported_endpoints"] = list(cls._unsupported.keys())
+        first_token_count = stats.pop("first_token_count")
+        first_token_sum = stats.pop("first_token_seconds_sum")
+        stats["avg_time_to_first_token"] = (
+            round(first_token_sum / first_token_count, 3)
+            if first_token_count
+            else None
+        )
+        return stats
+
+    @classmethod
+    def _guarded_frames(
+        cls, frames, response: requests.Response, module: str | None, release_slot
+    ):
+        """
+        Frames of the streamed body. A transport error (read timeout,
+        reset connection) or a malformed frame ends the stream with an error
+        frame and counts as a failure of the module. The response and the
+        concurrency slot are freed when the stream ends.
+        """
+        try:
+            yield from frames
+        except (requests.exceptions.RequestException, ValueError) as e:
+            ApiResilience.breaker(module).record_failure()
+            yield cls.EVENT_ERROR, {
+                "status": False,
+                "response": f"Stream of module {module} interrupted: {e}",
+            }
+        finally:
+            response.close()
+            release_slot()
+
+    @classmethod
+    def _sse_frames(cls, response: requests.Response):
+        event, data_lines = cls.EVENT_DEFAULT, []
+        for line in cls._iter_lines(response):
+            if not len(line):
+                if len(data_lines):
+                    yield event, cls._decode_data("\n".join(data_lines))
+                event, data_lines = cls.EVENT_DEFAULT, []
+            elif line.startswith(":"):
+                # SSE comment (keep-alive)
+                continue
+            elif line.startswith("event:"):
+                event = line[len("event:") :].strip()
+            elif line.startswith("data:"):
+                data_lines.append(line[len("data:") :].lstrip())
+        if len(data_lines):
+            yield event, cls._decode_data("\n".join(data_lines))
+
+    @classmethod
+    def _ndjson_frames(cls, response: requests.Response):
+        for line in cls._iter_lines(response):
+            if not len(line.strip()):
+                continue
+            frame = json.loads(line)
+            if type(frame) not in [dict]:
+                raise ValueError(f"Malformed frame: {line[:100]}")
+            data = frame.get("data")
+            if data is None:
+                data = {}
+            elif type(data) not in [dict]:
+                data = {cls.DELTA_TEXT_FIELD: str(data)}
+            yield frame.get("event", cls.EVENT_DELTA), data
+
+    @staticmethod
+    def _iter_lines(response: requests.Response):
+        """
+        Lines of the body as soon as they arrive. ``Response.iter_lines``
+        may drop the empty lines which end the SSE events when they are
+        split between two chunks.
+        """
+        pending = ""
+        for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
+            pending += chunk
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        if len(pending):
+            yield pending.rstrip("\r")
+
+    @classmethod
+    def _delta_text(cls, data) -> str:
+        if type(data) in [dict]:
+            return data.get(cls.DELTA_TEXT_FIELD) or ""
+        return "" if data is None else str(data)
+
+    @classmethod
+    def _decode_data(cls, data_str: str) -> dict:
+        try:
+            data = json.loads(data_str)
+        except ValueError:
+            return {cls.DELTA_TEXT_FIELD: data_str}
+        if type(data) not in [dict]:
+            return {cls.DELTA_TEXT_FIELD: str(data)}
+        return data
+
+    @classmethod
+    def _count(cls, counter: str) -> None:
+        with cls._lock:
+            cls._counters[counter] += 1
+
+    @classmethod
+    def _count_first_token(cls, seconds: float) -> None:
+        with cls._lock:
+            cls._counters["first_token_count"] += 1
+            cls._counters["first_token_seconds_sum"] += seconds
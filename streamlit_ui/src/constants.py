@@ -7,6 +7,7 @@ UI_LANG_DEFAULT_DEFINITION_FILE = "resources/language/ui_lang_def.xlsx"
 
 SSL_CONNECTION = bool_env_value("STREAMLIT_SSL_CONNECTION")
 RUN_SERVER_LOCALHOST = bool_env_value("STREAMLIT_RUN_SERVER_LOCALHOST")
+SHOW_TRANSLATION_STATS = bool_env_value("SHOW_TRANSLATION_STATS")
 
 
 DEFAULT_UI_CONFIG_PATH = "resources/configs/ui-configuration.json"
@@ -56,6 +57,10 @@ REPLACE_FOR_TRANSLATIONS = {
 
 MIN_STREAM_QUERY_LEN = 12
 
+# News rendered at once in a category of the news stream (the first one is
+# the default), the next ones are rendered after clicking "show more"
+NEWS_STREAM_PAGE_SIZES = [10, 25, 50]
+
 
 class ApplicationIcons:
     # App icons
@@ -1,9 +1,10 @@
 import json
 
-import pandas as pd
-
 
 def convert_admin_pages_stats_to_polarity_3c(polarity_stats: dict) -> (list, list):
+    # pandas is loaded only when a dataframe is built
+    import pandas as pd
+
     pages_polarity = []
     pages_polarity_perc = []
     for page_www_url, page_data in polarity_stats.items():
@@ -30,6 +31,9 @@ def convert_admin_pages_stats_to_polarity_3c(polarity_stats: dict) -> (list, lis
 
 
 def convert_admin_pages_stats_news_p_day(pages_stats):
+    # pandas is loaded only when a dataframe is built
+    import pandas as pd
+
     p_d_stats = []
     for url, stats in pages_stats.items():
         p_d_stats.append(
@@ -1,8 +1,11 @@
-import pandas as pd
+import re
+import time
+import threading
 
 from typing import Optional
 
 from src.session_config import SessionConfig
+from src.language_catalog import LanguageCatalog
 from src.constants import (
     DEFAULT_LANGUAGE,
     UI_LANG_DEFAULT_DEFINITION_FILE,
@@ -10,6 +13,61 @@ from src.constants import (
 )
 
 
+class _MessageTemplate:
+    """
+    Translation text with ``{placeholder}`` fields, parsed once into
+    literal chunks and field slots and rendered in a single pass.
+
+    Field names are the raw texts between the braces (also expression-like,
+    e.g. ``{info['day_to_summary']}``; typographic quotes ``‘’`` are treated
+    as ``'``). Fields without a value are rendered unchanged.
+    """
+
+    __slots__ = ("_chunks", "_slots", "fields")
+
+    FIELD_REGEX = re.compile(r"\{([^{}]+)\}")
+    QUOTES_TO_NORMALIZE = {"‘": "'", "’": "'"}
+
+    def __init__(self, text: str):
+        chunks, slots = [], []
+        last_end = 0
+        for match in self.FIELD_REGEX.finditer(text):
+            chunks.append(text[last_end : match.start()])
+            field_name = match.group(1)
+            for _f, _t in self.QUOTES_TO_NORMALIZE.items():
+                field_name = field_name.replace(_f, _t)
+            slots.append((len(chunks), field_name))
+            chunks.append("{" + field_name + "}")
+            last_end = match.end()
+        chunks.append(text[last_end:])
+
+        self._chunks = chunks
+        self._slots = tuple(slots)
+        self.fields = tuple(field_name for _, field_name in slots)
+
+    def render(self, values: dict) -> str:
+        chunks = self._chunks.copy()
+        for chunk_idx, field_name in self._slots:
+            if field_name in values:
+                chunks[chunk_idx] = str(values[field_name])
+        return "".join(chunks)
+
+
+class _LanguageTable:
+    """
+    Immutable snapshot of a single language: the flat ``{code_name: text}``
+    table and the compiled templates of its texts. A reload replaces the
+    whole snapshot, so the table and its templates are always consistent.
+    """
+
+    __slots__ = ("language", "table", "templates")
+
+    def __init__(self, language: str, table: dict):
+        self.language = language
+        self.table = table
+        self.templates = {}
+
+
 class _LanguageDefinitions:
     """
     Load translation definitions from an XLSX file.
@@ -25,13 +83,20 @@ class _LanguageDefinitions:
     | hello| Cześć | Hello |
     +------+----+----+
 
-    The class loads translation definitions from an XLSX
-    file into an in‑memory dictionary:
+    Each language is loaded only when it is used for the first time, from
+    its compiled catalog (see :class:`LanguageCatalog`, the XLSX is parsed
+    only when the catalog is stale), into a flat table with the constant
+    placeholders (``REPLACE_FOR_TRANSLATIONS``, e.g. icons) already resolved:
     {
-        "code1": {"pl": "tekst PL", "en": "text EN", ...},
-        "code2": {"pl": "...", "en": "..."},
+        "code1": "tekst PL",
+        "code2": "...",
         ...
     }
+
+    The tables are shared by all sessions of the process. The modification
+    time of the XLSX is checked at most every ``RELOAD_CHECK_INTERVAL``
+    seconds; when it has changed, the loaded languages are rebuilt and
+    swapped at once, the sessions see either the old or the new tables.
     """
 
     CODE_NAME_COLUMN = "code_name"
@@ -42,6 +107,8 @@ class _LanguageDefinitions:
 
     LEAVE_COLUMNS = list(LANGUAGES.keys()) + [CODE_NAME_COLUMN]
 
+    RELOAD_CHECK_INTERVAL = 5.0
+
     def __init__(
         self,
         xlsx_path: str,
@@ -49,17 +116,23 @@ class _LanguageDefinitions:
         init_session_if_not_exists: bool = True,
     ):
         """
-        Initialize the definition loader.
+        Initialize the definition loader. No language is loaded here.
 
         Parameters
         ----------
         xlsx_path: str
             Path to the XLSX file containing translation tables.
         """
-        self._translations = None
-        self._load_xlsx_file(xlsx_path=xlsx_path)
-
         self.xlsx_path = xlsx_path
+
+        self._load_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        # {language: _LanguageTable}, replaced as a whole (never mutated)
+        self._tables = {}
+        self._source_mtime_ns = LanguageCatalog.source_mtime_ns(xlsx_path)
+        self._next_reload_check = time.monotonic() + self.RELOAD_CHECK_INTERVAL
+        self._reloads = 0
+
         if init_session_if_not_exists:
             self._init_session_if_not_exists(actual_lang=actual_lang)
 
@@ -84,38 +157,125 @@ class _LanguageDefinitions:
         Raises
         ------
         KeyError
-            If ``code_name`` does not exist or the ``language`` column is absent.
+            If ``code_name`` does not exist or the ``language`` is not defined.
         """
-        if code_name not in self._translations:
+        lang_table = self.table_for_language(language)
+        if code_name not in lang_table:
             raise KeyError(
                 f"Code '{code_name}' not found in translation definitions."
             )
+        return f"{lang_table[code_name]}"
 
-        lang_map = self._translations[code_name]
-        if language not in lang_map:
-            raise KeyError(
-                f"Language '{language}' not defined for code '{code_name}'."
-            )
+    def table_for_language(self, language: str) -> dict:
+        """
+        Flat ``{code_name: text}`` table of the ``language``, with the
+        constant placeholders already resolved.
+
+        Raises
+        ------
+        KeyError
+            If the ``language`` is not defined.
+        """
+        return self._language_table(language).table
+
+    def template_for_language_code(
+        self, code_name: str, language: str
+    ) -> _MessageTemplate:
+        """
+        Compiled template of the translation, cached per
+        ``(code_name, language)``.
+        """
+        language_table = self._language_table(language)
+        template = language_table.templates.get(code_name)
+        if template is None:
+            if code_name not in language_table.table:
+                raise KeyError(
+                    f"Code '{code_name}' not found in translation definitions."
+                )
+            template = _MessageTemplate(language_table.table[code_name] or "")
+            language_table.templates[code_name] = template
+        return template
 
-        return f"{lang_map[language]}"
+    def loaded_languages(self) -> list:
+        return list(self._tables.keys())
 
-    def _load_xlsx_file(self, xlsx_path: str):
-        if self._translations is None:
-            self._translations = {}
+    def stats(self) -> dict:
+        tables = self._tables
+        return {
+            "loaded_languages": list(tables.keys()),
+            "codes": {_l: len(_t.table) for _l, _t in tables.items()},
+            "templates": {_l: len(_t.templates) for _l, _t in tables.items()},
+            "reloads": self._reloads,
+        }
 
-        df = pd.read_excel(xlsx_path, dtype=str)
-        for row in df.iterrows():
-            _cn = row[1][self.CODE_NAME_COLUMN]
-            if _cn is None:
-                # print(f"~ cannot find {self.CODE_NAME_COLUMN} in {row[1]}")
-                continue
+    def _language_table(self, language: str) -> _LanguageTable:
+        if time.monotonic() >= self._next_reload_check:
+            self._reload_if_changed()
 
-            self._translations[_cn] = {}
-            for _l in self.LANGUAGES.keys():
-                if _l not in row[1]:
-                    raise Exception(f"Cannot find {_l} translation in {row[0]}")
-                self._translations[_cn][_l] = row[1][_l]
-        return self._translations
+        language_table = self._tables.get(language)
+        if language_table is None:
+            language_table = self._load_language(language)
+        return language_table
+
+    def _load_language(self, language: str) -> _LanguageTable:
+        if language not in self.LANGUAGES:
+            raise KeyError(f"Language '{language}' not defined in translations.")
+
+        with self._load_lock:
+            # Another session might have loaded it in the meantime
+            language_table = self._tables.get(language)
+            if language_table is None:
+                language_table = self._read_language(language)
+                self._tables = dict(self._tables, **{language: language_table})
+        return language_table
+
+    def _reload_if_changed(self) -> None:
+        # A single thread checks the file, the others go on with the
+        # current tables instead of waiting
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_reload_check = time.monotonic() + self.RELOAD_CHECK_INTERVAL
+            mtime_ns = LanguageCatalog.source_mtime_ns(self.xlsx_path)
+            if mtime_ns is None or mtime_ns == self._source_mtime_ns:
+                return
+
+            # Remembered before reading, a half-saved file is not parsed
+            # again until it changes once more
+            self._source_mtime_ns = mtime_ns
+            with self._load_lock:
+                try:
+                    new_tables = {
+                        _l: self._read_language(_l) for _l in self._tables.keys()
+                    }
+                except Exception:
+                    # Keep serving the previous tables
+                    return
+                self._tables = new_tables
+                self._reloads += 1
+        finally:
+            self._reload_lock.release()
+
+    def _read_language(self, language: str) -> _LanguageTable:
+        translations = LanguageCatalog.load(
+            xlsx_path=self.xlsx_path,
+            language=language,
+            languages=list(self.LANGUAGES.keys()),
+            code_name_column=self.CODE_NAME_COLUMN,
+        )
+        return _LanguageTable(
+            language=language, table=self._prepare_language_table(translations)
+        )
+
+    @staticmethod
+    def _prepare_language_table(translations: dict) -> dict:
+        table = {}
+        for _cn, _str in translations.items():
+            if _str is not None and len(_str):
+                for _f, _t in REPLACE_FOR_TRANSLATIONS.items():
+                    _str = _str.replace(_f, _t)
+            table[_cn] = _str
+        return table
 
     @staticmethod
     def _init_session_if_not_exists(actual_lang: Optional[str] = None):
@@ -130,6 +290,13 @@ class _LanguageDefinitions:
             )
 
 
+class _TranslationsCounter:
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+
 class LanguageTranslator:
     SessionConfig.init_session_state_if_needed()
     lang_def = _LanguageDefinitions(
@@ -138,14 +305,67 @@ class LanguageTranslator:
         init_session_if_not_exists=True,
     )
 
+    # Counter of the rerun executed by the current script thread
+    _rerun_local = threading.local()
+
     @staticmethod
     def translate(code_name: str):
         language = SessionConfig.get_session_ui_language() or DEFAULT_LANGUAGE
-        _str = LanguageTranslator.lang_def.get_text_for_language_code(
+        counter = getattr(LanguageTranslator._rerun_local, "counter", None)
+        if counter is not None:
+            counter.count += 1
+
+        lang_table = LanguageTranslator.lang_def.table_for_language(language)
+        try:
+            return lang_table[code_name]
+        except KeyError:
+            raise KeyError(
+                f"Code '{code_name}' not found in translation definitions."
+            ) from None
+
+    @staticmethod
+    def format(code_name: str, values: dict | None = None, **kwargs) -> str:
+        """
+        Translate ``code_name`` and fill its ``{placeholder}`` fields in one
+        pass. Simple names can be given as keyword arguments, expression-like
+        ones through ``values``, e.g.::
+
+            LanguageTranslator.format(
+                "news_browser_sim_day_title",
+                values={"len(similarities)": len(similarities)},
+                day_str=day_str,
+            )
+
+        Values are converted with ``str``.
+        """
+        language = SessionConfig.get_session_ui_language() or DEFAULT_LANGUAGE
+        counter = getattr(LanguageTranslator._rerun_local, "counter", None)
+        if counter is not None:
+            counter.count += 1
+
+        template = LanguageTranslator.lang_def.template_for_language_code(
             code_name=code_name, language=language
         )
-        if _str is None or not len(_str):
-            return _str
-        for _f, _t in REPLACE_FOR_TRANSLATIONS.items():
-            _str = _str.replace(_f, _t)
-        return _str
+        if values is not None:
+            kwargs = dict(values, **kwargs)
+        return template.render(kwargs)
+
+    @staticmethod
+    def start_rerun_counter() -> int:
+        """
+        Start counting the translations of the current rerun of the session.
+        Returns the number of translations made by the previous rerun.
+        """
+        previous_counter = SessionConfig.get_session_translations_counter()
+        counter = _TranslationsCounter()
+        SessionConfig.set_session_translations_counter(counter)
+        LanguageTranslator._rerun_local.counter = counter
+        return 0 if previous_counter is None else previous_counter.count
+
+    @staticmethod
+    def translations_count() -> int:
+        """
+        Number of translations made so far by the current rerun.
+        """
+        counter = getattr(LanguageTranslator._rerun_local, "counter", None)
+        return 0 if counter is None else counter.count
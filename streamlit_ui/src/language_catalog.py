@@ -0,0 +1,237 @@
+"""
+Compiled translation catalogs.
+
+Parsing ``ui_lang_def.xlsx`` needs pandas and openpyxl and takes a noticeable
+part of every cold start. The XLSX is therefore compiled once into compact
+JSON catalogs, one per language (``ui_lang_def.<language>.catalog.json``,
+next to the XLSX), so a process loads only the languages its sessions use:
+
+    {
+        "version": 2,
+        "source": {"mtime_ns": ..., "size": ..., "sha256": "..."},
+        "language": "pl",
+        "translations": {"code1": "tekst PL", "code2": "...", ...}
+    }
+
+:meth:`LanguageCatalog.load` returns the translations of a single language
+from its catalog while it matches the XLSX. The catalog is valid when the
+mtime and size of the XLSX are the same as recorded. Otherwise the sha256 of
+the XLSX is compared (a touched but unchanged file does not force a rebuild).
+A stale or missing catalog is rebuilt from the XLSX, together with the
+catalogs of all other languages (the XLSX is parsed once for all of them).
+
+Build (or rebuild) the catalogs, e.g. during the deployment:
+
+    python -m src.language_catalog [--force]
+"""
+
+import os
+import json
+import hashlib
+import argparse
+import tempfile
+
+
+class LanguageCatalog:
+    CATALOG_VERSION = 2
+    CATALOG_SUFFIX = ".catalog.json"
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    @staticmethod
+    def catalog_path_for(xlsx_path: str, language: str) -> str:
+        return (
+            f"{os.path.splitext(xlsx_path)[0]}.{language}"
+            f"{LanguageCatalog.CATALOG_SUFFIX}"
+        )
+
+    @staticmethod
+    def source_mtime_ns(xlsx_path: str) -> int | None:
+        """
+        Modification time of the XLSX, ``None`` when the file does not
+        exist (deployed with the catalogs only).
+        """
+        try:
+            return os.stat(xlsx_path).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def load(
+        cls,
+        xlsx_path: str,
+        language: str,
+        languages: list,
+        code_name_column: str,
+    ) -> dict:
+        """
+        Translations ``{code: text}`` of the ``language`` from its catalog.
+        When the catalog is stale, the catalogs of all ``languages`` are
+        rebuilt.
+        """
+        catalog = cls._read_catalog(cls.catalog_path_for(xlsx_path, language))
+        if catalog is not None and cls._is_valid(catalog, xlsx_path, language):
+            return catalog["translations"]
+
+        translations = cls.compile(
+            xlsx_path=xlsx_path,
+            languages=languages,
+            code_name_column=code_name_column,
+        )
+        if language not in translations:
+            raise KeyError(f"Language '{language}' not defined in translations.")
+        return translations[language]
+
+    @classmethod
+    def compile(
+        cls,
+        xlsx_path: str,
+        languages: list,
+        code_name_column: str,
+    ) -> dict:
+        """
+        Parse the XLSX, write the catalog of every language and return the
+        translations ``{language: {code: text}}``. A catalog which cannot
+        be written (read-only resources) is not an error, the translations
+        are returned anyway.
+        """
+        source_info = cls._source_info(xlsx_path=xlsx_path, with_hash=True)
+        translations = cls._parse_xlsx(
+            xlsx_path=xlsx_path,
+            languages=languages,
+            code_name_column=code_name_column,
+        )
+        for language, lang_translations in translations.items():
+            try:
+                cls._write_catalog(
+                    cls.catalog_path_for(xlsx_path, language),
+                    {
+                        "version": cls.CATALOG_VERSION,
+                        "source": source_info,
+                        "language": language,
+                        "translations": lang_translations,
+                    },
+                )
+            except OSError:
+                pass
+        return translations
+
+    @classmethod
+    def _is_valid(cls, catalog: dict, xlsx_path: str, language: str) -> bool:
+        if catalog.get("version") != cls.CATALOG_VERSION:
+            return False
+        if catalog.get("language") != language:
+            return False
+        if not os.path.exists(xlsx_path):
+            # Deployed without the source file, the catalog is all we have
+            return True
+
+        recorded = catalog.get("source", {})
+        current = cls._source_info(xlsx_path=xlsx_path, with_hash=False)
+        if (
+            recorded.get("mtime_ns") == current["mtime_ns"]
+            and recorded.get("size") == current["size"]
+        ):
+            return True
+        return recorded.get("sha256") == cls._file_sha256(xlsx_path)
+
+    @classmethod
+    def _source_info(cls, xlsx_path: str, with_hash: bool) -> dict:
+        stat = os.stat(xlsx_path)
+        source_info = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        if with_hash:
+            source_info["sha256"] = cls._file_sha256(xlsx_path)
+        return source_info
+
+    @classmethod
+    def _file_sha256(cls, path: str) -> str:
+        file_hash = hashlib.sha256()
+        with open(path, "rb") as f_in:
+            for chunk in iter(lambda: f_in.read(cls.HASH_CHUNK_SIZE), b""):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    @staticmethod
+    def _read_catalog(catalog_path: str) -> dict | None:
+        try:
+            with open(catalog_path, "rt", encoding="utf-8") as json_in:
+                return json.load(json_in)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_catalog(catalog_path: str, catalog: dict) -> None:
+        # Written to a temporary file and renamed, so the concurrently
+        # starting processes never read a half-written catalog
+        catalog_dir = os.path.dirname(os.path.abspath(catalog_path))
+        fd, tmp_path = tempfile.mkstemp(
+            dir=catalog_dir, prefix=".catalog-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wt", encoding="utf-8") as json_out:
+                json.dump(
+                    catalog, json_out, ensure_ascii=False, separators=(",", ":")
+                )
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, catalog_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _parse_xlsx(xlsx_path: str, languages: list, code_name_column: str) -> dict:
+        # pandas (and openpyxl) are needed only to rebuild the catalog
+        import pandas as pd
+
+        translations = {_l: {} for _l in languages}
+        df = pd.read_excel(xlsx_path, dtype=str)
+        for row in df.iterrows():
+            _cn = row[1][code_name_column]
+            if _cn is None or pd.isna(_cn):
+                continue
+
+            for _l in languages:
+                if _l not in row[1]:
+                    raise Exception(f"Cannot find {_l} translation in {row[0]}")
+                _text = row[1][_l]
+                translations[_l][_cn] = None if pd.isna(_text) else _text
+        return translations
+
+
+def main(argv=None):
+    from src.constants import UI_LANG_DEFAULT_DEFINITION_FILE
+    from src.language import _LanguageDefinitions
+
+    parser = argparse.ArgumentParser(description="Build the translation catalog")
+    parser.add_argument("--xlsx", default=UI_LANG_DEFAULT_DEFINITION_FILE)
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild even if the catalog is valid"
+    )
+    args = parser.parse_args(argv)
+
+    languages = list(_LanguageDefinitions.LANGUAGES.keys())
+    if args.force:
+        translations = LanguageCatalog.compile(
+            xlsx_path=args.xlsx,
+            languages=languages,
+            code_name_column=_LanguageDefinitions.CODE_NAME_COLUMN,
+        )
+    else:
+        translations = {
+            _l: LanguageCatalog.load(
+                xlsx_path=args.xlsx,
+                language=_l,
+                languages=languages,
+                code_name_column=_LanguageDefinitions.CODE_NAME_COLUMN,
+            )
+            for _l in languages
+        }
+    for _l, lang_translations in translations.items():
+        print(
+            f"{LanguageCatalog.catalog_path_for(args.xlsx, _l)}: "
+            f"{len(lang_translations)} translation codes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,6 @@
 import datetime
 
-import pandas as pd
 import streamlit as st
-import plotly.express as px
 
 from src.language import LanguageTranslator
 
@@ -35,13 +33,17 @@ def add_info_to_selected_proposition(info: dict):
 
     i_cl = info["clustering"]
     general_info_cont.info(
-        LanguageTranslator.translate(code_name="news_browser_description_cont")
-        .replace("{info['day_to_summary']}", info["day_to_summary"])
-        .replace("{info['when_generated']}", info["when_generated"])
-        .replace("{i_cl['clustering_method']}", i_cl["clustering_method"])
-        .replace("{i_cl['reducer_method']}", i_cl["reducer_method"])
-        .replace("{i_cl['reducer_optimizer']}", i_cl["reducer_optimizer"])
-        .replace("{i_cl['genai_labels_model']}", i_cl["genai_labels_model"])
+        LanguageTranslator.format(
+            code_name="news_browser_description_cont",
+            values={
+                "info['day_to_summary']": info["day_to_summary"],
+                "info['when_generated']": info["when_generated"],
+                "i_cl['clustering_method']": i_cl["clustering_method"],
+                "i_cl['reducer_method']": i_cl["reducer_method"],
+                "i_cl['reducer_optimizer']": i_cl["reducer_optimizer"],
+                "i_cl['genai_labels_model']": i_cl["genai_labels_model"],
+            },
+        )
     )
 
 
@@ -50,10 +52,15 @@ def add_info_to_selected_proposition(info: dict):
     width="large",
 )
 def show_similar_day(day_str, similarities):
+    # pandas is loaded only when a dataframe is built
+    import pandas as pd
+
     st.title(
-        LanguageTranslator.translate(code_name="news_browser_sim_day_title")
-        .replace("{day_str}", day_str)
-        .replace("{len(similarities)}", str(len(similarities)))
+        LanguageTranslator.format(
+            code_name="news_browser_sim_day_title",
+            values={"len(similarities)": len(similarities)},
+            day_str=day_str,
+        )
     )
 
     for sim_article in similarities:
@@ -76,9 +83,11 @@ def show_similar_day(day_str, similarities):
             )
         )
         sim_art_short_exp.write(
-            LanguageTranslator.translate(code_name="news_browser_similarity")
-            .replace("{similarity_metric}", similarity_metric)
-            .replace("{similarity_value}", str(similarity_value))
+            LanguageTranslator.format(
+                code_name="news_browser_similarity",
+                similarity_metric=similarity_metric,
+                similarity_value=similarity_value,
+            )
         )
 
         sim_art_short_exp.data_editor(
@@ -116,9 +125,9 @@ def handle_similar_prev_next(cluster, container):
     date2btn = {}
     for date_sim, sim_at_day in similarities.items():
         date2btn[date_sim] = days_exp.button(
-            LanguageTranslator.translate(
-                code_name="news_browser_similar_information_day"
-            ).replace("{date_sim}", date_sim),
+            LanguageTranslator.format(
+                code_name="news_browser_similar_information_day", date_sim=date_sim
+            ),
             key=f"k_{date_sim}",
         )
 
@@ -137,6 +146,10 @@ def add_single_cluster_stats(
     cluster_label_str: str,
     day: datetime.date,
 ):
+    # pandas and plotly are loaded only when the stats are shown
+    import pandas as pd
+    import plotly.express as px
+
     stats = cluster["stats"]
     news_urls = cluster["news_urls"]
     sample_news_urls = cluster["sample"]["news_urls"]
@@ -151,13 +164,17 @@ def add_single_cluster_stats(
     )
 
     stats_container.markdown(
-        LanguageTranslator.translate(code_name="news_browser_stats_info_body")
-        .replace("{cluster_label_str}", cluster_label_str)
-        .replace("{day}", str(day))
-        .replace("{num_of_all_texts}", str(num_of_all_texts))
-        .replace("{stats['num_of_texts']}", str(stats["num_of_texts"]))
-        .replace("{len(sample_news_urls)}", str(len(sample_news_urls)))
-        .replace("{stats['pli_value']}", str(stats["pli_value"]))
+        LanguageTranslator.format(
+            code_name="news_browser_stats_info_body",
+            values={
+                "stats['num_of_texts']": stats["num_of_texts"],
+                "len(sample_news_urls)": len(sample_news_urls),
+                "stats['pli_value']": stats["pli_value"],
+            },
+            cluster_label_str=cluster_label_str,
+            day=day,
+            num_of_all_texts=num_of_all_texts,
+        )
     )
 
     web_authors_tab, pol_3c_tab, sites_tab = stats_container.tabs(
@@ -0,0 +1,31 @@
+"""
+Ordering of the news lists by the generation date.
+
+The news stream shows only the ``number_of_news`` newest news of a category
+(the oldest of them first when selected). ``when_generated`` is an ISO date,
+the strings are compared as they are.
+
+A list holds the news of a single category (at most 150), at this size
+a plain sort is faster than a ``heapq`` top-K selection.
+"""
+
+import operator
+
+news_date_key = operator.itemgetter("when_generated")
+
+
+def newest_news(
+    news_list: list, number_of_news: int, oldest_first: bool = False
+) -> list:
+    """
+    The ``number_of_news`` newest news of the ``news_list``, the newest
+    first (the oldest first when ``oldest_first``). News with the same
+    date keep the order of the backend.
+    """
+    if not number_of_news or number_of_news < 1:
+        return []
+
+    newest = sorted(news_list, key=news_date_key, reverse=True)[:number_of_news]
+    if oldest_first:
+        newest.sort(key=news_date_key)
+    return newest
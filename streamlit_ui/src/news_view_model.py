@@ -0,0 +1,100 @@
+"""
+View models of the news stream.
+
+A news payload is converted once into a compact :class:`NewsRecord` with
+everything the renderer needs already prepared (display date, icons, the
+shortened text, admin messages). The records are shared by all sessions of
+the process in :class:`NewsRecordCache`, keyed by the news id and the UI
+language (the admin messages are translated).
+"""
+
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class NewsRecord:
+    news_id: int
+    # The record is rebuilt when the news changes (see revision_of)
+    revision: tuple
+    when_generated: str | None
+    user_news_text: str
+    # Whole text, only when longer than user_news_text
+    full_news_text: str | None
+    polarity_icon: str
+    news_language_icon: str
+    main_page_language_icon: str
+    news_url: str
+    num_of_generated_news: int
+    model_name: str
+    generation_time: str
+    sim_to_original_article: float | None
+    # ((type, text), ...), empty when admin messages are not shown
+    admin_messages: tuple
+
+    @staticmethod
+    def revision_of(news: dict) -> tuple:
+        # A regenerated news gets a new date, the admin message can be hidden
+        return news["when_generated"], news["show_admin_message"]
+
+
+class NewsRecordCache:
+    MAX_ENTRIES = 4096
+
+    _lock = threading.Lock()
+    _records = OrderedDict()
+    _counters = {"hits": 0, "misses": 0, "rebuilt": 0, "evictions": 0}
+
+    @classmethod
+    def get_or_build_many(cls, news_list: list, language: str, build_many) -> list:
+        """
+        Records of all news of the ``news_list`` (in the same order), the not
+        cached or changed ones are prepared at once by ``build_many(news)``.
+        """
+        records = [None] * len(news_list)
+        to_build = []
+        with cls._lock:
+            for idx, news in enumerate(news_list):
+                key = (news["id"], language)
+                record = cls._records.get(key)
+                if record is not None and record.revision == (
+                    NewsRecord.revision_of(news)
+                ):
+                    cls._records.move_to_end(key)
+                    cls._counters["hits"] += 1
+                    records[idx] = record
+                    continue
+                cls._counters["misses" if record is None else "rebuilt"] += 1
+                to_build.append(idx)
+
+        if not len(to_build):
+            return records
+
+        # Built outside the lock, two sessions may build the same records
+        built = build_many([news_list[_i] for _i in to_build])
+        with cls._lock:
+            for idx, record in zip(to_build, built):
+                records[idx] = record
+                key = (record.news_id, language)
+                cls._records[key] = record
+                cls._records.move_to_end(key)
+            while len(cls._records) > cls.MAX_ENTRIES:
+                cls._records.popitem(last=False)
+                cls._counters["evictions"] += 1
+        return records
+
+    @classmethod
+    def clear(cls) -> int:
+        with cls._lock:
+            removed = len(cls._records)
+            cls._records.clear()
+        return removed
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            stats = dict(cls._counters)
+            stats["entries"] = len(cls._records)
+        return stats
@@ -1,38 +1,20 @@
-import json
-
 import streamlit as st
 
 from typing import Optional
 
+from src.session_model import AuthSession, ChatSession, UiSession, session_memory
+
 
 class SessionConfig:
-    FREE_CHAT = "free_chat"
-    FREE_CHAT_ID = "free_chat_id"
-    FREE_CHAT_IS_RO = "free_chat_is_read_only"
-    FREE_CHAT_CHAT_HASH = "free_chat_hash"
-
-    AUTHENTICATED_USER = "authenticated_user"
-    AUTHENTICATED_USER_INFO = "authenticated_user_info"
-    AUTHENTICATION_URL = "authentication_url"
-    AUTHENTICATION_STATE = "authentication_state"
-    AUTHENTICATION_TOKEN = "authentication_token"
-    AUTHENTICATION_TOKEN_FULL_INFO = "authentication_token_full_info"
-
-    SELECTED_UI_LANGUAGE = "selected_ui_language"
-
-    ALL_SESSION_VALUES = [
-        FREE_CHAT,
-        FREE_CHAT_ID,
-        FREE_CHAT_CHAT_HASH,
-        FREE_CHAT_IS_RO,
-        AUTHENTICATED_USER,
-        AUTHENTICATED_USER_INFO,
-        AUTHENTICATION_URL,
-        AUTHENTICATION_STATE,
-        AUTHENTICATION_TOKEN,
-        AUTHENTICATION_TOKEN_FULL_INFO,
-        SELECTED_UI_LANGUAGE,
-    ]
+    AUTH_SESSION = "auth_session"
+    CHAT_SESSION = "chat_session"
+    UI_SESSION = "ui_session"
+
+    ALL_SESSION_VALUES = {
+        AUTH_SESSION: AuthSession,
+        CHAT_SESSION: ChatSession,
+        UI_SESSION: UiSession,
+    }
 
     @staticmethod
     def __return__value__(ret_value):
@@ -44,108 +26,164 @@ class SessionConfig:
 
     @staticmethod
     def init_session_state_if_needed(reset_state: bool = False):
-        for session_variable in SessionConfig.ALL_SESSION_VALUES:
-            if reset_state:
-                st.session_state[session_variable] = None
-            else:
-                if session_variable in st.session_state:
-                    continue
-                st.session_state[session_variable] = None
+        for session_variable, model in SessionConfig.ALL_SESSION_VALUES.items():
+            if reset_state or session_variable not in st.session_state:
+                st.session_state[session_variable] = model()
+
+    @staticmethod
+    def auth_session() -> AuthSession:
+        return SessionConfig._session_model(SessionConfig.AUTH_SESSION)
+
+    @staticmethod
+    def chat_session() -> ChatSession:
+        return SessionConfig._session_model(SessionConfig.CHAT_SESSION)
+
+    @staticmethod
+    def ui_session() -> UiSession:
+        return SessionConfig._session_model(SessionConfig.UI_SESSION)
+
+    @staticmethod
+    def _session_model(session_variable: str):
+        model = st.session_state.get(session_variable, None)
+        if model is None:
+            model = SessionConfig.ALL_SESSION_VALUES[session_variable]()
+            st.session_state[session_variable] = model
+        return model
+
+    @staticmethod
+    def memory_usage():
+        """
+        Memory used by the current session (see :func:`session_memory`).
+        """
+        return session_memory(st.session_state)
 
     @staticmethod
     def set_session_ui_language(language: Optional[str]):
-        st.session_state[SessionConfig.SELECTED_UI_LANGUAGE] = language
+        SessionConfig.ui_session().language = language
 
     @staticmethod
     def get_session_ui_language():
-        if SessionConfig.SELECTED_UI_LANGUAGE not in st.session_state:
-            return None
+        return SessionConfig.__return__value__(
+            ret_value=SessionConfig.ui_session().language
+        )
+
+    @staticmethod
+    def set_session_admin_settings_id(settings_id):
+        SessionConfig.ui_session().admin_settings_id = settings_id
 
+    @staticmethod
+    def get_session_admin_settings_id():
+        settings_id = SessionConfig.ui_session().admin_settings_id
+        return SessionConfig.__return__value__(settings_id)
+
+    @staticmethod
+    def set_session_translations_counter(counter):
+        SessionConfig.ui_session().translations_counter = counter
+
+    @staticmethod
+    def get_session_translations_counter():
+        return SessionConfig.ui_session().translations_counter
+
+    @staticmethod
+    def set_session_news_stream_shown(category: str, shown: int):
+        ui_session = SessionConfig.ui_session()
+        if ui_session.news_stream_shown is None:
+            ui_session.news_stream_shown = {}
+        ui_session.news_stream_shown[category] = shown
+
+    @staticmethod
+    def get_session_news_stream_shown(category: str) -> int | None:
+        return (SessionConfig.ui_session().news_stream_shown or {}).get(category)
+
+    @staticmethod
+    def reset_session_news_stream_shown():
+        SessionConfig.ui_session().news_stream_shown = None
+
+    @staticmethod
+    def set_session_news_stream_category(category: str | None):
+        SessionConfig.ui_session().news_stream_category = category
+
+    @staticmethod
+    def get_session_news_stream_category():
         return SessionConfig.__return__value__(
-            ret_value=st.session_state[SessionConfig.SELECTED_UI_LANGUAGE]
+            SessionConfig.ui_session().news_stream_category
         )
 
     @staticmethod
     def set_session_free_chat_chat_id(
         chat: list | None, chat_id: str | None, is_chat_read_only: bool = False
     ):
-        st.session_state[SessionConfig.FREE_CHAT] = chat
-        st.session_state[SessionConfig.FREE_CHAT_ID] = chat_id
-        st.session_state[SessionConfig.FREE_CHAT_IS_RO] = is_chat_read_only
+        chat_session = SessionConfig.chat_session()
+        chat_session.set_history(chat)
+        chat_session.chat_id = chat_id
+        chat_session.is_read_only = is_chat_read_only
 
     @staticmethod
     def set_session_authenticated_user(username: str | None):
-        st.session_state[SessionConfig.AUTHENTICATED_USER] = username
+        SessionConfig.auth_session().user = username
 
     @staticmethod
     def get_session_authenticated_user():
-        username = st.session_state[SessionConfig.AUTHENTICATED_USER]
+        username = SessionConfig.auth_session().user
         return SessionConfig.__return__value__(username)
 
     @staticmethod
     def set_session_auth_url(auth_url: str | None):
-        st.session_state[SessionConfig.AUTHENTICATION_URL] = auth_url
+        SessionConfig.auth_session().url = auth_url
 
     @staticmethod
     def set_session_auth_token(auth_token: str | None):
-        st.session_state[SessionConfig.AUTHENTICATION_TOKEN] = auth_token
+        SessionConfig.auth_session().token = auth_token
 
     @staticmethod
     def get_session_auth_token():
-        a_token = st.session_state.get(SessionConfig.AUTHENTICATION_TOKEN, None)
+        a_token = SessionConfig.auth_session().token
         return SessionConfig.__return__value__(a_token)
 
     @staticmethod
     def set_session_auth_token_full_response(full_info: dict | None):
-        if full_info is not None:
-            full_info = json.dumps(full_info)
-        st.session_state[SessionConfig.AUTHENTICATION_TOKEN_FULL_INFO] = full_info
+        SessionConfig.auth_session().token_info = full_info
 
     @staticmethod
     def get_session_auth_token_full_info():
-        full_info = st.session_state[SessionConfig.AUTHENTICATION_TOKEN_FULL_INFO]
-        if full_info is not None and len(full_info):
-            full_info = json.loads(full_info)
-        return full_info
+        return SessionConfig.auth_session().token_info
 
     @staticmethod
     def get_session_auth_url():
-        a_url = st.session_state[SessionConfig.AUTHENTICATION_URL]
+        a_url = SessionConfig.auth_session().url
         return SessionConfig.__return__value__(a_url)
 
     # AUTHENTICATION_STATE
     @staticmethod
     def set_session_auth_state_params(auth_state: dict | None):
-        auth_state = json.dumps(auth_state)
-        st.session_state[SessionConfig.AUTHENTICATION_STATE] = auth_state
+        SessionConfig.auth_session().state_params = auth_state
 
     @staticmethod
     def get_session_auth_state_params():
-        a_state = st.session_state[SessionConfig.AUTHENTICATION_STATE]
-        if a_state is not None and len(a_state):
-            a_state = json.loads(a_state)
-        return SessionConfig.__return__value__(a_state)
+        return SessionConfig.__return__value__(
+            SessionConfig.auth_session().state_params
+        )
 
     @staticmethod
     def set_session_free_chat_hash(chat_hash: str | None):
-        st.session_state[SessionConfig.FREE_CHAT_CHAT_HASH] = chat_hash
+        SessionConfig.chat_session().chat_hash = chat_hash
 
     @staticmethod
     def get_session_free_chat_hash():
-        chat = st.session_state[SessionConfig.FREE_CHAT_CHAT_HASH]
+        chat = SessionConfig.chat_session().chat_hash
         return SessionConfig.__return__value__(chat)
 
     @staticmethod
     def get_session_free_chat_is_read_only():
-        chat = st.session_state[SessionConfig.FREE_CHAT_IS_RO]
+        chat = SessionConfig.chat_session().is_read_only
         return SessionConfig.__return__value__(chat)
 
     @staticmethod
     def get_session_free_chat():
-        chat = st.session_state[SessionConfig.FREE_CHAT]
+        chat = SessionConfig.chat_session().history
         return SessionConfig.__return__value__(chat)
 
     @staticmethod
     def get_session_free_chat_id():
-        chat_id = st.session_state[SessionConfig.FREE_CHAT_ID]
+        chat_id = SessionConfig.chat_session().chat_id
         return SessionConfig.__return__value__(chat_id)
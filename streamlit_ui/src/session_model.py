@@ -0,0 +1,92 @@
+"""
+Typed model of the user session.
+
+Each group of values is a single slotted dataclass stored natively in
+``st.session_state`` (see :class:`src.session_config.SessionConfig`), so
+reading a value is an attribute access, not a JSON decode, and every group
+costs one small object instead of a dict entry per value.
+"""
+
+import sys
+
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class AuthSession:
+    user: str | None = None
+    user_info: dict | None = None
+    url: str | None = None
+    state_params: dict | None = None
+    token: str | None = None
+    token_info: dict | None = None
+
+
+@dataclass(slots=True)
+class ChatSession:
+    # Whole conversation is kept by the backend (``chat_id``), the session
+    # keeps only the last turns shown in the chat window
+    MAX_HISTORY = 50
+
+    history: deque | None = None
+    chat_id: str | None = None
+    is_read_only: bool = False
+    chat_hash: str | None = None
+
+    def set_history(self, history) -> None:
+        self.history = (
+            None if history is None else deque(history, maxlen=self.MAX_HISTORY)
+        )
+
+
+@dataclass(slots=True)
+class UiSession:
+    language: str | None = None
+    admin_settings_id: int | None = None
+    translations_counter: object = None
+    # Number of the rendered news per category of the news stream
+    news_stream_shown: dict | None = None
+    news_stream_category: str | None = None
+
+
+def deep_sizeof(value, seen: set | None = None) -> int:
+    """
+    Approximate memory used by the ``value`` and all objects it refers to
+    (containers, dataclass slots and instance attributes). Objects shared
+    within one measurement are counted once.
+    """
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if type(value) in [str, bytes, int, float, bool] or value is None:
+        return size
+    if type(value) in [dict]:
+        return size + sum(
+            deep_sizeof(_k, seen) + deep_sizeof(_v, seen) for _k, _v in value.items()
+        )
+    if type(value) in [list, tuple, set, frozenset, deque]:
+        return size + sum(deep_sizeof(_v, seen) for _v in value)
+
+    for slot in getattr(type(value), "__slots__", ()):
+        if hasattr(value, slot):
+            size += deep_sizeof(getattr(value, slot), seen)
+    if hasattr(value, "__dict__"):
+        size += deep_sizeof(vars(value), seen)
+    return size
+
+
+def session_memory(session_state) -> dict:
+    """
+    Memory used by the values of a single session:
+    ``{"total_bytes": int, "by_key": {key: bytes}}`` (the largest first).
+    """
+    seen = set()
+    by_key = {}
+    for key in list(session_state.keys()):
+        by_key[key] = deep_sizeof(key, seen) + deep_sizeof(session_state[key], seen)
+    by_key = dict(sorted(by_key.items(), key=lambda _i: _i[1], reverse=True))
+    return {"total_bytes": sum(by_key.values()), "by_key": by_key}
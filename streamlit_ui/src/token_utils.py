@@ -1,10 +1,28 @@
 import time
 import base64
 import json
+import hashlib
+import threading
+
+from collections import OrderedDict
 from typing import Any, Dict, Optional, Tuple
 
 
 class TokenValidator:
+    """
+    Successfully validated tokens are cached process-wide, keyed by the
+    sha256 of the token: the next validation of the same token only compares
+    its ``exp`` with the clock. Expired entries are evicted, the cache keeps
+    at most ``CACHE_MAX_ENTRIES`` tokens (least recently used are dropped).
+    The cached header and payload are shared, callers must not modify them.
+    """
+
+    CACHE_MAX_ENTRIES = 1024
+
+    _cache_lock = threading.Lock()
+    _cache = OrderedDict()
+    _cache_counters = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
     def __init__(self, token_str: Optional[str] = None):
         self.token_str = token_str
 
@@ -52,6 +70,11 @@ class TokenValidator:
                 "header": None,
             }
 
+        token_hash = hashlib.sha256(candidate.encode("utf-8")).hexdigest()
+        cached = self._cached_token(token_hash)
+        if cached is not None:
+            return cached
+
         header, payload = self._decode_jwt_parts(candidate)
         if header is None or payload is None:
             return {
@@ -69,6 +92,42 @@ class TokenValidator:
                 "header": header,
             }
 
+        self._cache_token(token_hash, header=header, payload=payload)
+        return {
+            "is_valid": True,
+            "error": None,
+            "payload": payload,
+            "header": header,
+        }
+
+    @classmethod
+    def cache_stats(cls) -> dict:
+        with cls._cache_lock:
+            stats = dict(cls._cache_counters)
+            stats["entries"] = len(cls._cache)
+        return stats
+
+    @classmethod
+    def _cached_token(cls, token_hash: str) -> Optional[Dict[str, Any]]:
+        with cls._cache_lock:
+            entry = cls._cache.get(token_hash)
+            if entry is None:
+                cls._cache_counters["misses"] += 1
+                return None
+
+            header, payload, exp = entry
+            if exp <= int(time.time()):
+                del cls._cache[token_hash]
+                cls._cache_counters["expired"] += 1
+                return {
+                    "is_valid": False,
+                    "error": "Token expired!",
+                    "payload": payload,
+                    "header": header,
+                }
+
+            cls._cache.move_to_end(token_hash)
+            cls._cache_counters["hits"] += 1
         return {
             "is_valid": True,
             "error": None,
@@ -76,6 +135,23 @@ class TokenValidator:
             "header": header,
         }
 
+    @classmethod
+    def _cache_token(cls, token_hash: str, header: dict, payload: dict) -> None:
+        with cls._cache_lock:
+            cls._cache[token_hash] = (header, payload, payload["exp"])
+            if len(cls._cache) <= cls.CACHE_MAX_ENTRIES:
+                return
+
+            now = int(time.time())
+            for expired_hash in [
+                _h for _h, (_, _, _exp) in cls._cache.items() if _exp <= now
+            ]:
+                del cls._cache[expired_hash]
+                cls._cache_counters["expired"] += 1
+            while len(cls._cache) > cls.CACHE_MAX_ENTRIES:
+                cls._cache.popitem(last=False)
+                cls._cache_counters["evictions"] += 1
+
     @staticmethod
     def _token_valid_exp(token_info: dict) -> bool:
         """
@@ -117,3 +193,132 @@ class TokenValidator:
             return header, payload
         except Exception:
             return None, None
+
+
+class _RefreshCall:
+    __slots__ = ("event", "result")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+
+
+class TokenManager:
+    """
+    Refreshes the authorization token ahead of its ``exp`` claim, so the
+    authorized calls do not get 401 and retry after the token expired.
+
+    A session has its own refresh token, the refresh is single-flight per
+    refresh token: concurrent calls of the session wait for the one refresh
+    in flight and all of them get the new token. The new token info is also
+    remembered (``MAX_REFRESHED`` latest refreshes), so a call which still
+    holds the replaced token info (read before the refresh) gets the new
+    one without refreshing again.
+    """
+
+    REFRESH_AHEAD_SECONDS = 60
+    MAX_REFRESHED = 256
+
+    _lock = threading.Lock()
+    _in_flight = {}
+    _refreshed = OrderedDict()
+    _counters = {
+        "checks": 0,
+        "refreshes": 0,
+        "failed_refreshes": 0,
+        "coalesced_refreshes": 0,
+        "reused_refreshes": 0,
+    }
+
+    @classmethod
+    def fresh_token_info(
+        cls, token_info: dict | None, auth_api, force: bool = False
+    ) -> dict | None:
+        """
+        Token info whose token is valid for at least ``REFRESH_AHEAD_SECONDS``
+        (refreshed with ``auth_api`` when needed, ``force`` refreshes anyway).
+        When the token cannot be refreshed, the ``token_info`` is returned.
+        """
+        if token_info is None or "refresh_token" not in token_info:
+            return token_info
+
+        with cls._lock:
+            cls._counters["checks"] += 1
+            refresh_key = cls._refresh_key(token_info)
+            newer_token_info = cls._refreshed.get(refresh_key)
+            while newer_token_info is not None and newer_token_info.get(
+                "token"
+            ) != token_info.get("token"):
+                # Already refreshed by another call, a newer token is used
+                cls._counters["reused_refreshes"] += 1
+                token_info, force = newer_token_info, False
+                newer_refresh_key = cls._refresh_key(token_info)
+                if newer_refresh_key == refresh_key:
+                    # The refresh token is not rotated
+                    break
+                refresh_key = newer_refresh_key
+                newer_token_info = cls._refreshed.get(refresh_key)
+
+        if not force and not cls.expires_soon(token_info):
+            return token_info
+        return cls._refresh(token_info, auth_api)
+
+    @classmethod
+    def expires_soon(cls, token_info: dict) -> bool:
+        payload = TokenValidator().validate_token_string(token_info.get("token"))[
+            "payload"
+        ]
+        if payload is None or payload.get("exp") is None:
+            # Unknown expiration, the token is refreshed after 401 only
+            return False
+        return payload["exp"] - time.time() <= cls.REFRESH_AHEAD_SECONDS
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            stats = dict(cls._counters)
+            stats["in_flight"] = len(cls._in_flight)
+            stats["remembered"] = len(cls._refreshed)
+        return stats
+
+    @classmethod
+    def _refresh(cls, token_info: dict, auth_api) -> dict:
+        refresh_key = cls._refresh_key(token_info)
+        with cls._lock:
+            call = cls._in_flight.get(refresh_key)
+            is_leader = call is None
+            if is_leader:
+                call = _RefreshCall()
+                cls._in_flight[refresh_key] = call
+                cls._counters["refreshes"] += 1
+            else:
+                cls._counters["coalesced_refreshes"] += 1
+
+        if not is_leader:
+            call.event.wait()
+            return call.result or token_info
+
+        try:
+            new_token_info = auth_api.refresh_token(
+                refresh_token=token_info["refresh_token"]
+            )
+            if new_token_info is not None:
+                # The refresh token is kept when the response has no new one
+                call.result = dict(token_info, **new_token_info)
+        finally:
+            with cls._lock:
+                del cls._in_flight[refresh_key]
+                if call.result is None:
+                    cls._counters["failed_refreshes"] += 1
+                else:
+                    cls._refreshed[refresh_key] = call.result
+                    while len(cls._refreshed) > cls.MAX_REFRESHED:
+                        cls._refreshed.popitem(last=False)
+            call.event.set()
+        return call.result or token_info
+
+    @staticmethod
+    def _refresh_key(token_info: dict) -> str:
+        return hashlib.sha256(
+            str(token_info["refresh_token"]).encode("utf-8")
+        ).hexdigest()
@@ -0,0 +1,316 @@
+"""
+Administration page: system status, statistics and the API layer status.
+"""
+
+import datetime
+
+import streamlit as st
+
+from typing import Dict
+
+from src.language import LanguageTranslator
+from src.session_config import SessionConfig
+from src.news_view_model import NewsRecordCache
+from src.api_cache import ResponseCache
+from src.api_connection import HttpSessionPool
+from src.api_resilience import ApiResilience, CircuitBreaker
+from src.api_singleflight import SingleFlight
+from src.api_streaming import ApiStream
+from src.api_public import PlaygroundAdministrationAPI, PlaygroundAuthenticationAPI
+from src.warmup import ServerWarmup
+from src.token_utils import TokenManager, TokenValidator
+from src.ui_utils_public_stats import add_stat_to_elem
+
+ADMIN_GEN_STATS_BTN_KEY = "admin_window_btn_gen_stats"
+
+
+def show_error_status(result):
+    st.error(f"Error occurred while processing")
+    for err in result["errors"]:
+        if "required_params" in err and len(err["required_params"]):
+            st.write(err)
+
+
+def add_single_system_status_info(
+    header,
+    single_status,
+    elem,
+    admin_api,
+    settings_id,
+    token_str,
+    token_info,
+    auth_api,
+    datetime_format="%Y-%m-%dT%H:%M:%S.%fZ",
+):
+    is_status_doing = single_status["doing"]
+    time_offset = datetime.timedelta(hours=1) if True is True else None
+    actual_datetime = datetime.datetime.now()
+    if time_offset is not None:
+        begin_date = (
+            datetime.datetime.strptime(single_status["begin_date"], datetime_format)
+            + time_offset
+            if single_status["begin_date"] is not None
+            else None
+        )
+        end_date = (
+            datetime.datetime.strptime(single_status["end_date"], datetime_format)
+            + time_offset
+            if single_status["end_date"] is not None
+            else None
+        )
+    else:
+        begin_date = (
+            datetime.datetime.strptime(single_status["begin_date"], datetime_format)
+            if single_status["begin_date"] is not None
+            else None
+        )
+        end_date = (
+            datetime.datetime.strptime(single_status["end_date"], datetime_format)
+            if single_status["end_date"] is not None
+            else None
+        )
+
+    show_header = header
+    status_container = elem.container(border=True)
+    status_container.markdown(f"**{show_header}**")
+    if is_status_doing:
+        max_time_doing_h = 1.1
+        status_container.warning(
+            LanguageTranslator.format(
+                code_name="admin_panel_header", show_header=show_header
+            )
+        )
+        time_delta = actual_datetime - begin_date
+        if time_delta.seconds / 3600 > max_time_doing_h:
+            status_container.error(
+                LanguageTranslator.format(
+                    code_name="admin_panel_is_away", show_header=show_header
+                )
+            )
+    else:
+        status_container.success(
+            LanguageTranslator.format(
+                code_name="admin_panel_waiting_to_job", show_header=show_header
+            )
+        )
+
+    # Begin datetime
+    if begin_date is not None:
+        day_container, time_container = status_container.columns(2)
+        day_container.date_input(
+            LanguageTranslator.translate(code_name="admin_panel_job_last_run_d"),
+            begin_date,
+            key=f"d_b_{header}",
+            disabled=True,
+        )
+        time_container.time_input(
+            LanguageTranslator.translate(code_name="admin_panel_job_last_run_h"),
+            begin_date,
+            key=f"t_b_{header}",
+            disabled=True,
+        )
+    else:
+        status_container.info(
+            LanguageTranslator.format(
+                code_name="admin_panel_job_newer_run", show_header=show_header
+            )
+        )
+
+    # End datetime
+    if end_date is not None:
+        day_container, time_container = status_container.columns(2)
+        day_container.date_input(
+            LanguageTranslator.translate(code_name="admin_panel_job_last_end_d"),
+            end_date,
+            key=f"d_e_{header}",
+            disabled=True,
+        )
+        time_container.time_input(
+            LanguageTranslator.translate(code_name="admin_panel_job_last_end_h"),
+            end_date,
+            key=f"t_e_{header}",
+            disabled=True,
+        )
+    else:
+        status_container.info(
+            LanguageTranslator.format(
+                code_name="admin_panel_job_newer_done", show_header=show_header
+            )
+        )
+
+    # Restart button
+    if status_container.button(
+        LanguageTranslator.translate(code_name="admin_panel_job_reset"),
+        key=f"btn_restart_{header}",
+    ):
+        response = admin_api.do_admin_action_on_module(
+            settings_id=settings_id,
+            module=header,
+            action="restart",
+            token_str=token_str,
+            token_info=token_info,
+            auth_api=auth_api,
+        )
+        if "status" in response and response["status"]:
+            status_container.info(
+                LanguageTranslator.format(
+                    code_name="admin_panel_job_restarted", show_header=show_header
+                )
+            )
+        else:
+            status_container.error(response)
+
+
+def show_admin_window(
+    token_info: dict,
+    token_str: str,
+    system_status: Dict,
+    admin_api: PlaygroundAdministrationAPI,
+    auth_api: PlaygroundAuthenticationAPI,
+    max_statuses_in_row,
+    news_statistics: Dict | None = None,
+):
+    """
+    :param news_statistics: statistics fetched by the caller together with
+    the system status (e.g. concurrently, when the generate statistics button
+    triggered the rerun). When not given, they are fetched after clicking
+    the button.
+    """
+    if "settings" not in system_status:
+        return
+
+    # System status / system info
+    settings_id = system_status["settings"]
+    exp_system_status = st.expander(
+        LanguageTranslator.format(
+            code_name="admin_window_status_exp", settings_id=settings_id
+        ),
+        expanded=True,
+    )
+    if "status" in system_status:
+        for single_status in system_status["status"]:
+            num_of_statuses = len(single_status)
+
+            num_of_rows = num_of_statuses // max_statuses_in_row + (
+                1 if (num_of_statuses % max_statuses_in_row) else 0
+            )
+            containers = [
+                exp_system_status.container(border=False) for _ in range(num_of_rows)
+            ]
+            all_stats_columns = []
+            for c in containers:
+                all_stats_columns.extend(c.columns(max_statuses_in_row))
+
+            idx = 0
+            for status_name, stats in single_status.items():
+                add_single_system_status_info(
+                    header=status_name,
+                    single_status=stats,
+                    elem=all_stats_columns[idx],
+                    admin_api=admin_api,
+                    settings_id=settings_id,
+                    token_str=token_str,
+                    token_info=token_info,
+                    auth_api=auth_api,
+                )
+                idx += 1
+    else:
+        exp_system_status.error(
+            LanguageTranslator.translate(
+                code_name="admin_window_error_retrieve_status"
+            )
+        )
+
+    # News/categories statistics
+    exp_news_stats = st.expander(
+        LanguageTranslator.translate(code_name="admin_window_stats_cat_news")
+    )
+
+    if exp_news_stats.button(
+        LanguageTranslator.translate(code_name="admin_window_btn_gen_stats"),
+        key=ADMIN_GEN_STATS_BTN_KEY,
+    ):
+        with st.spinner(
+            LanguageTranslator.translate(code_name="admin_window_gen_in_progress")
+        ):
+            if news_statistics is None:
+                news_statistics = admin_api.get_news_statistics(
+                    token_str=token_str,
+                    auth_api=auth_api,
+                    token_info=token_info,
+                    settings_id=settings_id,
+                )
+            if "news_stats" in news_statistics:
+                add_stat_to_elem(
+                    elem_to_add_stat=exp_news_stats,
+                    news_statistics=news_statistics,
+                    admin_stats=True,
+                )
+            else:
+                exp_news_stats.error(
+                    LanguageTranslator.translate(
+                        code_name="admin_window_error_gen_stats_retrieve"
+                    )
+                )
+
+    # Show token
+    exp_token = st.expander("Token")
+    if token_info is not None and len(token_info):
+        exp_token.write(token_info)
+    else:
+        exp_token.write(token_str)
+
+    exp_session = st.expander("Session")
+    exp_session.write(SessionConfig.memory_usage())
+
+    show_api_layer_status()
+
+
+def show_api_layer_status():
+    exp_api_layer = st.expander("API")
+    exp_api_layer.markdown("**Warm-up**")
+    warmup_report = ServerWarmup.report()
+    if warmup_report is None:
+        exp_api_layer.info("Warm-up has not finished yet")
+    else:
+        failed_steps = [_s["step"] for _s in warmup_report if not _s["ok"]]
+        if len(failed_steps):
+            exp_api_layer.warning(f"Warm-up steps failed: {', '.join(failed_steps)}")
+        exp_api_layer.write(warmup_report)
+
+    exp_api_layer.markdown("**HTTP connection pools**")
+    exp_api_layer.write(HttpSessionPool.stats())
+
+    exp_api_layer.markdown("**Coalesced GET requests**")
+    exp_api_layer.write(SingleFlight.stats())
+
+    exp_api_layer.markdown("**Timeouts, retries and circuit breakers**")
+    resilience_stats = ApiResilience.stats()
+    open_breakers = [
+        module
+        for module, module_stats in resilience_stats["modules"].items()
+        if module_stats.get("state", CircuitBreaker.CLOSED) != CircuitBreaker.CLOSED
+    ]
+    if len(open_breakers):
+        exp_api_layer.warning(
+            f"Circuit breaker not closed: {', '.join(open_breakers)}"
+        )
+    exp_api_layer.write(resilience_stats)
+
+    exp_api_layer.markdown("**Streamed responses**")
+    exp_api_layer.write(ApiStream.stats())
+
+    exp_api_layer.markdown("**Validated tokens**")
+    exp_api_layer.write(TokenValidator.cache_stats())
+
+    exp_api_layer.markdown("**Token refresh**")
+    exp_api_layer.write(TokenManager.stats())
+
+    exp_api_layer.markdown("**News records**")
+    exp_api_layer.write(NewsRecordCache.stats())
+
+    exp_api_layer.markdown("**Response cache**")
+    exp_api_layer.write(ResponseCache.stats())
+    if exp_api_layer.button("Clear response cache", key="admin_api_clear_cache"):
+        removed = ResponseCache.clear()
+        exp_api_layer.info(f"Removed {removed} cached responses")
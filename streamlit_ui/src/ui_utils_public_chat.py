@@ -0,0 +1,470 @@
+"""
+Public chat page: generation and conversation options and the chat itself.
+"""
+
+import streamlit as st
+
+from typing import List, Dict
+
+from src.session_config import SessionConfig
+from src.language import LanguageTranslator
+from src.api_public import PublicConversationWithModelAPI
+from src.ui_utils_public_chrome import add_category_and_pages_ui, set_on_change_state
+
+
+def prepare_public_state_options(
+    force_use_rag_supervisor: bool,
+    force_use_content_supervisor: bool,
+    categories_with_pages,
+    force_show_options: bool = False,
+):
+    state_options = None
+    use_content_supervisor = force_use_content_supervisor
+    if not force_use_rag_supervisor and not force_use_content_supervisor:
+        state_options = st.sidebar.container(border=True)
+        state_options.write(
+            LanguageTranslator.translate(code_name="general_news_settings")
+        )
+
+        use_content_supervisor = state_options.toggle(
+            LanguageTranslator.translate(
+                code_name="general_work_with_content_supervisor"
+            ),
+            value=True,
+            on_change=set_on_change_state,
+        )
+    else:
+        if force_show_options:
+            state_options = st.sidebar.container(border=True)
+
+    use_rag_supervisor = True
+    if not force_use_rag_supervisor:
+        use_rag_supervisor = False
+        # use_rag_supervisor = state_options.toggle(
+        #     "Rozmowa z newsami", value=False, on_change=set_on_change_state
+        # )
+
+    rag_search_options = None
+    last_msg_summary_options = None
+    if use_rag_supervisor:
+        results_count = 10
+        if state_options is None:
+            raise Exception("state_options is None!")
+
+        last_days_to_answer = state_options.number_input(
+            LanguageTranslator.translate(
+                code_name="general_work_rag_supervisor_num_days"
+            ),
+            value=2,
+            min_value=1,
+            max_value=5,
+            on_change=set_on_change_state,
+        )
+
+        cat_www_exp = state_options.expander(
+            LanguageTranslator.translate(
+                code_name="general_work_rag_supervisor_cat_sites"
+            ),
+            expanded=True,
+        )
+        pages_checkboxes = add_category_and_pages_ui(
+            categories_with_pages=categories_with_pages,
+            element=cat_www_exp,
+            info_creator_window=False,
+        )
+
+        rerank_results = state_options.toggle(
+            LanguageTranslator.translate(
+                code_name="general_work_rag_supervisor_use_rerank"
+            ),
+            value=False,
+            on_change=set_on_change_state,
+        )
+
+        percentage_rank_mass = 100
+        if not force_use_rag_supervisor:
+            percentage_rank_mass = state_options.number_input(
+                LanguageTranslator.translate(
+                    code_name="general_work_rag_supervisor_per_mass"
+                ),
+                value=80,
+                min_value=1,
+                max_value=100,
+                on_change=set_on_change_state,
+            )
+
+        selected_cat_documents = {}
+        if len(pages_checkboxes):
+            for cat, pages in pages_checkboxes.items():
+                for p in pages:
+                    for www_url, is_activated in p.items():
+                        if is_activated:
+                            if cat not in selected_cat_documents:
+                                selected_cat_documents[cat] = []
+                            selected_cat_documents[cat].append(www_url)
+
+        rag_search_options = {
+            "categories": [],
+            "documents": [],
+            "max_results": results_count,
+            "rerank_results": rerank_results,
+            "percentage_rank_mass": percentage_rank_mass,
+            "return_with_factored_fields": False,
+        }
+
+        last_msg_summary_options = {
+            "last_days_to_answer": last_days_to_answer,
+            "categories_and_pages": selected_cat_documents,
+        }
+
+    state_options_dict = {
+        "use_content_supervisor": use_content_supervisor,
+        "use_rag_supervisor": use_rag_supervisor,
+    }
+
+    return state_options_dict, rag_search_options, last_msg_summary_options
+
+
+def show_public_info_about_rag_supervisor_in_news_conversation():
+    st.info(
+        LanguageTranslator.translate(
+            code_name="general_work_rag_supervisor_main_info"
+        )
+    )
+
+
+def prepare_generation_params_public(
+    generative_models: List[str], expanded_model_options: bool = False
+):
+    top_k = 50
+    top_p = 0.95
+    typical_p = 1.0
+    temperature = 0.75
+    max_new_tokens = 512
+    generative_model = ""
+    detailed_expl = False
+    explanation_in_list = False
+    creative_temperature = 1.1
+    repetition_penalty = 1.07
+    manual_set_generation_params = False
+
+    if expanded_model_options:
+        search_container = st.sidebar.expander(
+            LanguageTranslator.translate(code_name="gen_model_spec_expander")
+        )
+    else:
+        search_container = st.sidebar.container(border=True)
+        search_container.write(
+            LanguageTranslator.translate(code_name="gen_model_spec_expander")
+        )
+
+    if len(generative_models):
+        generative_model = search_container.selectbox(
+            LanguageTranslator.translate(code_name="gen_model_spec_selected_model"),
+            generative_models,
+            0,
+            on_change=set_on_change_state,
+        )
+    if manual_set_generation_params:
+        gen_model_opt_expander = search_container.expander(
+            LanguageTranslator.translate(code_name="gen_model_gen_options_expander"),
+            expanded=False,
+        )
+        top_k = gen_model_opt_expander.slider(
+            "top_k",
+            value=top_k,
+            max_value=500,
+            min_value=0,
+            step=1,
+            on_change=set_on_change_state,
+        )
+        top_p = gen_model_opt_expander.slider(
+            "top_p",
+            value=0.95,
+            max_value=1.0,
+            min_value=0.0,
+            step=0.01,
+            on_change=set_on_change_state,
+        )
+        temperature = gen_model_opt_expander.slider(
+            "temperature",
+            value=temperature,
+            max_value=2.0,
+            min_value=0.0,
+            step=0.01,
+            on_change=set_on_change_state,
+        )
+        typical_p = gen_model_opt_expander.slider(
+            "typical_p",
+            value=typical_p,
+            max_value=2.0,
+            min_value=0.0,
+            step=0.01,
+            on_change=set_on_change_state,
+        )
+        repetition_penalty = gen_model_opt_expander.slider(
+            "repetition_penalty",
+            value=repetition_penalty,
+            max_value=2.0,
+            min_value=0.0,
+            step=0.01,
+            on_change=set_on_change_state,
+        )
+        set_max_new_tokens = gen_model_opt_expander.toggle(
+            LanguageTranslator.translate(
+                code_name="gen_model_gen_options_max_tokens_tgl"
+            ),
+            value=False,
+            on_change=set_on_change_state,
+        )
+
+        if set_max_new_tokens:
+            max_new_tokens = gen_model_opt_expander.slider(
+                "max_new_tokens",
+                value=max_new_tokens,
+                max_value=2048,
+                min_value=32,
+                step=1,
+                on_change=set_on_change_state,
+            )
+    generation_options = {
+        "top_k": top_k,
+        "top_p": top_p,
+        "temperature": temperature,
+        "typical_p": typical_p,
+        "repetition_penalty": repetition_penalty,
+        "max_new_tokens": max_new_tokens,
+    }
+
+    answer_type = search_container.radio(
+        LanguageTranslator.translate(
+            code_name="gen_model_gen_options_model_verbose"
+        ),
+        [
+            LanguageTranslator.translate(
+                code_name="gen_model_gen_options_model_verbose_standard"
+            ),
+            LanguageTranslator.translate(
+                code_name="gen_model_gen_options_model_verbose_more"
+            ),
+        ],
+        on_change=set_on_change_state,
+    )
+    if "okład" in answer_type:
+        detailed_expl = True
+
+    conversation_options = {
+        "detailed_explanation": detailed_expl,
+        "explanation_in_list": explanation_in_list,
+    }
+
+    return generative_model, generation_options, conversation_options
+
+
+def set_session_hash_chat_to_load():
+    st.session_state["temp_state_chat_hash_to_load"] = True
+
+
+def prepare_public_chat(
+    generative_model: str,
+    generation_options: Dict[str, str],
+    conversation_options: Dict[str, str],
+    public_conv_with_model: PublicConversationWithModelAPI,
+    public_state_options: Dict[str, str],
+    rag_search_options: Dict[str, str],
+    force_use_rag_supervisor: bool,
+):
+    chat_window, message_state_window = st.columns([2, 1])
+
+    chat_window_height = 600
+    messages = chat_window.container(height=chat_window_height)
+    messages_state_opts = message_state_window.container(height=chat_window_height)
+
+    messages_state_container = messages_state_opts.container(
+        height=int(chat_window_height * 0.85), border=False
+    )
+
+    new_chat_btn = st.sidebar.button(
+        LanguageTranslator.translate(code_name="public_chat_button_new_chat")
+    )
+    if new_chat_btn:
+        set_on_change_state()
+
+    SessionConfig.set_session_free_chat_hash(chat_hash=None)
+    with st.sidebar.popover(
+        LanguageTranslator.translate(code_name="public_chat_load_chat")
+    ):
+        chat_hash = st.text_input(
+            LanguageTranslator.translate(code_name="public_chat_load_chat_hash"),
+            on_change=set_session_hash_chat_to_load,
+        )
+        if (
+            "temp_state_chat_hash_to_load" in st.session_state
+            and st.session_state["temp_state_chat_hash_to_load"]
+        ):
+            SessionConfig.set_session_free_chat_hash(chat_hash)
+            st.session_state["temp_state_chat_hash_to_load"] = False
+
+    chat_hash_session = SessionConfig.get_session_free_chat_hash()
+    if chat_hash_session:
+        loaded_chat_id, loaded_chat_history, is_chat_read_only = (
+            public_conv_with_model.get_chat_by_hash(
+                chat_hash=chat_hash_session,
+                model_name=generative_model,
+                convert_history_to_session=True,
+            )
+        )
+
+        if loaded_chat_id is not None and len(loaded_chat_history):
+            SessionConfig.set_session_free_chat_chat_id(
+                chat_id=loaded_chat_id,
+                chat=loaded_chat_history,
+                is_chat_read_only=is_chat_read_only,
+            )
+            messages_state_container.write({"session_chat_id": loaded_chat_id})
+        SessionConfig.set_session_free_chat_hash(chat_hash=None)
+
+    chat_history = SessionConfig.get_session_free_chat()
+    if chat_history is None:
+        chat_history = []
+
+    for chat_msg in chat_history:
+        if "user" in chat_msg:
+            messages.chat_message("user").write(chat_msg["user"])
+        if "assistant" in chat_msg:
+            messages.chat_message("assistant").write(chat_msg["assistant"])
+
+    is_chat_read_only = SessionConfig.get_session_free_chat_is_read_only()
+    if is_chat_read_only:
+        return
+
+    session_chat_id = SessionConfig.get_session_free_chat_id()
+    if last_user_msg := chat_window.chat_input(
+        LanguageTranslator.translate(code_name="public_chat_ask_bot")
+    ):
+        messages.chat_message("user").write(last_user_msg)
+
+        if session_chat_id is None:
+            resp = public_conv_with_model.new_chat(
+                model_name=generative_model,
+                generation_options=generation_options,
+                public_state_options=public_state_options,
+            )
+            if "chat" in resp:
+                session_chat_id = resp["chat"]["id"]
+            else:
+                messages_state_container.write(resp)
+                return
+
+        messages_state_container.write({"session_chat_id": session_chat_id})
+
+        with messages.status(
+            LanguageTranslator.translate(code_name="public_chat_bot_writing")
+        ):
+            last_user_msg_to_model = last_user_msg
+            if force_use_rag_supervisor:
+                last_user_msg_to_model = (
+                    LanguageTranslator.translate(
+                        code_name="public_chat_bot_prompt_question"
+                    )
+                    + " "
+                    + last_user_msg_to_model
+                )
+
+            det_conv = ""
+            if conversation_options["detailed_explanation"]:
+                # detailed
+                det_conv = LanguageTranslator.translate(
+                    code_name="public_chat_model_detailed_explanation"
+                )
+            list_command = ""
+            if conversation_options["explanation_in_list"]:
+                list_command = LanguageTranslator.translate(
+                    code_name="public_chat_model_answer_as_list"
+                )
+            last_user_msg_to_model = (
+                f"{last_user_msg_to_model}\n{det_conv} {list_command}".strip()
+            )
+
+            assistant_stream = public_conv_with_model.add_chat_message_stream(
+                chat_id=session_chat_id,
+                last_user_msg=last_user_msg_to_model,
+                generation_options=generation_options,
+                public_state_options=public_state_options,
+                model_name=generative_model,
+                rag_search_options=rag_search_options,
+            )
+            # Deltas are rendered as soon as the backend sends them
+            streamed_message = messages.chat_message("assistant").write_stream(
+                assistant_stream
+            )
+
+            if assistant_stream.error is not None:
+                if "status" in assistant_stream.error:
+                    messages_state_container.error(assistant_stream.error)
+                else:
+                    st.write(public_conv_with_model.last_response)
+            else:
+                assistant_response = assistant_stream.final or {}
+                generation_time = assistant_response.get("generation_time")
+                messages_state_container.write(
+                    LanguageTranslator.format(
+                        code_name="public_chat_model_gen_time",
+                        generation_time=generation_time,
+                    )
+                )
+
+                if "last_state" in assistant_response:
+                    if assistant_response["last_state"] is not None:
+                        messages_state_container.write(
+                            assistant_response["last_state"]
+                        )
+
+                assistant_response = assistant_response.get(
+                    "generated_assistant_message", streamed_message
+                )
+                chat_history.append(
+                    {"user": last_user_msg, "assistant": assistant_response}
+                )
+            SessionConfig.set_session_free_chat_chat_id(
+                chat=chat_history, chat_id=session_chat_id
+            )
+
+    if len(chat_history) and session_chat_id is not None:
+        with st.sidebar.popover(
+            LanguageTranslator.translate(code_name="public_chat_save_chat")
+        ):
+            save_as_read_only = st.toggle(
+                LanguageTranslator.translate(code_name="public_chat_save_chat_ro"),
+                value=True,
+            )
+            save_chat_btn = st.button(
+                LanguageTranslator.translate(
+                    code_name="public_chat_btn_save_get_hash"
+                )
+            )
+            if save_chat_btn:
+                chat_hash = public_conv_with_model.save_chat(
+                    chat_id=session_chat_id,
+                    model_name=generative_model,
+                    save_as_read_only=save_as_read_only,
+                )
+
+                if "chat_hash" in chat_hash:
+                    chat_hash = chat_hash["chat_hash"]
+                    messages_state_container.info(
+                        LanguageTranslator.format(
+                            code_name="public_chat_saved_chat_info",
+                            save_as_read_only=save_as_read_only,
+                        )
+                    )
+                    messages_state_container.code(chat_hash)
+                else:
+                    messages_state_container.error(
+                        LanguageTranslator.translate(
+                            code_name="act_creator_model_error_try_again"
+                        )
+                    )
+
+    if public_state_options.get("use_rag_supervisor", False):
+        show_public_info_about_rag_supervisor_in_news_conversation()
@@ -0,0 +1,113 @@
+"""
+Site chrome shared by all pages: logo, language switch, page initialization
+and the common sidebar option widgets.
+"""
+
+import streamlit as st
+
+from src.session_config import SessionConfig
+from src.language import LanguageTranslator, _LanguageDefinitions
+from src.constants import DEFAULT_LANGUAGE, SHOW_TRANSLATION_STATS
+
+
+def set_on_change_state() -> None:
+    SessionConfig.set_session_free_chat_chat_id(None, None)
+    SessionConfig.reset_session_news_stream_shown()
+
+
+def add_category_and_pages_ui(
+    categories_with_pages: dict, element, info_creator_window: bool
+) -> dict:
+    if info_creator_window:
+        pages_checkboxes = {}
+        for c_name, cat_info in categories_with_pages.items():
+            pages_checkboxes[c_name] = [
+                {p["main_url"]: True} for p in cat_info["category_pages"]
+            ]
+        return pages_checkboxes
+
+    if element is None:
+        raise TypeError("element to add category page cannot be None")
+
+    selected_sites = element.radio(
+        LanguageTranslator.translate(code_name="which_site_to_show"),
+        [
+            LanguageTranslator.translate(code_name="select_all_sites"),
+            LanguageTranslator.translate(code_name="unselect_all_sites"),
+        ],
+    )
+
+    select_all_pages_opt = selected_sites.lower()
+    if "wszystkie" in select_all_pages_opt:
+        select_all = "zaznacz" in select_all_pages_opt
+    else:
+        select_all = "unsel" not in select_all_pages_opt
+
+    pages_checkboxes = {}
+    for c_name, cat_info in categories_with_pages.items():
+        pages_checkboxes[c_name] = []
+        # element.write(cat_info["category_info"]["display_name"])
+        all_category_pages = [p["main_url"] for p in cat_info["category_pages"]]
+        # sorted: the same selection has to give the same filter_pages
+        # (and request) in every process, set order depends on hash seed
+        all_category_pages = sorted(set(all_category_pages))
+        for category_page in all_category_pages:
+            if select_all:
+                pages_checkboxes[c_name].append(
+                    {category_page: element.checkbox(category_page, value=True)}
+                )
+            else:
+                pages_checkboxes[c_name].append(
+                    {category_page: element.checkbox(category_page, value=False)}
+                )
+    return pages_checkboxes
+
+
+def prepare_info_creator_public(categories_with_pages):
+    pages_checkboxes = add_category_and_pages_ui(
+        categories_with_pages=categories_with_pages,
+        element=st,
+        info_creator_window=True,
+    )
+    return {"filter_pages": pages_checkboxes}
+
+
+def insert_site_logo():
+    st.logo(
+        "resources/images/radlab-logo-new-scaled-circle.png",
+        icon_image="resources/images/radlab-logo-new-scaled-circle.png",
+        link="https://radlab.dev",
+    )
+
+
+def insert_language_choose():
+    current_lang = SessionConfig.get_session_ui_language() or DEFAULT_LANGUAGE
+    lang_codes = list(_LanguageDefinitions.LANGUAGES.keys())
+    if current_lang not in lang_codes:
+        raise ValueError(f"Unknown language code {current_lang}")
+
+    selected_lang = st.sidebar.selectbox(
+        label=LanguageTranslator.translate(code_name="language_set_interface_lang"),
+        options=lang_codes,
+        index=lang_codes.index(current_lang),
+        format_func=lambda k: _LanguageDefinitions.LANGUAGES[k],
+    )
+    st.sidebar.divider()
+
+    if selected_lang != current_lang:
+        SessionConfig.set_session_ui_language(selected_lang)
+        st.rerun()
+
+
+def initialize_page():
+    SessionConfig.init_session_state_if_needed()
+    translations_prev_rerun = LanguageTranslator.start_rerun_counter()
+    if SessionConfig.get_session_ui_language() is None:
+        SessionConfig.set_session_ui_language(language=DEFAULT_LANGUAGE)
+
+    insert_site_logo()
+    insert_language_choose()
+    if SHOW_TRANSLATION_STATS:
+        st.sidebar.caption(
+            f"Translations in the previous run: {translations_prev_rerun}"
+        )
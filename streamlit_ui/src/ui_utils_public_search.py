@@ -1,5 +1,3 @@
-import plotly.express as px
-
 from typing import List, Dict
 
 from src.language import LanguageTranslator
@@ -105,6 +103,9 @@ def show_result_urls(
 
 
 def show_polarity_chart(search_result_container, polarity_3c: dict):
+    # plotly is loaded only when a chart is built
+    import plotly.express as px
+
     all_c_sum = sum(polarity_3c.values())
     if all_c_sum < 1:
         return
@@ -0,0 +1,161 @@
+"""
+Statistics of the news stream: per-category tables and charts.
+"""
+
+import streamlit as st
+
+from src.language import LanguageTranslator
+from src.api_public import PublicNewsStreamAPI
+from src.data_utils import (
+    convert_admin_pages_stats_news_p_day,
+    convert_admin_pages_stats_to_polarity_3c,
+)
+
+
+def add_stat_to_elem(elem_to_add_stat, news_statistics, admin_stats: bool = False):
+    stats_datetime = news_statistics["stats_datetime"]
+    elem_to_add_stat.markdown(
+        LanguageTranslator.translate(code_name="statistics_date_of_stats")
+        + " "
+        + str(stats_datetime)
+    )
+
+    stats_categories = news_statistics["news_stats"]
+    polarity_stats = news_statistics["polarity_stats"]
+
+    categories = [c for c in stats_categories.keys()]
+    cat_stat_tabs = elem_to_add_stat.tabs(categories)
+    for idx in range(len(categories)):
+        cat_name = categories[idx]
+        add_single_category_stats(
+            category=cat_name,
+            pages_stats=stats_categories[cat_name],
+            polarity_stats=polarity_stats[cat_name],
+            elem_to_add_stats=cat_stat_tabs[idx],
+            are_admin_stats=admin_stats,
+        )
+
+
+def add_single_category_stats(
+    category, pages_stats, polarity_stats, elem_to_add_stats, are_admin_stats
+):
+    # pandas and plotly are loaded only when the stats are shown
+    import pandas as pd
+    import plotly.express as px
+
+    # = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = =
+    table_stats_elem, pie_p_d_elem = elem_to_add_stats.columns([1, 1])
+    # Dataframe table
+    stats_df = pd.DataFrame(pages_stats)
+    if not are_admin_stats:
+        stats_df = stats_df.drop(
+            labels=[
+                "subpages_count",
+                "number_of_hidden_news",
+                "news_count",
+                "perc_of_hidden_news",
+                "perc_of_visible_news",
+            ]
+        )
+    stats_df = stats_df.transpose()
+
+    if not are_admin_stats:
+        stats_df = stats_df.loc[
+            :,
+            [
+                "news_per_day",
+                "number_of_visible_news",
+                "last_crawling_date",
+                "first_crawling_date",
+            ],
+        ]
+
+        stats_df.rename(
+            columns={
+                "number_of_visible_news": LanguageTranslator.translate(
+                    code_name="statistics_tab_num_vis_news"
+                ),
+                "news_per_day": LanguageTranslator.translate(
+                    code_name="statistics_tab_news_per_day"
+                ),
+                "last_crawling_date": LanguageTranslator.translate(
+                    code_name="statistics_tab_last_crawling_date"
+                ),
+                "first_crawling_date": LanguageTranslator.translate(
+                    code_name="statistics_tab_first_crawling_date"
+                ),
+            },
+            inplace=True,
+        )
+
+    table_stats_elem.dataframe(stats_df)
+
+    # Number of news per day
+    news_per_day_dataset = convert_admin_pages_stats_news_p_day(
+        pages_stats=pages_stats
+    )
+    per_day_news_fig = px.pie(
+        news_per_day_dataset,
+        values="news_per_day",
+        names="url",
+        title=LanguageTranslator.translate(
+            code_name="statistics_news_per_24h_percentage"
+        ),
+    )
+    pie_p_d_elem.plotly_chart(per_day_news_fig, theme="streamlit")
+
+    # = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = =
+    # Polarity chart
+    p_3c_dataset, p_3c_dataset_perc = convert_admin_pages_stats_to_polarity_3c(
+        polarity_stats=polarity_stats
+    )
+
+    p_3c_fig = px.bar(
+        p_3c_dataset,
+        x="url",
+        y="count",
+        color="polarity_3c",
+        color_discrete_map={
+            "positive": "green",
+            "negative": "red",
+            "ambivalent": "gray",
+        },
+        title=LanguageTranslator.format(
+            code_name="statistics_news_polarity_3c_hist_count", category=category
+        ),
+    )
+    elem_to_add_stats.plotly_chart(p_3c_fig, theme="streamlit")
+
+    # = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = =
+    p_3c_fig_perc = px.bar(
+        p_3c_dataset_perc,
+        x="url",
+        y="percentage",
+        color="polarity_3c",
+        color_discrete_map={
+            "positive": "green",
+            "negative": "red",
+            "ambivalent": "gray",
+        },
+        title=LanguageTranslator.format(
+            code_name="statistics_news_polarity_3c_hist_perc", category=category
+        ),
+    )
+    elem_to_add_stats.plotly_chart(p_3c_fig_perc, theme="streamlit")
+
+
+def show_stats_window(publ_api: PublicNewsStreamAPI, settings_id):
+    news_statistics = publ_api.get_news_statistics(
+        settings_id=settings_id, get_last_stats=True
+    )
+
+    exp_news_stats = st.expander(
+        LanguageTranslator.translate(code_name="statistics_connected_with_news"),
+        expanded=True,
+    )
+    if "news_stats" in news_statistics:
+        add_stat_to_elem(
+            elem_to_add_stat=exp_news_stats,
+            news_statistics=news_statistics,
+            admin_stats=False,
+        )
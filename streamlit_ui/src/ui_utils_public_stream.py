@@ -0,0 +1,826 @@
+"""
+News stream page: stream options and rendering of the news in categories.
+"""
+
+import datetime
+
+import streamlit as st
+
+from src.session_config import SessionConfig
+from src.language import LanguageTranslator
+from src.api_public import PublicNewsStreamAPI, PlaygroundAuthenticationAPI
+from src.constants import (
+    ICON_NOT_SET_NEWS_INFO,
+    ICON_NEWS_POLARITY_3C_P,
+    ICON_NEWS_POLARITY_3C_N,
+    ICON_NEWS_POLARITY_3C_A,
+    ICON_FLAG_PL_LANG,
+    ICON_FLAG_EN_LANG,
+    ICON_FLAG_FR_LANG,
+    ICON_FLAG_RU_LANG,
+    ICON_FLAG_UA_LANG,
+    ICON_FLAG_DE_LANG,
+    ICON_DEFAULT_VALUE_UI,
+    MIN_ARTICLE_LEN,
+    DEFAULT_LANGUAGE,
+    MIN_STREAM_QUERY_LEN,
+    NEWS_STREAM_PAGE_SIZES,
+)
+from src.definitions import prepare_pli_icons, ICON_NEWS_PLI_GOOD
+from src.data_utils import prepare_news_to_user
+from src.news_view_model import NewsRecord, NewsRecordCache
+from src.news_ordering import newest_news
+from src.ui_utils_public_chrome import add_category_and_pages_ui, set_on_change_state
+
+
+def prepare_news_stream_params_public(
+    categories_with_pages,
+    token_str: str | None,
+    token_info: dict | None,
+    show_news_in_category_count: bool = True,
+):
+    news_config_container = st.sidebar.container(border=True)
+    news_config_container.write(
+        LanguageTranslator.translate(code_name="news_stream_params_public")
+    )
+
+    show_only_with_message = False
+    filter_news_to_show = [50, 100, 150]
+    if token_str is not None and len(token_str):
+        filter_news_to_show = [20, 50, 100, 5, 10]
+        show_only_with_message = news_config_container.toggle(
+            LanguageTranslator.translate(
+                code_name="news_stream_params_public_show_with_message"
+            ),
+            value=False,
+        )
+
+    news_in_category = 25
+    if show_news_in_category_count:
+        news_in_category = news_config_container.selectbox(
+            LanguageTranslator.translate(
+                code_name="news_stream_params_public_news_count"
+            ),
+            filter_news_to_show,
+            on_change=set_on_change_state,
+        )
+
+    news_per_page = news_config_container.selectbox(
+        LanguageTranslator.translate(
+            code_name="news_stream_params_public_news_per_page"
+        ),
+        NEWS_STREAM_PAGE_SIZES,
+        on_change=set_on_change_state,
+    )
+
+    sort_date_by = news_config_container.selectbox(
+        LanguageTranslator.translate(code_name="news_stream_params_public_sort_by"),
+        [
+            LanguageTranslator.translate(
+                code_name="news_stream_params_public_sort_by_newsest"
+            ),
+            LanguageTranslator.translate(
+                code_name="news_stream_params_public_sort_by_oldest"
+            ),
+        ],
+        on_change=set_on_change_state,
+    )
+
+    filter_options = news_config_container.expander(
+        LanguageTranslator.translate(code_name="news_stream_filter_news_expander"),
+        expanded=True,
+    )
+    which_polarity3c = filter_options.radio(
+        LanguageTranslator.translate(code_name="news_stream_filter_news_radio"),
+        [
+            LanguageTranslator.translate(
+                code_name="news_stream_filter_news_radio_all"
+            ),
+            LanguageTranslator.translate(
+                code_name="news_stream_filter_news_radio_pos"
+            ),
+            LanguageTranslator.translate(
+                code_name="news_stream_filter_news_radio_neg"
+            ),
+            LanguageTranslator.translate(
+                code_name="news_stream_filter_news_radio_amb"
+            ),
+        ],
+    )
+
+    # def_pli_ico, pli_ico2v, pli_v2ico = prepare_pli_icons()
+    #
+    # pli_icons = [i for i in pli_ico2v.keys()]
+    # pli_icon_selected = filter_options.radio(
+    #     LanguageTranslator.translate(code_name="news_stream_filter_news_pli_value"),
+    #     pli_icons,
+    # )
+    # if ICON_DEFAULT_VALUE_UI in pli_icon_selected:
+    #     pli_from = None
+    #     pli_to = 1.01
+    # else:
+    #     pli_from, pli_to, ico_to_write_pli = convert_pli_value_to_icon(
+    #         pli_ico2v[pli_icon_selected] - 0.001
+    #     )
+
+    pli_from = None
+    pli_to = 1.01
+
+    cat_www_exp = news_config_container.expander(
+        LanguageTranslator.translate(code_name="news_stream_filter_news_sites"),
+        expanded=False,
+    )
+    pages_checkboxes = add_category_and_pages_ui(
+        categories_with_pages=categories_with_pages,
+        element=cat_www_exp,
+        info_creator_window=False,
+    )
+
+    if ICON_NEWS_POLARITY_3C_A in which_polarity3c:
+        which_polarity3c = "ambivalent"
+    elif ICON_NEWS_POLARITY_3C_P in which_polarity3c:
+        which_polarity3c = "positive"
+    elif ICON_NEWS_POLARITY_3C_N in which_polarity3c:
+        which_polarity3c = "negative"
+    else:
+        which_polarity3c = None
+
+    options = {
+        "news_in_category": news_in_category,
+        "news_per_page": news_per_page,
+        "sort_news_by": sort_date_by,
+        "filter_pages": pages_checkboxes,
+        "polarity_3c": which_polarity3c,
+        "pli_from": pli_from,
+        "pli_to": pli_to,
+        "admin": {"show_only_with_message": show_only_with_message},
+    }
+
+    return options
+
+
+def convert_pli_value_to_icon(pli_value) -> (float, float, str):
+    prev_pli_conv = {"below_value": 0, "icon": ICON_NOT_SET_NEWS_INFO}
+
+    def_pli_icons, pli_ico2v, pli_v2ico = prepare_pli_icons()
+
+    for pli_conv in def_pli_icons:
+        if pli_value < pli_conv["below_value"]:
+            return (
+                prev_pli_conv["below_value"],
+                pli_conv["below_value"],
+                pli_conv["icon"],
+            )
+        prev_pli_conv = pli_conv
+    return 0.0, 1.0, ICON_NEWS_PLI_GOOD
+
+
+# Similarity of the generated news to the original article, by the language
+# of the original page
+ADMIN_MSG_MAX_SIMILARITY = 0.9
+ADMIN_MSG_SIMILARITY_THRESHOLDS = {
+    "en": {"min": 0.635, "max": ADMIN_MSG_MAX_SIMILARITY},
+    "fr": {"min": 0.635, "max": ADMIN_MSG_MAX_SIMILARITY},
+    "de": {"min": 0.551, "max": ADMIN_MSG_MAX_SIMILARITY},
+    "ru": {"min": 0.635, "max": ADMIN_MSG_MAX_SIMILARITY},
+    "ua": {"min": 0.551, "max": ADMIN_MSG_MAX_SIMILARITY},
+}
+# Other languages: (below the similarity, message type, message code)
+ADMIN_MSG_SIMILARITY_LEVELS = [
+    (0.401, "error", "news_stream_admin_msg_401"),
+    (0.501, "warning", "news_stream_admin_msg_501"),
+    (0.635, "info", "news_stream_admin_msg_635"),
+]
+
+
+def prepare_admin_messages_to_article(
+    article_txt: str,
+    sim_to_original_article: float,
+    num_of_generated_news: int,
+    language: str | None,
+    main_page_language: str,
+    min_article_len: int,
+):
+    messages = []
+    if sim_to_original_article is not None:
+        if main_page_language in ADMIN_MSG_SIMILARITY_THRESHOLDS:
+            min_sim = ADMIN_MSG_SIMILARITY_THRESHOLDS[main_page_language]["min"]
+            max_sim = ADMIN_MSG_SIMILARITY_THRESHOLDS[main_page_language]["max"]
+
+            if sim_to_original_article <= min_sim:
+                messages.append(
+                    {
+                        "type": "error",
+                        "txt": LanguageTranslator.translate(
+                            code_name=(
+                                "news_stream_admin_msg_501"
+                                if min_sim < 0.6
+                                else "news_stream_admin_msg_635"
+                            )
+                        ),
+                    }
+                )
+            elif sim_to_original_article >= max_sim:
+                messages.append(
+                    {
+                        "type": "error",
+                        "txt": LanguageTranslator.translate(
+                            code_name="news_stream_admin_msg_plag"
+                        ),
+                    }
+                )
+        else:
+            for below_value, msg_type, code_name in ADMIN_MSG_SIMILARITY_LEVELS:
+                if sim_to_original_article < below_value:
+                    messages.append(
+                        {
+                            "type": msg_type,
+                            "txt": LanguageTranslator.translate(code_name=code_name),
+                        }
+                    )
+                    break
+            else:
+                if sim_to_original_article > ADMIN_MSG_MAX_SIMILARITY:
+                    messages.append(
+                        {
+                            "type": "error",
+                            "txt": LanguageTranslator.translate(
+                                code_name="news_stream_admin_msg_plag"
+                            ),
+                        }
+                    )
+
+    if len(article_txt) < min_article_len:
+        messages.append(
+            {
+                "type": "warning",
+                "txt": LanguageTranslator.format(
+                    code_name="news_stream_admin_msg_short",
+                    min_article_len=min_article_len,
+                ),
+            }
+        )
+
+    if num_of_generated_news > 2:
+        messages.append(
+            {
+                "type": "error",
+                "txt": LanguageTranslator.format(
+                    code_name="news_stream_admin_msg_num_gen",
+                    num_of_generated_news=num_of_generated_news,
+                ),
+            }
+        )
+    elif num_of_generated_news > 1:
+        messages.append(
+            {
+                "type": "warning",
+                "txt": LanguageTranslator.format(
+                    code_name="news_stream_admin_msg_num_gen",
+                    num_of_generated_news=num_of_generated_news,
+                ),
+            }
+        )
+
+    if language is not None and language != "pl":
+        messages.append(
+            {
+                "type": "error",
+                "txt": LanguageTranslator.format(
+                    code_name="news_stream_admin_msg_lang", language=language
+                ),
+            }
+        )
+
+    if article_txt.strip()[-1] not in [".", "!", "?", ";"]:
+        messages.append(
+            {
+                "type": "info",
+                "txt": LanguageTranslator.translate(
+                    code_name="news_stream_admin_msg_not_full_article"
+                ),
+            }
+        )
+
+    return messages
+
+
+def convert_to_lang_icon(language: str | None) -> str:
+    if language is None:
+        return ICON_NOT_SET_NEWS_INFO
+    elif language == "en":
+        return ICON_FLAG_EN_LANG
+    elif language == "pl":
+        return ICON_FLAG_PL_LANG
+    elif language == "fr":
+        return ICON_FLAG_FR_LANG
+    elif language == "ru":
+        return ICON_FLAG_RU_LANG
+    elif language == "ua":
+        return ICON_FLAG_UA_LANG
+    elif language == "de":
+        return ICON_FLAG_DE_LANG
+    return ICON_DEFAULT_VALUE_UI
+
+
+def prepare_news_record(news: dict) -> NewsRecord:
+    """
+    Render record of a news payload, the translated parts are in the
+    language of the current session.
+    """
+    news_text = news["generated_text"]
+    user_news_text = prepare_news_to_user(news_text=news_text)
+
+    when_generated = news["when_generated"]
+    if when_generated is not None:
+        when_generated = datetime.datetime.strptime(
+            when_generated, "%Y-%m-%dT%H:%M:%S.%fZ"
+        )
+        when_generated = when_generated.strftime("%Y-%m-%d %H:%M:%S")
+
+    polarity_3c = news["polarity_3c"]
+    polarity_icon = ICON_NOT_SET_NEWS_INFO
+    if polarity_3c is not None:
+        polarity_icon = ICON_NEWS_POLARITY_3C_A
+        if polarity_3c == "negative":
+            polarity_icon = ICON_NEWS_POLARITY_3C_N
+        elif polarity_3c == "positive":
+            polarity_icon = ICON_NEWS_POLARITY_3C_P
+
+    full_news_text = None
+    l_clr_f_n = len(news_text.strip().replace("\n", ""))
+    l_clr_g_n = len(user_news_text.strip().replace("\n", ""))
+    if l_clr_f_n > l_clr_g_n:
+        full_news_text = news_text
+        if full_news_text[-1] not in [".", "?", "!", ";"]:
+            full_news_text += "..."
+
+    admin_messages = ()
+    if news["show_admin_message"]:
+        admin_messages = tuple(
+            (message["type"], message["txt"])
+            for message in prepare_admin_messages_to_article(
+                article_txt=user_news_text,
+                sim_to_original_article=news["similarity_to_original"],
+                num_of_generated_news=news["news_sub_page"]["num_of_generated_news"],
+                language=news["language"],
+                main_page_language=news["main_page_language"],
+                min_article_len=MIN_ARTICLE_LEN,
+            )
+        )
+
+    return NewsRecord(
+        news_id=news["id"],
+        revision=NewsRecord.revision_of(news),
+        when_generated=when_generated,
+        user_news_text=user_news_text,
+        full_news_text=full_news_text,
+        polarity_icon=polarity_icon,
+        news_language_icon=convert_to_lang_icon(news["language"]),
+        main_page_language_icon=convert_to_lang_icon(news["main_page_language"]),
+        news_url=news["news_sub_page"]["news_url"],
+        num_of_generated_news=news["news_sub_page"]["num_of_generated_news"],
+        model_name=news["model_used_to_generate_news"],
+        generation_time=news["generation_time"],
+        sim_to_original_article=news["similarity_to_original"],
+        admin_messages=admin_messages,
+    )
+
+
+def prepare_news_records(news_list: list) -> list:
+    return [prepare_news_record(_n) for _n in news_list]
+
+
+def add_news_to_public_news_stream(
+    news_list,
+    user_token: str | None = None,
+    token_info: dict | None = None,
+    publ_news_api: PublicNewsStreamAPI | None = None,
+    auth_api: PlaygroundAuthenticationAPI | None = None,
+    admin_opts: dict | None = None,
+):
+    if admin_opts is None:
+        admin_opts = {}
+    show_only_with_message = admin_opts.get("show_only_with_message", False)
+    language = SessionConfig.get_session_ui_language() or DEFAULT_LANGUAGE
+    # Prepared once per news and language, shared by all sessions
+    records = NewsRecordCache.get_or_build_many(
+        news_list, language=language, build_many=prepare_news_records
+    )
+    for record in records:
+        news_id = record.news_id
+
+        news_container = None
+        action_on_news = None
+        admin_news_id = None
+        if (
+            user_token is not None
+            and len(user_token.strip())
+            and publ_news_api is not None
+        ):
+            admin_news_id = news_id
+            hide_key = f"hide_{news_id}"
+            generate_key = f"generate_{news_id}"
+            hide_admin_msg_key = f"hide_admin_msg_{news_id}"
+
+            msg_to_news = record.admin_messages
+            if show_only_with_message and not len(msg_to_news):
+                continue
+
+            news_container = st.container(border=True)
+            for message_type, message_txt in msg_to_news:
+                if message_type == "warning":
+                    news_container.warning(message_txt)
+                elif message_type == "error":
+                    news_container.error(message_txt)
+                elif message_type == "info":
+                    news_container.info(message_txt)
+
+            hide_toggle = news_container.toggle(
+                LanguageTranslator.translate(
+                    code_name="news_stream_admin_hide_news"
+                ),
+                key=hide_key,
+            )
+            if hide_toggle:
+                action_on_news = "hide"
+
+            generate_toggle = news_container.toggle(
+                LanguageTranslator.translate(
+                    code_name="news_stream_admin_re_gen_news"
+                ),
+                key=generate_key,
+            )
+            if generate_toggle:
+                action_on_news = "regenerate"
+
+            if len(msg_to_news):
+                hide_admin_msg = news_container.toggle(
+                    LanguageTranslator.translate(
+                        code_name="news_stream_admin_hide_msg"
+                    ),
+                    key=hide_admin_msg_key,
+                )
+                if hide_admin_msg:
+                    action_on_news = "hide_admin_msg"
+
+            if action_on_news is not None:
+                response = publ_news_api.do_news_option(
+                    news_id=news_id,
+                    action=action_on_news,
+                    token_str=user_token,
+                    token_info=token_info,
+                    auth_api=auth_api,
+                )
+                ser_response_exp = news_container.expander(
+                    LanguageTranslator.translate(
+                        code_name="news_stream_admin_serv_resp_exp"
+                    )
+                )
+                if "response" in response:
+                    response = response["response"]
+                ser_response_exp.write(response)
+                continue
+
+        if news_container is None:
+            news_container = st.container(border=True)
+
+        # news_container.write(
+        #     f"Info: `3c:`{ico_to_write_p_3c} `pli:`{ico_to_write_pli}"
+        # )
+
+        news_container.write(f"Info: `3c:`{record.polarity_icon}")
+
+        news_container.write(record.user_news_text)
+
+        news_expander = news_container.expander(
+            LanguageTranslator.translate(code_name="news_stream_news_info_exp")
+        )
+
+        if admin_news_id is not None:
+            news_expander.write(
+                LanguageTranslator.format(
+                    code_name="news_stream_news_info_id", admin_news_id=admin_news_id
+                )
+            )
+            news_expander.write(
+                LanguageTranslator.format(
+                    code_name="news_stream_news_sim_to_orig",
+                    sim_to_original_article=record.sim_to_original_article,
+                )
+            )
+            news_expander.write(
+                LanguageTranslator.format(
+                    code_name="news_stream_news_gen_count",
+                    num_of_generated_news=record.num_of_generated_news,
+                )
+            )
+        news_expander.write(
+            LanguageTranslator.format(
+                code_name="news_stream_news_lang_generated",
+                news_language_ico=record.news_language_icon,
+            )
+        )
+        news_expander.write(
+            LanguageTranslator.format(
+                code_name="news_stream_news_lang_orig",
+                main_page_language_ico=record.main_page_language_icon,
+            )
+        )
+        news_expander.write(
+            LanguageTranslator.translate(code_name="news_stream_news_orig_link")
+            + " "
+            + record.news_url
+        )
+        news_expander.write(
+            LanguageTranslator.translate(code_name="news_stream_news_gen_at_date")
+            + " "
+            + record.when_generated
+        )
+        news_expander.write(
+            LanguageTranslator.translate(code_name="news_stream_news_used_gen_model")
+            + " "
+            + record.model_name
+        )
+        news_expander.write(
+            LanguageTranslator.translate(code_name="news_stream_news_gen_time")
+            + " "
+            + record.generation_time
+        )
+
+        if record.full_news_text is not None:
+            full_news_text = news_container.expander(
+                LanguageTranslator.translate(
+                    code_name="news_stream_news_full_article"
+                )
+            )
+            full_news_text.write(record.full_news_text)
+
+
+class NewsStreamMockQuestions:
+    PREDEFINED_QUESTION_1 = {
+        "pl": "Wypadki i zdarzenia na drogach w Polsce",
+        "en": "",
+    }
+    PREDEFINED_QUESTION_2 = {"pl": "Aktualna pogoda w Polsce", "en": ""}
+    PREDEFINED_QUESTION_3 = {"pl": "Zmiany zasad w polskim prawie", "en": ""}
+    PREDEFINED_QUESTION_4 = {"pl": "Informacje o kryptowalutach", "en": ""}
+    PREDEFINED_QUESTION_5 = {
+        "pl": "Drony i zagrożenie przestrzeni powietrznej",
+        "en": "",
+    }
+    PREDEFINED_QUESTION_6 = {
+        "pl": "Rozwój sztucznej inteligencji i technologii",
+        "en": "",
+    }
+    PREDEFINED_QUESTION_7 = {"pl": "Informacje dla emerytów i rencistów", "en": ""}
+    PREDEFINED_QUESTION_8 = {
+        "pl": "Wydarzenia sportowe, wyniki, rozgrywki",
+        "en": "",
+    }
+    PREDEFINED_QUESTION_9 = {"pl": "Życie polskich gwiazd telewizyjnych", "en": ""}
+    PREDEFINED_QUESTION_10 = {"pl": "Informacje ze świata kosmosu", "en": ""}
+    PREDEFINED_QUESTION_11 = {"pl": "Ministerstwo Edukacji i szkolnictwo", "en": ""}
+    PREDEFINED_QUESTION_12 = {
+        "pl": "Informacje związane z polityką Polską",
+        "en": "",
+    }
+    # PREDEFINED_QUESTION_13 = {"pl": "Międzynarodowe układy polityczne", "en": ""}
+
+    PREDEFINED_QUESTIONS = [
+        # PREDEFINED_QUESTION_10,
+        PREDEFINED_QUESTION_4,
+        PREDEFINED_QUESTION_2,
+        PREDEFINED_QUESTION_3,
+        PREDEFINED_QUESTION_7,
+        PREDEFINED_QUESTION_9,
+        PREDEFINED_QUESTION_12,
+        PREDEFINED_QUESTION_8,
+        PREDEFINED_QUESTION_6,
+        PREDEFINED_QUESTION_11,
+        PREDEFINED_QUESTION_1,
+        PREDEFINED_QUESTION_5,
+        # PREDEFINED_QUESTION_13,
+    ]
+
+
+def prepare_news_stream_public_news_tab(
+    categories,
+    news_in_categories,
+    sort_date_by: str,
+    number_of_news: int,
+    user_token: str | None = None,
+    token_info: dict | None = None,
+    publ_news_api: PublicNewsStreamAPI | None = None,
+    auth_api: PlaygroundAuthenticationAPI | None = None,
+    admin_opts: dict | None = None,
+    filter_pages: dict | None = None,
+    page_size: int | None = None,
+    fetch_news=None,
+):
+    """
+
+    :param categories:
+    :param news_in_categories: news of the categories, may be ``None`` when
+    ``fetch_news`` is given
+    :param sort_date_by:
+    :param number_of_news:
+    :param user_token:
+    :param token_info:
+    :param publ_news_api:
+    :param auth_api:
+    :param admin_opts:
+    :param filter_pages:
+    :param page_size: number of news rendered at once in a category, the next
+    ones are rendered after clicking "show more" (all news when not given)
+    :param fetch_news: ``fetch_news(filter_pages) -> news_in_categories``,
+    when given only the category chosen in the category control is rendered
+    and only its news are fetched (``filter_pages`` restricted to it),
+    otherwise all categories are rendered in tabs. The search always covers
+    all selected categories, its results are rendered in tabs
+    :return:
+    """
+    phr_search_inp_tab = st.container()
+
+    last_days = 3
+    language = SessionConfig.get_session_ui_language() or DEFAULT_LANGUAGE
+    predefined_questions = [
+        q[language] if q[language] else q[DEFAULT_LANGUAGE]
+        for q in NewsStreamMockQuestions.PREDEFINED_QUESTIONS
+    ]
+
+    num_hours = last_days * 24
+
+    phrase_to_search = phr_search_inp_tab.selectbox(
+        "Your question",
+        options=predefined_questions,
+        label_visibility="hidden",
+        index=None,
+        placeholder=LanguageTranslator.format(
+            code_name="stream_search_phrase", num_hours=num_hours
+        ),
+        accept_new_options=True,
+    )
+
+    c_names = [c for c in categories.keys()]
+    # The search is not limited to the active category
+    searching = bool(phrase_to_search and publ_news_api)
+    only_active_category = fetch_news is not None and not searching
+    if only_active_category:
+        active_category = select_active_news_category(categories=categories)
+        if active_category is None:
+            return
+        c_names = [active_category]
+        filter_pages = {
+            c: pages for c, pages in (filter_pages or {}).items() if c in c_names
+        }
+
+    if searching:
+        if len(phrase_to_search.strip()) < MIN_STREAM_QUERY_LEN:
+            st.warning(
+                LanguageTranslator.format(
+                    code_name="stream_search_to_short_phrase",
+                    MIN_STREAM_QUERY_LEN=MIN_STREAM_QUERY_LEN,
+                ),
+            )
+            return
+        phr_search_inp_tab.write(f"#### {phrase_to_search}")
+
+        with st.spinner(
+            LanguageTranslator.translate(code_name="stream_searching"),
+            show_time=True,
+        ):
+            search_n_in_cat = publ_news_api.search_news_in_categories(
+                text_to_search=phrase_to_search,
+                filter_pages=filter_pages,
+                num_of_results=number_of_news,
+                last_days=last_days,
+            )
+            news_in_categories = search_n_in_cat.get("search_result")
+
+        if not news_in_categories or type(news_in_categories) not in [dict]:
+            st.info(
+                LanguageTranslator.translate(code_name="stream_searching_problem")
+            )
+            return
+    elif fetch_news is not None:
+        news_in_categories = fetch_news(filter_pages)
+
+    if not news_in_categories:
+        return
+    # print(json.dumps(news_in_categories, indent=2, ensure_ascii=False))
+
+    if only_active_category:
+        # Only the active category is rendered, no tabs
+        _add_category_news_to_stream(
+            c_name=c_names[0],
+            news_in_categories=news_in_categories,
+            sort_date_by=sort_date_by,
+            number_of_news=number_of_news,
+            page_size=page_size,
+            user_token=user_token,
+            token_info=token_info,
+            publ_news_api=publ_news_api,
+            auth_api=auth_api,
+            admin_opts=admin_opts,
+        )
+        return
+
+    c_names_display = [
+        categories[c]["category_info"]["display_name"] for c in categories.keys()
+    ]
+    news_tabs = st.tabs(c_names_display)
+    for idx, c_name in enumerate(c_names):
+        with news_tabs[idx]:
+            # st.subheader(categories[c_name]["category_info"]["description"])
+            _add_category_news_to_stream(
+                c_name=c_name,
+                news_in_categories=news_in_categories,
+                sort_date_by=sort_date_by,
+                number_of_news=number_of_news,
+                page_size=page_size,
+                user_token=user_token,
+                token_info=token_info,
+                publ_news_api=publ_news_api,
+                auth_api=auth_api,
+                admin_opts=admin_opts,
+            )
+
+
+def select_active_news_category(categories) -> str | None:
+    """
+    Category control of the news stream, the chosen category is kept
+    in the session (the first category by default).
+    """
+    c_names = [c for c in categories.keys()]
+    if not len(c_names):
+        return None
+
+    active_category = SessionConfig.get_session_news_stream_category()
+    if active_category not in c_names:
+        active_category = c_names[0]
+
+    selected_category = st.segmented_control(
+        LanguageTranslator.translate(code_name="news_stream_category"),
+        options=c_names,
+        format_func=lambda c: categories[c]["category_info"]["display_name"],
+        default=active_category,
+        label_visibility="collapsed",
+    )
+    # Clicking the selected category deselects it, it stays active
+    if selected_category is not None:
+        active_category = selected_category
+    SessionConfig.set_session_news_stream_category(active_category)
+    return active_category
+
+
+def _add_category_news_to_stream(
+    c_name: str,
+    news_in_categories: dict,
+    sort_date_by: str,
+    number_of_news: int,
+    page_size: int | None,
+    user_token: str | None,
+    token_info: dict | None,
+    publ_news_api: PublicNewsStreamAPI | None,
+    auth_api: PlaygroundAuthenticationAPI | None,
+    admin_opts: dict | None,
+):
+    if c_name not in news_in_categories:
+        return
+    # Newest number_of_news news (by when_generated), the oldest first if chosen
+    news_in_cat = newest_news(
+        news_in_categories[c_name],
+        number_of_news=number_of_news,
+        oldest_first="najstarsze" in sort_date_by.lower(),
+    )
+
+    # Only the shown news are turned into elements
+    shown_count = len(news_in_cat)
+    if page_size:
+        shown_count = min(
+            shown_count,
+            SessionConfig.get_session_news_stream_shown(c_name) or page_size,
+        )
+
+    add_news_to_public_news_stream(
+        news_in_cat[:shown_count],
+        user_token=user_token,
+        token_info=token_info,
+        publ_news_api=publ_news_api,
+        auth_api=auth_api,
+        admin_opts=admin_opts,
+    )
+
+    if shown_count < len(news_in_cat):
+        st.button(
+            LanguageTranslator.format(
+                code_name="news_stream_show_more",
+                shown_count=shown_count,
+                all_count=len(news_in_cat),
+            ),
+            key=f"news_stream_show_more_{c_name}",
+            on_click=SessionConfig.set_session_news_stream_shown,
+            args=(c_name, shown_count + page_size),
+            width="stretch",
+        )
@@ -0,0 +1,240 @@
+"""
+Warm-up of a freshly started instance, so the first visitors do not pay for
+the whole cold path:
+
+  1. translations: the per-language catalogs are validated (and compiled
+     when stale) and the default language is loaded,
+  2. API configuration: ``ui-configuration.json`` is parsed,
+  3. connection pools: a keep-alive connection to every module host
+     is opened in :class:`HttpSessionPool`,
+  4. public payloads: the payloads shared by all sessions (categories,
+     conversation models, last statistics) are fetched into
+     :class:`ResponseCache`.
+
+The pools and the response cache live in the memory of the Streamlit server
+process, therefore ``app.py`` calls :meth:`ServerWarmup.start_once` which
+runs the warm-up once per process, in a background thread. ``run.sh`` runs
+it before the server starts:
+
+    python -m src.warmup [--prefetch]
+
+which compiles the translation catalogs on disk and checks the configuration
+and the backend hosts (the timings show a slow or unreachable module before
+the instance gets traffic).
+"""
+
+import time
+import argparse
+import threading
+
+from src.api_config import ApiJsonConfiguration
+from src.api_connection import HttpSessionPool
+from src.language_catalog import LanguageCatalog
+from src.constants import (
+    DEFAULT_LANGUAGE,
+    DEFAULT_UI_CONFIG_PATH,
+    UI_LANG_DEFAULT_DEFINITION_FILE,
+)
+
+
+class ServerWarmup:
+    # Settings of the public statistics (as on the statistics page)
+    PUBLIC_STATS_SETTINGS_ID = 1
+
+    CONNECT_TIMEOUT = 3.05
+
+    _lock = threading.Lock()
+    _started = False
+    _report = None
+
+    @classmethod
+    def start_once(cls, config_path: str = DEFAULT_UI_CONFIG_PATH) -> bool:
+        """
+        Start the warm-up in a background thread, once per process.
+        Returns ``True`` when this call started it.
+        """
+        with cls._lock:
+            if cls._started:
+                return False
+            cls._started = True
+
+        threading.Thread(
+            target=cls.run,
+            kwargs={"config_path": config_path, "prefetch": True},
+            name="server-warmup",
+            daemon=True,
+        ).start()
+        return True
+
+    @classmethod
+    def run(
+        cls,
+        config_path: str = DEFAULT_UI_CONFIG_PATH,
+        xlsx_path: str = UI_LANG_DEFAULT_DEFINITION_FILE,
+        prefetch: bool = True,
+    ) -> list:
+        """
+        Run all warm-up steps and return the report, a list of
+        ``{"step": str, "seconds": float, "ok": bool, "error": str | None}``.
+        A failed step is reported and the next steps are run anyway.
+        """
+        report = []
+        cls._run_step(
+            report, "translations", lambda: cls._load_translations(xlsx_path)
+        )
+        api_config = cls._run_step(
+            report,
+            "api_configuration",
+            lambda: ApiJsonConfiguration.shared(config_path),
+        )
+        if api_config is not None:
+            cls._run_step(
+                report, "connection_pools", lambda: cls._open_connections(api_config)
+            )
+            # With unreachable hosts the prefetch would only open
+            # the circuit breakers before the first visitor comes
+            if prefetch and report[-1]["ok"]:
+                for step_name, step_func in cls._prefetch_steps(config_path):
+                    cls._run_step(report, step_name, step_func)
+
+        with cls._lock:
+            cls._report = report
+        print(cls.format_report(report), flush=True)
+        return report
+
+    @classmethod
+    def report(cls) -> list | None:
+        """
+        Report of the last warm-up run in this process (``None`` when the
+        warm-up has not finished yet).
+        """
+        with cls._lock:
+            return cls._report
+
+    @staticmethod
+    def format_report(report: list) -> str:
+        lines = [f"Warm-up: {sum(_s['seconds'] for _s in report):.3f} s"]
+        for step in report:
+            status = "ok" if step["ok"] else f"FAILED ({step['error']})"
+            lines.append(f"  {step['step']:<32} {step['seconds']:8.3f} s  {status}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _run_step(report: list, step_name: str, step_func):
+        started_at = time.perf_counter()
+        result, error = None, None
+        try:
+            result = step_func()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        report.append(
+            {
+                "step": step_name,
+                "seconds": round(time.perf_counter() - started_at, 4),
+                "ok": error is None,
+                "error": error,
+            }
+        )
+        return result
+
+    @staticmethod
+    def _load_translations(xlsx_path: str) -> None:
+        from src.language import LanguageTranslator, _LanguageDefinitions
+
+        for language in _LanguageDefinitions.LANGUAGES.keys():
+            LanguageCatalog.load(
+                xlsx_path=xlsx_path,
+                language=language,
+                languages=list(_LanguageDefinitions.LANGUAGES.keys()),
+                code_name_column=_LanguageDefinitions.CODE_NAME_COLUMN,
+            )
+        LanguageTranslator.lang_def.table_for_language(DEFAULT_LANGUAGE)
+
+    @classmethod
+    def _open_connections(cls, api_config: ApiJsonConfiguration) -> None:
+        HttpSessionPool.configure(**api_config.http_pool_config)
+        hosts = {
+            HttpSessionPool.host_key(_h)
+            for _h in [
+                api_config.free_chat_conversation_host,
+                api_config.free_news_stream_host,
+                api_config.free_news_creator_host,
+                api_config.free_news_browser_host,
+                api_config.auth_host,
+                api_config.admin_host,
+            ]
+            if _h
+        }
+        unreachable = []
+        for host in sorted(hosts):
+            # Any answer (also 404) leaves an open keep-alive connection
+            try:
+                HttpSessionPool.request(
+                    "HEAD",
+                    f"{host}/",
+                    timeout=(cls.CONNECT_TIMEOUT, cls.CONNECT_TIMEOUT),
+                ).close()
+            except Exception:
+                unreachable.append(host)
+        if len(unreachable):
+            raise ConnectionError(f"Cannot connect to {', '.join(unreachable)}")
+
+    @classmethod
+    def _prefetch_steps(cls, config_path: str) -> list:
+        from src.api_public import (
+            PublicNewsStreamAPI,
+            PublicConversationWithModelAPI,
+        )
+
+        news_api = PublicNewsStreamAPI(config_path=config_path)
+        chat_api = PublicConversationWithModelAPI(config_path=config_path)
+        return [
+            (
+                "prefetch_categories",
+                lambda: cls._check_payload(news_api.list_available_categories()),
+            ),
+            (
+                "prefetch_categories_with_pages",
+                lambda: cls._check_payload(
+                    news_api.list_available_categories_with_pages()
+                ),
+            ),
+            (
+                "prefetch_conversation_models",
+                lambda: cls._check_payload(chat_api.list_available_models()),
+            ),
+            (
+                "prefetch_news_statistics",
+                lambda: cls._check_payload(
+                    news_api.get_news_statistics(
+                        settings_id=cls.PUBLIC_STATS_SETTINGS_ID, get_last_stats=True
+                    )
+                ),
+            ),
+        ]
+
+    @staticmethod
+    def _check_payload(payload) -> None:
+        # Unsuccessful responses are not cached, report them as failed steps
+        if type(payload) in [dict] and payload.get("status") is False:
+            raise RuntimeError(str(payload.get("response"))[:200])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm up the instance")
+    parser.add_argument("--config", default=DEFAULT_UI_CONFIG_PATH)
+    parser.add_argument("--xlsx", default=UI_LANG_DEFAULT_DEFINITION_FILE)
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Fetch the shared public payloads too (checks the endpoints)",
+    )
+    args = parser.parse_args(argv)
+
+    ServerWarmup.run(
+        config_path=args.config, xlsx_path=args.xlsx, prefetch=args.prefetch
+    )
+
+
+if __name__ == "__main__":
+    main()